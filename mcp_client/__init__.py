@@ -0,0 +1 @@
+# MCP Client package
\ No newline at end of file
@@ -0,0 +1,178 @@
+"""
+Shared manifest and schema helpers for the Ardour MCP client
+"""
+
+import json
+import os
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used as a fallback
+    orjson = None
+
+try:
+    import fastjsonschema
+except ImportError:  # optional, a hand-compiled validator is used instead
+    fastjsonschema = None
+
+# Resolved once at import rather than on every manifest lookup
+_MANIFEST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mcp_ardour.json")
+
+def load_manifest():
+    """Load the MCP manifest from JSON file"""
+    key = _manifest_key()
+    if key is None:
+        return {
+            "error": "Manifest file not found",
+            "path": _MANIFEST_PATH
+        }
+    
+    # Keyed on mtime so edits to the manifest are picked up without a restart
+    return _load_manifest_cached(*key)
+
+def _manifest_key():
+    """Return the (path, mtime) cache key for the manifest, or None if missing"""
+    try:
+        return _MANIFEST_PATH, os.stat(_MANIFEST_PATH).st_mtime
+    except FileNotFoundError:
+        return None
+
+def _get_tool_index():
+    """Return the name -> tool index for the current manifest"""
+    key = _manifest_key()
+    return _build_tool_index(*key) if key else {}
+
+def _get_validators():
+    """Return the name -> compiled input validator map for the current manifest"""
+    key = _manifest_key()
+    return _build_validators(*key) if key else {}
+
+@lru_cache(maxsize=1)
+def _load_manifest_cached(manifest_path: str, mtime: float):
+    """Read and parse the manifest; cached until its mtime changes"""
+    try:
+        with open(manifest_path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    except FileNotFoundError:
+        return {
+            "error": "Manifest file not found",
+            "path": manifest_path
+        }
+    except ValueError as e:
+        return {
+            "error": "Invalid JSON in manifest",
+            "details": str(e)
+        }
+
+@lru_cache(maxsize=1)
+def _build_tool_index(manifest_path: str, mtime: float):
+    """Index the manifest tools by name; cached alongside the manifest"""
+    manifest = _load_manifest_cached(manifest_path, mtime)
+    return {tool["name"]: tool for tool in manifest.get("tools", [])}
+
+# JSON schema type -> (predicate, description); bool is excluded from the
+# numeric types because it subclasses int in Python
+_TYPE_CHECK = {
+    "integer": (lambda v: isinstance(v, int) and not isinstance(v, bool), "an integer"),
+    "number": (lambda v: isinstance(v, (int, float)) and not isinstance(v, bool), "a number"),
+    "boolean": (lambda v: isinstance(v, bool), "a boolean"),
+    "string": (lambda v: isinstance(v, str), "a string"),
+}
+
+def _compile_validator(schema):
+    """Compile a tool input schema into a callable returning an error or None"""
+    if fastjsonschema is not None:
+        try:
+            compiled = fastjsonschema.compile(schema)
+        except fastjsonschema.JsonSchemaDefinitionException:
+            compiled = None
+        
+        if compiled is not None:
+            def validate(input_data):
+                try:
+                    compiled(input_data)
+                except fastjsonschema.JsonSchemaException as e:
+                    return e.message
+                return None
+            
+            return validate
+    
+    # Fallback: resolve the schema lookups once and keep a tight loop per call
+    required = tuple(schema.get("required", []))
+    field_checks = {
+        field: _TYPE_CHECK[prop.get("type")]
+        for field, prop in schema.get("properties", {}).items()
+        if prop.get("type") in _TYPE_CHECK
+    }
+    
+    def validate(input_data):
+        for field in required:
+            if field not in input_data:
+                return f"Missing required field: {field}"
+        
+        if not field_checks:
+            return None
+        
+        for field, value in input_data.items():
+            check = field_checks.get(field)
+            if check is not None and not check[0](value):
+                return f"Field '{field}' must be {check[1]}"
+        
+        return None
+    
+    return validate
+
+@lru_cache(maxsize=1)
+def _build_validators(manifest_path: str, mtime: float):
+    """Compile an input validator per tool; cached alongside the manifest"""
+    return {
+        name: _compile_validator(tool.get("inputSchema", {}))
+        for name, tool in _build_tool_index(manifest_path, mtime).items()
+    }
+
+def get_tool_info(tool_name):
+    """Get information about a specific tool"""
+    manifest = load_manifest()
+    
+    if "error" in manifest:
+        return manifest
+    
+    tool = _get_tool_index().get(tool_name)
+    if tool is None:
+        return {"error": f"Tool '{tool_name}' not found"}
+    
+    return tool
+
+def list_tools():
+    """List all available tools"""
+    manifest = load_manifest()
+    
+    if "error" in manifest:
+        return manifest
+    
+    tools = []
+    for tool in manifest.get("tools", []):
+        tools.append({
+            "name": tool["name"],
+            "description": tool["description"]
+        })
+    
+    return {"tools": tools}
+
+def validate_tool_input(tool_name, input_data):
+    """Validate input data against tool schema"""
+    tool_info = get_tool_info(tool_name)
+    
+    if "error" in tool_info:
+        return tool_info
+    
+    error = _get_validators()[tool_name](input_data)
+    if error:
+        return {
+            "error": error,
+            "tool": tool_name
+        }
+    
+    return {"valid": True}
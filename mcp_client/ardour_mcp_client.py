@@ -3,174 +3,257 @@
 Ardour MCP Client - Full MCP protocol implementation for Cursor integration
 """
 
-import argparse
 import json
+import re
 import sys
-import os
-import requests
-from pathlib import Path
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 
+try:
+    from ._core import load_manifest, get_tool_info, list_tools, validate_tool_input
+    from .http_session import get_session
+except ImportError:  # run as a script: python mcp_client/ardour_mcp_client.py
+    from _core import load_manifest, get_tool_info, list_tools, validate_tool_input
+    from http_session import get_session
+
+try:
+    import orjson
+except ImportError:  # optional, stdlib json is used as a fallback
+    orjson = None
+
 # MCP Server configuration
 MCP_SERVER_URL = "http://localhost:8000"
 
-def load_manifest():
-    """Load the MCP manifest from JSON file"""
-    manifest_path = Path(__file__).parent / "mcp_ardour.json"
+# JSON codec for the stdio loop, resolved once at import so each message goes
+# straight to the C implementation when orjson is installed
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
     
-    try:
-        with open(manifest_path, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {
-            "error": "Manifest file not found",
-            "path": str(manifest_path)
-        }
-    except json.JSONDecodeError as e:
-        return {
-            "error": "Invalid JSON in manifest",
-            "details": str(e)
-        }
+    def _json_dumps(obj) -> bytes:
+        """Serialize to compact JSON bytes"""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+def _emit(obj, pretty: bool = False):
+    """Print a CLI result as JSON; compact unless pretty output was requested"""
+    if not pretty:
+        data = _json_dumps(obj)
+    elif orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode("utf-8")
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.buffer.flush()
+
+def _write_message(message):
+    """Write one JSON-RPC message line (object or pre-encoded bytes) to stdout"""
+    if not isinstance(message, bytes):
+        message = _json_dumps(message)
+    sys.stdout.buffer.write(message + b"\n")
+    sys.stdout.buffer.flush()
+
+def _tool_result_message(request_id, result) -> bytes:
+    """Encode a tools/call success response around the serialized result.
+
+    The result is serialized exactly once; the envelope is spliced around it
+    rather than re-walking the payload as part of a larger response dict.
+    """
+    text = _json_dumps(_json_dumps(result).decode("utf-8"))
+    return (
+        b'{"jsonrpc":"2.0","id":' + _json_dumps(request_id)
+        + b',"result":{"content":[{"type":"text","text":' + text + b'}]}}'
+    )
+
+# Map tool names to API endpoints - using the ardour_ prefixed names
+_ENDPOINT_MAP = {
+    # Transport controls
+    "ardour_transport_play": ("POST", "/transport/play"),
+    "ardour_transport_stop": ("POST", "/transport/stop"),
+    "ardour_transport_rewind": ("POST", "/transport/rewind"),
+    "ardour_transport_fast_forward": ("POST", "/transport/fast-forward"),
+    "ardour_transport_goto_start": ("POST", "/transport/goto-start"),
+    "ardour_transport_goto_end": ("POST", "/transport/goto-end"),
+    "ardour_transport_toggle_roll": ("POST", "/transport/toggle-roll"),
+    "ardour_transport_toggle_loop": ("POST", "/transport/toggle-loop"),
+    "ardour_transport_set_speed": ("POST", "/transport/speed"),
+    "ardour_transport_add_marker": ("POST", "/transport/add-marker"),
+    "ardour_transport_next_marker": ("POST", "/transport/next-marker"),
+    "ardour_transport_prev_marker": ("POST", "/transport/prev-marker"),
+
+    # Track controls
+    "ardour_track_set_fader": ("POST", "/track/{track_number}/fader"),
+    "ardour_track_set_mute": ("POST", "/track/{track_number}/mute"),
+    "ardour_track_set_solo": ("POST", "/track/{track_number}/solo"),
+    "ardour_track_set_name": ("POST", "/track/{track_number}/name"),
+    "ardour_track_set_record_enable": ("POST", "/track/{track_number}/record-enable"),
+    "ardour_track_set_record_safe": ("POST", "/track/{track_number}/record-safe"),
+    "ardour_track_set_pan": ("POST", "/track/{track_number}/pan"),
+    "ardour_track_list": ("GET", "/track/list"),
+
+    # Session controls
+    "ardour_session_open_add_track_dialog": ("POST", "/session/add-track-dialog"),
+    "ardour_session_save": ("POST", "/session/save"),
+    "ardour_session_save_as": ("POST", "/session/save-as"),
+    "ardour_session_create_snapshot": ("POST", "/session/snapshot"),
+    "ardour_session_undo": ("POST", "/session/undo"),
+    "ardour_session_redo": ("POST", "/session/redo"),
+
+    # Selection controls (the working features)
+    "ardour_select_strip": ("POST", "/selection/strip/select"),
+    "ardour_expand_strip": ("POST", "/selection/strip/expand"),
+    "ardour_set_expansion_mode": ("POST", "/selection/expand"),
+    "ardour_hide_strip": ("POST", "/selection/hide"),
+    "ardour_set_strip_name": ("POST", "/selection/name"),
+    "ardour_set_strip_comment": ("POST", "/selection/comment"),
+    "ardour_set_strip_group": ("POST", "/selection/group"),
+    "ardour_set_group_enable": ("POST", "/selection/group/enable"),
+    "ardour_set_group_gain": ("POST", "/selection/group/gain"),
+    "ardour_set_group_relative": ("POST", "/selection/group/relative"),
+    "ardour_set_group_mute": ("POST", "/selection/group/mute"),
+    "ardour_set_group_solo": ("POST", "/selection/group/solo"),
+    "ardour_set_group_recenable": ("POST", "/selection/group/recenable"),
+    "ardour_set_group_select": ("POST", "/selection/group/select"),
+    "ardour_set_group_active": ("POST", "/selection/group/active"),
+    "ardour_set_group_color": ("POST", "/selection/group/color"),
+    "ardour_set_group_monitoring": ("POST", "/selection/group/monitoring"),
+
+    # Selected strip controls
+    "ardour_set_recenable": ("POST", "/selection/recenable"),
+    "ardour_set_record_safe": ("POST", "/selection/record_safe"),
+    "ardour_set_mute": ("POST", "/selection/mute"),
+    "ardour_set_solo": ("POST", "/selection/solo"),
+    "ardour_set_solo_iso": ("POST", "/selection/solo_iso"),
+    "ardour_set_solo_safe": ("POST", "/selection/solo_safe"),
+    "ardour_set_monitor_input": ("POST", "/selection/monitor_input"),
+    "ardour_set_monitor_disk": ("POST", "/selection/monitor_disk"),
+    "ardour_set_polarity": ("POST", "/selection/polarity"),
+    "ardour_set_gain": ("POST", "/selection/gain"),
+    "ardour_set_fader": ("POST", "/selection/fader"),
+    "ardour_set_db_delta": ("POST", "/selection/db_delta"),
+    "ardour_set_trim": ("POST", "/selection/trim"),
+
+    # Pan controls
+    "ardour_set_pan_stereo_position": ("POST", "/selection/pan_stereo_position"),
+    "ardour_set_pan_stereo_width": ("POST", "/selection/pan_stereo_width"),
+    "ardour_set_pan_elevation_position": ("POST", "/selection/pan_elevation_position"),
+    "ardour_set_pan_frontback_position": ("POST", "/selection/pan_frontback_position"),
+    "ardour_set_pan_lfe_control": ("POST", "/selection/pan_lfe_control"),
+
+    # Send controls
+    "ardour_set_send_gain": ("POST", "/selection/send_gain"),
+    "ardour_set_send_fader": ("POST", "/selection/send_fader"),
+    "ardour_set_send_enable": ("POST", "/selection/send_enable"),
+
+    # Plugin controls
+    "ardour_select_plugin": ("POST", "/selection/plugin"),
+    "ardour_set_plugin_page": ("POST", "/selection/plugin_page"),
+    "ardour_set_plugin_activate": ("POST", "/selection/plugin/activate"),
+    "ardour_set_plugin_parameter": ("POST", "/selection/plugin/parameter"),
+
+    # VCA controls
+    "ardour_set_vca": ("POST", "/selection/vca"),
+    "ardour_toggle_vca": ("POST", "/selection/vca/toggle"),
+    "ardour_spill_strips": ("POST", "/selection/spill"),
+
+    # Automation and touch
+    "ardour_set_automation": ("POST", "/selection/automation/{control_name}"),
+    "ardour_set_touch": ("POST", "/selection/touch/{control_name}"),
+
+    # Utility
+    "ardour_get_current_selection": ("GET", "/selection/current"),
+    "ardour_clear_selection": ("DELETE", "/selection/clear"),
+}
+
+# Tool names reported back when an unknown tool is requested
+_AVAILABLE_TOOLS = tuple(_ENDPOINT_MAP)
+
+# Path parameter names per tool, only for endpoints that have any
+_PATH_PARAM_TOOLS = {
+    name: tuple(re.findall(r"\{(\w+)\}", endpoint))
+    for name, (_, endpoint) in _ENDPOINT_MAP.items()
+    if "{" in endpoint
+}
+
+# Idempotent read tools whose results may be reused for a few seconds (TTL in s)
+_READONLY_TOOLS = {
+    "ardour_track_list": 2.0,
+    "ardour_get_current_selection": 1.0,
+}
+
+# url -> (timestamp, result); bounded LRU, cleared by any state-changing call
+_READ_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_READ_CACHE_SIZE = 64
+_READ_CACHE_LOCK = threading.Lock()
+
+# Worker threads used to run the tool calls of a JSON-RPC batch concurrently
+_BATCH_WORKERS = 8
 
 def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
     """Execute a tool by calling the MCP server API"""
+    import requests  # deferred, see http_session.get_session
+    
     try:
-        # Map tool names to API endpoints - using the ardour_ prefixed names
-        endpoint_map = {
-            # Transport controls
-            "ardour_transport_play": ("POST", "/transport/play"),
-            "ardour_transport_stop": ("POST", "/transport/stop"),
-            "ardour_transport_rewind": ("POST", "/transport/rewind"),
-            "ardour_transport_fast_forward": ("POST", "/transport/fast-forward"),
-            "ardour_transport_goto_start": ("POST", "/transport/goto-start"),
-            "ardour_transport_goto_end": ("POST", "/transport/goto-end"),
-            "ardour_transport_toggle_roll": ("POST", "/transport/toggle-roll"),
-            "ardour_transport_toggle_loop": ("POST", "/transport/toggle-loop"),
-            "ardour_transport_set_speed": ("POST", "/transport/speed"),
-            "ardour_transport_add_marker": ("POST", "/transport/add-marker"),
-            "ardour_transport_next_marker": ("POST", "/transport/next-marker"),
-            "ardour_transport_prev_marker": ("POST", "/transport/prev-marker"),
-            
-            # Track controls
-            "ardour_track_set_fader": ("POST", "/track/{track_number}/fader"),
-            "ardour_track_set_mute": ("POST", "/track/{track_number}/mute"),
-            "ardour_track_set_solo": ("POST", "/track/{track_number}/solo"),
-            "ardour_track_set_name": ("POST", "/track/{track_number}/name"),
-            "ardour_track_set_record_enable": ("POST", "/track/{track_number}/record-enable"),
-            "ardour_track_set_record_safe": ("POST", "/track/{track_number}/record-safe"),
-            "ardour_track_set_pan": ("POST", "/track/{track_number}/pan"),
-            "ardour_track_list": ("GET", "/track/list"),
-            
-            # Session controls
-            "ardour_session_open_add_track_dialog": ("POST", "/session/add-track-dialog"),
-            "ardour_session_save": ("POST", "/session/save"),
-            "ardour_session_save_as": ("POST", "/session/save-as"),
-            "ardour_session_create_snapshot": ("POST", "/session/snapshot"),
-            "ardour_session_undo": ("POST", "/session/undo"),
-            "ardour_session_redo": ("POST", "/session/redo"),
-            
-            # Selection controls (the working features)
-            "ardour_select_strip": ("POST", "/selection/strip/select"),
-            "ardour_expand_strip": ("POST", "/selection/strip/expand"),
-            "ardour_set_expansion_mode": ("POST", "/selection/expand"),
-            "ardour_hide_strip": ("POST", "/selection/hide"),
-            "ardour_set_strip_name": ("POST", "/selection/name"),
-            "ardour_set_strip_comment": ("POST", "/selection/comment"),
-            "ardour_set_strip_group": ("POST", "/selection/group"),
-            "ardour_set_group_enable": ("POST", "/selection/group/enable"),
-            "ardour_set_group_gain": ("POST", "/selection/group/gain"),
-            "ardour_set_group_relative": ("POST", "/selection/group/relative"),
-            "ardour_set_group_mute": ("POST", "/selection/group/mute"),
-            "ardour_set_group_solo": ("POST", "/selection/group/solo"),
-            "ardour_set_group_recenable": ("POST", "/selection/group/recenable"),
-            "ardour_set_group_select": ("POST", "/selection/group/select"),
-            "ardour_set_group_active": ("POST", "/selection/group/active"),
-            "ardour_set_group_color": ("POST", "/selection/group/color"),
-            "ardour_set_group_monitoring": ("POST", "/selection/group/monitoring"),
-            
-            # Selected strip controls
-            "ardour_set_recenable": ("POST", "/selection/recenable"),
-            "ardour_set_record_safe": ("POST", "/selection/record_safe"),
-            "ardour_set_mute": ("POST", "/selection/mute"),
-            "ardour_set_solo": ("POST", "/selection/solo"),
-            "ardour_set_solo_iso": ("POST", "/selection/solo_iso"),
-            "ardour_set_solo_safe": ("POST", "/selection/solo_safe"),
-            "ardour_set_monitor_input": ("POST", "/selection/monitor_input"),
-            "ardour_set_monitor_disk": ("POST", "/selection/monitor_disk"),
-            "ardour_set_polarity": ("POST", "/selection/polarity"),
-            "ardour_set_gain": ("POST", "/selection/gain"),
-            "ardour_set_fader": ("POST", "/selection/fader"),
-            "ardour_set_db_delta": ("POST", "/selection/db_delta"),
-            "ardour_set_trim": ("POST", "/selection/trim"),
-            
-            # Pan controls
-            "ardour_set_pan_stereo_position": ("POST", "/selection/pan_stereo_position"),
-            "ardour_set_pan_stereo_width": ("POST", "/selection/pan_stereo_width"),
-            "ardour_set_pan_elevation_position": ("POST", "/selection/pan_elevation_position"),
-            "ardour_set_pan_frontback_position": ("POST", "/selection/pan_frontback_position"),
-            "ardour_set_pan_lfe_control": ("POST", "/selection/pan_lfe_control"),
-            
-            # Send controls
-            "ardour_set_send_gain": ("POST", "/selection/send_gain"),
-            "ardour_set_send_fader": ("POST", "/selection/send_fader"),
-            "ardour_set_send_enable": ("POST", "/selection/send_enable"),
-            
-            # Plugin controls
-            "ardour_select_plugin": ("POST", "/selection/plugin"),
-            "ardour_set_plugin_page": ("POST", "/selection/plugin_page"),
-            "ardour_set_plugin_activate": ("POST", "/selection/plugin/activate"),
-            "ardour_set_plugin_parameter": ("POST", "/selection/plugin/parameter"),
-            
-            # VCA controls
-            "ardour_set_vca": ("POST", "/selection/vca"),
-            "ardour_toggle_vca": ("POST", "/selection/vca/toggle"),
-            "ardour_spill_strips": ("POST", "/selection/spill"),
-            
-            # Automation and touch
-            "ardour_set_automation": ("POST", "/selection/automation/{control_name}"),
-            "ardour_set_touch": ("POST", "/selection/touch/{control_name}"),
-            
-            # Utility
-            "ardour_get_current_selection": ("GET", "/selection/current"),
-            "ardour_clear_selection": ("DELETE", "/selection/clear"),
-        }
-        
-        if tool_name not in endpoint_map:
+        entry = _ENDPOINT_MAP.get(tool_name)
+        if entry is None:
             return {
                 "error": f"Tool '{tool_name}' not found",
-                "available_tools": list(endpoint_map.keys())
+                "available_tools": list(_AVAILABLE_TOOLS)
             }
         
-        method, endpoint = endpoint_map[tool_name]
-        url = f"{MCP_SERVER_URL}{endpoint}"
+        method, endpoint = entry
         
         # Handle path parameters
-        if "{track_number}" in endpoint:
-            track_number = arguments.get("track_number")
-            if track_number is None:
-                return {"error": "track_number is required for this tool"}
-            url = url.replace("{track_number}", str(track_number))
+        path_params = _PATH_PARAM_TOOLS.get(tool_name)
+        if path_params:
+            values = {}
+            for param in path_params:
+                value = arguments.get(param)
+                if value is None:
+                    return {"error": f"{param} is required for this tool"}
+                values[param] = value
+            endpoint = endpoint.format(**values)
         
-        if "{control_name}" in endpoint:
-            control_name = arguments.get("control_name")
-            if control_name is None:
-                return {"error": "control_name is required for this tool"}
-            url = url.replace("{control_name}", control_name)
+        url = f"{MCP_SERVER_URL}{endpoint}"
+        
+        ttl = _READONLY_TOOLS.get(tool_name)
+        with _READ_CACHE_LOCK:
+            if ttl is not None:
+                cached = _READ_CACHE.get(url)
+                if cached is not None and time.monotonic() - cached[0] < ttl:
+                    _READ_CACHE.move_to_end(url)
+                    return cached[1]
+            else:
+                # Anything else may change what the read tools would report
+                _READ_CACHE.clear()
         
         # Make the request
         if method == "GET":
-            response = requests.get(url, timeout=10)
+            response = get_session().get(url, timeout=10)
         elif method == "DELETE":
-            response = requests.delete(url, timeout=10)
+            response = get_session().delete(url, timeout=10)
         else:  # POST
-            response = requests.post(url, json=arguments, timeout=10)
+            response = get_session().post(url, json=arguments, timeout=10)
         
         if response.status_code == 200:
-            return {
+            result = {
                 "success": True,
                 "result": response.json(),
                 "status_code": response.status_code
             }
+            
+            if ttl is not None:
+                with _READ_CACHE_LOCK:
+                    _READ_CACHE[url] = (time.monotonic(), result)
+                    _READ_CACHE.move_to_end(url)
+                    if len(_READ_CACHE) > _READ_CACHE_SIZE:
+                        _READ_CACHE.popitem(last=False)
+            
+            return result
         else:
             return {
                 "success": False,
@@ -192,173 +275,141 @@ def execute_tool(tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
             "detail": str(e)
         }
 
-def print_manifest():
+def print_manifest(pretty: bool = False):
     """Print the JSON manifest to stdout"""
-    manifest = load_manifest()
-    print(json.dumps(manifest, indent=2))
-
-def get_tool_info(tool_name):
-    """Get information about a specific tool"""
-    manifest = load_manifest()
-    
-    if "error" in manifest:
-        return manifest
-    
-    for tool in manifest.get("tools", []):
-        if tool["name"] == tool_name:
-            return tool
-    
-    return {"error": f"Tool '{tool_name}' not found"}
+    _emit(load_manifest(), pretty)
 
-def list_tools():
-    """List all available tools"""
-    manifest = load_manifest()
-    
-    if "error" in manifest:
-        return manifest
-    
-    tools = []
-    for tool in manifest.get("tools", []):
-        tools.append({
-            "name": tool["name"],
-            "description": tool["description"]
-        })
-    
-    return {"tools": tools}
+def _warm_up_connection():
+    """Open a pooled connection to the server ahead of the first tool call"""
+    try:
+        get_session().head(f"{MCP_SERVER_URL}/", timeout=1.0)
+    except Exception:
+        # Best effort only; the first real call reports connection problems
+        pass
 
-def validate_tool_input(tool_name, input_data):
-    """Validate input data against tool schema"""
-    tool_info = get_tool_info(tool_name)
-    
-    if "error" in tool_info:
-        return tool_info
-    
-    schema = tool_info.get("inputSchema", {})
-    properties = schema.get("properties", {})
-    required = schema.get("required", [])
-    
-    # Check required fields
-    for field in required:
-        if field not in input_data:
-            return {
-                "error": f"Missing required field: {field}",
-                "tool": tool_name
+def _handle_request(request) -> bytes:
+    """Handle a single JSON-RPC request and return the encoded response"""
+    if not isinstance(request, dict):
+        return _json_dumps({
+            "jsonrpc": "2.0",
+            "id": None,
+            "error": {
+                "code": -32600,
+                "message": "Invalid request"
             }
+        })
     
-    # Basic type validation
-    for field, value in input_data.items():
-        if field in properties:
-            prop_type = properties[field].get("type")
-            
-            if prop_type == "integer" and not isinstance(value, int):
-                return {
-                    "error": f"Field '{field}' must be an integer",
-                    "tool": tool_name
+    # Handle different request types
+    if request.get("method") == "tools/list":
+        # List available tools
+        manifest = load_manifest()
+        if "error" in manifest:
+            response = {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {
+                    "code": -32603,
+                    "message": manifest["error"]
                 }
-            elif prop_type == "number" and not isinstance(value, (int, float)):
-                return {
-                    "error": f"Field '{field}' must be a number",
-                    "tool": tool_name
+            }
+        else:
+            response = {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "result": {
+                    "tools": manifest.get("tools", [])
                 }
-            elif prop_type == "boolean" and not isinstance(value, bool):
-                return {
-                    "error": f"Field '{field}' must be a boolean",
-                    "tool": tool_name
+            }
+
+    elif request.get("method") == "tools/call":
+        # Execute a tool
+        params = request.get("params", {})
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+
+        if not tool_name:
+            response = {
+                "jsonrpc": "2.0",
+                "id": request.get("id"),
+                "error": {
+                    "code": -32602,
+                    "message": "Missing tool name"
                 }
-    
-    return {"valid": True}
+            }
+        else:
+            result = execute_tool(tool_name, arguments)
 
-def handle_mcp_protocol():
-    """Handle MCP protocol communication via stdin/stdout"""
-    try:
-        while True:
-            # Read input from stdin
-            line = sys.stdin.readline()
-            if not line:
-                break
-            
-            try:
-                request = json.loads(line.strip())
-            except json.JSONDecodeError:
-                continue
-            
-            # Handle different request types
-            if request.get("method") == "tools/list":
-                # List available tools
-                manifest = load_manifest()
-                if "error" in manifest:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "error": {
-                            "code": -32603,
-                            "message": manifest["error"]
-                        }
-                    }
-                else:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "result": {
-                            "tools": manifest.get("tools", [])
-                        }
-                    }
-                
-            elif request.get("method") == "tools/call":
-                # Execute a tool
-                params = request.get("params", {})
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-                
-                if not tool_name:
-                    response = {
-                        "jsonrpc": "2.0",
-                        "id": request.get("id"),
-                        "error": {
-                            "code": -32602,
-                            "message": "Missing tool name"
-                        }
-                    }
-                else:
-                    result = execute_tool(tool_name, arguments)
-                    
-                    if result.get("success"):
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request.get("id"),
-                            "result": {
-                                "content": [
-                                    {
-                                        "type": "text",
-                                        "text": json.dumps(result["result"], indent=2)
-                                    }
-                                ]
-                            }
-                        }
-                    else:
-                        response = {
-                            "jsonrpc": "2.0",
-                            "id": request.get("id"),
-                            "error": {
-                                "code": -32603,
-                                "message": result.get("error", "Unknown error"),
-                                "data": result.get("detail", "")
-                            }
-                        }
-            
+            if result.get("success"):
+                response = _tool_result_message(request.get("id"), result["result"])
             else:
-                # Unknown method
                 response = {
                     "jsonrpc": "2.0",
                     "id": request.get("id"),
                     "error": {
-                        "code": -32601,
-                        "message": "Method not found"
+                        "code": -32603,
+                        "message": result.get("error", "Unknown error"),
+                        "data": result.get("detail", "")
                     }
                 }
-            
-            # Send response to stdout
-            print(json.dumps(response), flush=True)
+
+    else:
+        # Unknown method
+        response = {
+            "jsonrpc": "2.0",
+            "id": request.get("id"),
+            "error": {
+                "code": -32601,
+                "message": "Method not found"
+            }
+        }
+    
+    return response if isinstance(response, bytes) else _json_dumps(response)
+
+def _handle_batch_element(request) -> bytes:
+    """Handle one call of a JSON-RPC batch, turning a failure into its error response.
+
+    An exception in one call must not abort the whole batch, so it is reported
+    against that call's id and the other calls still get their results.
+    """
+    try:
+        return _handle_request(request)
+    except Exception as e:
+        return _json_dumps({
+            "jsonrpc": "2.0",
+            "id": request.get("id") if isinstance(request, dict) else None,
+            "error": {
+                "code": -32603,
+                "message": f"Internal error: {str(e)}"
+            }
+        })
+
+def handle_mcp_protocol():
+    """Handle MCP protocol communication via stdin/stdout"""
+    stdin = sys.stdin.buffer
+    try:
+        with ThreadPoolExecutor(max_workers=_BATCH_WORKERS) as executor:
+            while True:
+                # Read input from stdin
+                line = stdin.readline()
+                if not line:
+                    break
+                
+                try:
+                    request = _json_loads(line)
+                except ValueError:
+                    continue
+                
+                if isinstance(request, list):
+                    # JSON-RPC batch: run the calls concurrently, reply in order
+                    if not request:
+                        _write_message(_handle_request(request))
+                        continue
+                    responses = executor.map(_handle_batch_element, request)
+                    _write_message(b"[" + b",".join(responses) + b"]")
+                    continue
+                
+                # Send response to stdout
+                _write_message(_handle_request(request))
             
     except KeyboardInterrupt:
         pass
@@ -371,10 +422,23 @@ def handle_mcp_protocol():
                 "message": f"Internal error: {str(e)}"
             }
         }
-        print(json.dumps(error_response), flush=True)
+        _write_message(error_response)
 
 def main():
     """Main entry point for the MCP client"""
+    # Manifest-only commands are what Cursor runs on tool discovery; answer
+    # them without importing argparse
+    flags = set(sys.argv[1:])
+    if flags <= {"--describe", "--list-tools", "--pretty"} and flags & {"--describe", "--list-tools"}:
+        pretty = "--pretty" in flags
+        if "--describe" in flags:
+            print_manifest(pretty)
+        else:
+            _emit(list_tools(), pretty)
+        return 0
+    
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Ardour MCP Client - Control Ardour DAW via MCP protocol"
     )
@@ -416,6 +480,12 @@ def main():
         help="Run in MCP protocol mode (for Cursor integration)"
     )
     
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output for reading (default is compact)"
+    )
+    
     parser.add_argument(
         "--version",
         action="version",
@@ -426,21 +496,22 @@ def main():
     
     # If --mcp flag is used, run in MCP protocol mode
     if args.mcp:
+        threading.Thread(target=_warm_up_connection, daemon=True).start()
         handle_mcp_protocol()
         return 0
     
     if args.describe:
-        print_manifest()
+        print_manifest(args.pretty)
         return 0
     
     if args.list_tools:
         result = list_tools()
-        print(json.dumps(result, indent=2))
+        _emit(result, args.pretty)
         return 0
     
     if args.tool_info:
         result = get_tool_info(args.tool_info)
-        print(json.dumps(result, indent=2))
+        _emit(result, args.pretty)
         return 0
     
     if args.validate:
@@ -448,14 +519,14 @@ def main():
         try:
             input_data = json.loads(json_input)
         except json.JSONDecodeError as e:
-            print(json.dumps({
+            _emit({
                 "error": "Invalid JSON input",
                 "details": str(e)
-            }, indent=2))
+            }, args.pretty)
             return 1
         
         result = validate_tool_input(tool_name, input_data)
-        print(json.dumps(result, indent=2))
+        _emit(result, args.pretty)
         return 0 if result.get("valid") else 1
     
     if args.execute:
@@ -463,14 +534,14 @@ def main():
         try:
             input_data = json.loads(json_input)
         except json.JSONDecodeError as e:
-            print(json.dumps({
+            _emit({
                 "error": "Invalid JSON input",
                 "details": str(e)
-            }, indent=2))
+            }, args.pretty)
             return 1
         
         result = execute_tool(tool_name, input_data)
-        print(json.dumps(result, indent=2))
+        _emit(result, args.pretty)
         return 0 if result.get("success") else 1
     
     # If no arguments provided, show help
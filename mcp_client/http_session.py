@@ -0,0 +1,37 @@
+"""
+Shared HTTP session for talking to the Ardour MCP server
+"""
+
+import atexit
+import threading
+
+# Global session instance, created on first use so that importing this module
+# does not pull in requests. The server holds idle connections for
+# HTTP_KEEP_ALIVE (15s by default), so pooled connections normally survive the
+# pause between tool calls.
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Get the shared requests session with a keep-alive connection pool"""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                
+                session = requests.Session()
+                session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+                _session = session
+    return _session
+
+def close_session():
+    """Close the shared session and drop its pooled connections"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
+atexit.register(close_session)
@@ -0,0 +1,74 @@
+"""
+Shared error handling for Ardour MCP Server API endpoints
+"""
+
+import json
+import logging
+from functools import wraps
+from fastapi import HTTPException
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response
+
+logger = logging.getLogger(__name__)
+
+# Failures an endpoint can expect from OSC I/O and value handling. Anything
+# else is a bug and is left to the app-wide exception handler in main.
+EXPECTED_ERRORS = (OSError, ValueError)
+
+SEND_FAILED = "Failed to send OSC message"
+
+def _error_body(detail: str) -> bytes:
+    """JSON body of a 500, as main's HTTPException handler renders it"""
+    return json.dumps(
+        {"detail": detail, "status_code": 500}, ensure_ascii=False, separators=(",", ":")
+    ).encode("utf-8")
+
+_SEND_FAILED_BODY = _error_body(SEND_FAILED)
+
+def send_failed(detail: str = SEND_FAILED) -> Response:
+    """Logged 500 response with the given detail, for an OSC send that failed
+    
+    Endpoints return it rather than raising HTTPException, so that calls
+    against an unreachable Ardour do not pay for an exception unwinding
+    through the endpoint wrappers and middleware. The body matches the
+    one the app's HTTPException handler produces.
+    """
+    logger.error(detail)
+    body = _SEND_FAILED_BODY if detail == SEND_FAILED else _error_body(detail)
+    return Response(content=body, status_code=500, media_type="application/json")
+
+def _convert_errors(fn, errors):
+    """Wrap an endpoint so that `errors` become a logged 500"""
+    name = fn.__name__
+    
+    @wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except (HTTPException, RequestValidationError):
+            raise
+        except errors as e:
+            logger.exception("Error in %s: %s", name, e)
+            raise HTTPException(
+                status_code=500,
+                detail=f"Internal server error: {str(e)}"
+            )
+    
+    return wrapper
+
+def api_errors(fn):
+    """Turn expected OSC/value errors in an endpoint into a logged 500
+    
+    HTTPExceptions and request validation errors raised by the endpoint
+    pass through unchanged.
+    """
+    return _convert_errors(fn, EXPECTED_ERRORS)
+
+def safe_endpoint(fn):
+    """Turn any error in an endpoint into a logged 500 carrying its message
+    
+    For endpoints that report every failure to the caller themselves.
+    HTTPExceptions and request validation errors raised by the endpoint
+    pass through unchanged.
+    """
+    return _convert_errors(fn, Exception)
@@ -0,0 +1,23 @@
+"""
+Request models shared by the Ardour MCP Server API routers
+"""
+
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, Field, ValidationError
+
+class BooleanRequest(BaseModel):
+    """Request model for on/off operations"""
+    enabled: bool = Field(..., description="True to enable, False to disable")
+
+def parse_json_body(model: type, body: bytes):
+    """Validate the raw request body straight into `model`
+    
+    Skips FastAPI's json.loads-then-validate round trip for tiny request
+    bodies; errors are reported as the usual 422 body validation errors.
+    """
+    try:
+        return model.model_validate_json(body)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
@@ -2,20 +2,163 @@
 Plugin control endpoints for Ardour MCP Server
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional, Union
-from fastapi import APIRouter, HTTPException, Path
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Body, HTTPException, Path, Query, Request, Response
+from pydantic import BaseModel, ConfigDict, Field
 from mcp_server.osc_client import get_osc_client
 from mcp_server.parameter_conversion import SmartParameterValue, ParameterType
-from mcp_server.osc_listener import get_osc_listener, start_osc_listener
+from mcp_server.osc_listener import get_osc_listener
 from mcp_server.plugin_parameter_mapper import get_parameter_mapper
+from mcp_server.responses import FastJSONResponse
+from mcp_server.api.errors import api_errors
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/plugins", tags=["plugins"])
+# Discovery payloads (notably /discovery/scan) are the largest this server
+# returns, so encode them with orjson when it is installed
+router = APIRouter(prefix="/plugins", tags=["plugins"], default_response_class=FastJSONResponse)
+
+# Discovery results keyed by (track_index, plugin_id) -> (timestamp, results).
+# plugin_id -1 holds the track's plugin list. Discovery waits seconds for OSC
+# replies, so results are reused until the TTL expires or a write on the
+# plugin invalidates them. Discovery runs in threadpool workers, so the cache
+# is guarded by a lock, and each invalidation bumps the key's generation so a
+# discovery that started before a write cannot store its stale result after it.
+DISCOVERY_CACHE_TTL = 30.0
+_discovery_cache: Dict[tuple, tuple] = {}
+_discovery_generations: Dict[tuple, int] = {}
+_discovery_lock = threading.Lock()
+
+def _get_cached_discovery(key: tuple) -> Optional[list]:
+    """Return cached discovery results for a key if still fresh"""
+    with _discovery_lock:
+        entry = _discovery_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < DISCOVERY_CACHE_TTL:
+        return entry[1]
+    return None
+
+def _discovery_generation(key: tuple) -> int:
+    """Return the key's invalidation count, taken before starting a discovery"""
+    with _discovery_lock:
+        return _discovery_generations.get(key, 0)
+
+def _store_discovery(key: tuple, results: list, generation: Optional[int] = None):
+    """Cache discovery results; empty results are not cached so retries rediscover
+    
+    Results are dropped if the key was invalidated since ``generation`` was taken.
+    """
+    if results:
+        with _discovery_lock:
+            if generation is None or _discovery_generations.get(key, 0) == generation:
+                _discovery_cache[key] = (time.monotonic(), list(results))
+
+def invalidate_discovery_cache(track_index: int, plugin_id: Optional[int] = None):
+    """Drop cached discovery for a plugin and its track's plugin list"""
+    keys = [(track_index, -1)]
+    if plugin_id is not None:
+        keys.append((track_index, plugin_id))
+    with _discovery_lock:
+        for key in keys:
+            _discovery_cache.pop(key, None)
+            _discovery_generations[key] = _discovery_generations.get(key, 0) + 1
+
+def _discover_plugins_cached(osc_listener, track_index: int, timeout: float) -> list:
+    """Discover plugins on a track, reusing a fresh cached result"""
+    key = (track_index, -1)
+    plugins = _get_cached_discovery(key)
+    if plugins is None:
+        generation = _discovery_generation(key)
+        plugins = osc_listener.discover_plugins(track_index, timeout=timeout)
+        _store_discovery(key, plugins, generation)
+    return plugins
+
+def _discover_parameters_cached(osc_listener, track_index: int, plugin_id: int, timeout: float) -> list:
+    """Discover a plugin's parameters, reusing a fresh cached result"""
+    key = (track_index, plugin_id)
+    parameters = _get_cached_discovery(key)
+    if parameters is None:
+        generation = _discovery_generation(key)
+        parameters = osc_listener.discover_plugin_parameters(track_index, plugin_id, timeout=timeout)
+        _store_discovery(key, parameters, generation)
+    return parameters
+
+# Background parameter prefetches, held so the tasks are not garbage
+# collected mid-flight, and the (track_index, plugin_id) keys they cover,
+# each with an event set once that key's discovery has finished
+_prefetch_tasks: set = set()
+_prefetching: Dict[tuple, threading.Event] = {}
+
+def _prefetch_parameters(osc_listener, track_index: int, plugin_ids: List[int]):
+    """Warm the discovery cache with plugin parameters in the background
+    
+    Clients almost always ask for each plugin's parameters after listing a
+    track, so start discovering them while the listing is being returned.
+    """
+    keys = [
+        (track_index, plugin_id) for plugin_id in plugin_ids
+        if (track_index, plugin_id) not in _prefetching
+        and _get_cached_discovery((track_index, plugin_id)) is None
+    ]
+    if not keys:
+        return
+    events = {key: threading.Event() for key in keys}
+    _prefetching.update(events)
+    
+    def run():
+        # Parameter discovery is serialized in the listener, so one worker
+        # thread walks the plugins in turn
+        for key in keys:
+            try:
+                _discover_parameters_cached(osc_listener, key[0], key[1], 3.0)
+            except Exception as e:  # best effort: the real request will retry
+                logger.warning("Parameter prefetch failed for track %s plugin %s: %s", key[0], key[1], e)
+            finally:
+                _prefetching.pop(key, None)
+                events[key].set()
+    
+    task = asyncio.create_task(asyncio.to_thread(run))
+    _prefetch_tasks.add(task)
+    task.add_done_callback(_prefetch_tasks.discard)
+
+def _discover_parameters_after_prefetch(osc_listener, track_index: int, plugin_id: int, timeout: float) -> list:
+    """Discover a plugin's parameters, first waiting out an in-flight prefetch of them
+    
+    Starting a second discovery would only queue on the listener's parameter
+    lock behind the prefetch, so wait for its result to land in the cache.
+    Blocks; run it off the event loop.
+    """
+    event = _prefetching.get((track_index, plugin_id))
+    if event is not None:
+        event.wait()
+    return _discover_parameters_cached(osc_listener, track_index, plugin_id, timeout)
+
+# Static part of the get_plugin_info response
+_PLUGIN_INFO_TEMPLATE = MappingProxyType({
+    "vendor": "Ardour Community Edition",
+    "version": "1.0",
+    "osc_address": "/select/plugin",
+    "capabilities": ("parameter_control", "bypass", "automation")
+})
+
+# Example values for plugins discovery has not seen yet
+_EXAMPLE_PLUGIN_INFO = (
+    MappingProxyType({"name": "ACE Compressor", "active": True, "type": "compressor", "parameter_count": 4}),
+    MappingProxyType({"name": "ACE EQ", "active": True, "type": "eq", "parameter_count": 3}),
+)
 
 class PluginInfo(BaseModel):
     """Plugin information model"""
+    model_config = ConfigDict(extra='forbid')
+    
     id: int = Field(..., description="Plugin ID (0-based)")
     name: str = Field(..., description="Plugin name")
     active: bool = Field(..., description="Plugin active/bypassed status")
@@ -23,12 +166,16 @@ class PluginInfo(BaseModel):
 
 class PluginListResponse(BaseModel):
     """Response model for plugin list"""
+    model_config = ConfigDict(extra='forbid')
+    
     track: int = Field(..., description="Track number")
     plugins: List[PluginInfo] = Field(..., description="List of plugins on track")
     count: int = Field(..., description="Number of plugins")
 
 class ParameterInfo(BaseModel):
     """Plugin parameter information"""
+    model_config = ConfigDict(extra='forbid')
+    
     id: int = Field(..., description="Parameter ID (1-based)")
     name: str = Field(..., description="Parameter name")
     value_raw: float = Field(..., description="Raw OSC value (0.0-1.0)")
@@ -39,6 +186,8 @@ class ParameterInfo(BaseModel):
 
 class PluginParametersResponse(BaseModel):
     """Response model for plugin parameters"""
+    model_config = ConfigDict(extra='forbid')
+    
     track: int = Field(..., description="Track number")
     plugin_id: int = Field(..., description="Plugin ID")
     plugin_name: str = Field(..., description="Plugin name")
@@ -47,10 +196,14 @@ class PluginParametersResponse(BaseModel):
 
 class PluginActivateRequest(BaseModel):
     """Request model for plugin activation control"""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     active: bool = Field(..., description="True to activate plugin, False to bypass")
 
 class SmartParameterRequest(BaseModel):
     """Request model for smart parameter control with real-world values"""
+    model_config = ConfigDict(extra='forbid', frozen=True)
+    
     # dB values
     db: Optional[float] = Field(None, description="dB value (-60 to +12)")
     
@@ -75,352 +228,323 @@ class SmartParameterRequest(BaseModel):
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary, excluding None values"""
-        return {k: v for k, v in self.dict().items() if v is not None}
+        return self.model_dump(exclude_none=True)
 
 @router.get(
     "/track/{track_number}/plugins", 
-    response_model=PluginListResponse,
+    response_model=None,
+    responses={200: {"model": PluginListResponse}},
     operation_id="list_track_plugins"
 )
+@api_errors
 async def list_track_plugins(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256)
 ):
     """List all plugins on a specific track using real OSC discovery"""
-    try:
-        # Ensure OSC listener is running
-        start_osc_listener()
-        
-        osc_listener = get_osc_listener()
-        track_index = track_number - 1
-        
-        # Use real plugin discovery
-        discovered_plugins = osc_listener.discover_plugins(track_index, timeout=5.0)
-        
-        # Convert discovered plugins to API format
-        plugins = []
-        for plugin_info in discovered_plugins:
-            plugin_type = _determine_plugin_type(plugin_info.name)
-            
-            plugins.append(PluginInfo(
-                id=plugin_info.id,
-                name=plugin_info.name,
-                active=plugin_info.enabled,
-                type=plugin_type
-            ))
-            
-        logger.info(f"Discovered {len(plugins)} plugins for track {track_number}")
-        
-        return PluginListResponse(
-            track=track_number,
-            plugins=plugins,
-            count=len(plugins)
-        )
+    # The listener is started once by the app's startup event
+    osc_listener = get_osc_listener()
+    track_index = track_number - 1
+    
+    # Use real plugin discovery; a cache miss blocks waiting for OSC replies,
+    # so it runs off the event loop
+    discovered_plugins = _get_cached_discovery((track_index, -1))
+    if discovered_plugins is None:
+        discovered_plugins = await asyncio.to_thread(_discover_plugins_cached, osc_listener, track_index, 5.0)
+    
+    # Convert discovered plugins to API format. Discovery data is trusted, so
+    # plain dicts shaped like PluginListResponse skip per-plugin validation.
+    plugins = [
+        {"id": p.id, "name": p.name, "active": p.enabled, "type": _determine_plugin_type(p.name)}
+        for p in discovered_plugins
+    ]
         
-    except Exception as e:
-        logger.error(f"Error in list_track_plugins: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    logger.info("Discovered %s plugins for track %s", len(plugins), track_number)
+    
+    _prefetch_parameters(osc_listener, track_index, [p.id for p in discovered_plugins])
+    
+    return {
+        "track": track_number,
+        "plugins": plugins,
+        "count": len(plugins)
+    }
 
 @router.get(
     "/track/{track_number}/plugin/{plugin_id}/parameters", 
-    response_model=PluginParametersResponse,
+    response_model=None,
+    responses={200: {"model": PluginParametersResponse}},
     operation_id="get_plugin_parameters"
 )
+@api_errors
 async def get_plugin_parameters(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32)
 ):
     """Get detailed parameter information for a specific plugin using real OSC discovery"""
-    try:
-        # Ensure OSC listener is running
-        start_osc_listener()
-        
-        osc_listener = get_osc_listener()
-        track_index = track_number - 1
-        
-        # Use real parameter discovery
-        discovered_params = osc_listener.discover_plugin_parameters(track_index, plugin_id, timeout=5.0)
-        
-        # Convert discovered parameters to API format
-        parameters = []
-        for param in discovered_params:
-            # Generate display value based on parameter type
-            display_value = _format_parameter_value(param.value, param.type, param.unit)
-            
-            parameters.append(ParameterInfo(
-                id=param.id,
-                name=param.name,
-                value_raw=param.value,
-                value_display=display_value,
-                min_value=param.min_value,
-                max_value=param.max_value,
-                unit=param.unit
-            ))
-            
-        # Get plugin name from discovered data
-        plugin_name = "Unknown Plugin"
-        tracks = osc_listener.get_all_tracks()
-        if track_index in tracks:
-            for plugin in tracks[track_index].plugins:
-                if plugin.id == plugin_id:
-                    plugin_name = plugin.name
-                    break
-        
-        logger.info(f"Discovered {len(parameters)} parameters for track {track_number} plugin {plugin_id}")
-        
-        return PluginParametersResponse(
-            track=track_number,
-            plugin_id=plugin_id,
-            plugin_name=plugin_name,
-            parameters=parameters,
-            count=len(parameters)
+    # The listener is started once by the app's startup event
+    osc_listener = get_osc_listener()
+    track_index = track_number - 1
+    
+    # Use real parameter discovery; a cache miss blocks waiting for OSC
+    # replies, so it runs off the event loop
+    discovered_params = _get_cached_discovery((track_index, plugin_id))
+    if discovered_params is None:
+        discovered_params = await asyncio.to_thread(
+            _discover_parameters_after_prefetch, osc_listener, track_index, plugin_id, 5.0
         )
+    
+    # Convert discovered parameters to API format
+    parameters = [_parameter_dict(param) for param in discovered_params]
         
-    except Exception as e:
-        logger.error(f"Error in get_plugin_parameters: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    # Get plugin name from discovered data
+    plugin_name = "Unknown Plugin"
+    tracks = osc_listener.get_all_tracks()
+    if track_index in tracks:
+        plugin_names = {p.id: p.name for p in tracks[track_index].plugins}
+        plugin_name = plugin_names.get(plugin_id, plugin_name)
+    
+    logger.info("Discovered %s parameters for track %s plugin %s", len(parameters), track_number, plugin_id)
+    
+    return {
+        "track": track_number,
+        "plugin_id": plugin_id,
+        "plugin_name": plugin_name,
+        "parameters": parameters,
+        "count": len(parameters)
+    }
 
 @router.get(
     "/track/{track_number}/plugin/{plugin_id}/info",
     operation_id="get_plugin_info"
 )
+@api_errors
 async def get_plugin_info(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32)
 ):
     """Get detailed information about a specific plugin"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number - 1
-        
-        # Request plugin info
-        success = osc_client.get_plugin_info(track_index, plugin_id)
-        
-        if success:
-            # Example plugin info - in real implementation, parse OSC feedback
-            plugin_info = {
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "name": "ACE Compressor" if plugin_id == 0 else "ACE EQ",
-                "active": True,
-                "type": "compressor" if plugin_id == 0 else "eq",
-                "vendor": "Ardour Community Edition",
-                "version": "1.0",
-                "parameter_count": 4 if plugin_id == 0 else 3,
-                "osc_address": f"/select/plugin",
-                "capabilities": [
-                    "parameter_control",
-                    "bypass",
-                    "automation"
-                ]
+    osc_client = get_osc_client()
+    track_index = track_number - 1
+    
+    # Request plugin info
+    success = osc_client.get_plugin_info(track_index, plugin_id)
+    
+    if success:
+        # Prefer what discovery has already seen for this plugin; fall back to
+        # example values until the track has been listed
+        plugins = _get_cached_discovery((track_index, -1)) or []
+        discovered = next((p for p in plugins if p.id == plugin_id), None)
+        if discovered is not None:
+            parameters = _get_cached_discovery((track_index, plugin_id))
+            dynamic = {
+                "name": discovered.name,
+                "active": discovered.enabled,
+                "type": _determine_plugin_type(discovered.name),
+                "parameter_count": len(parameters) if parameters is not None else None
             }
-            
-            logger.info(f"Got plugin info for track {track_number} plugin {plugin_id}")
-            return plugin_info
         else:
-            logger.error(f"Failed to get plugin info for track {track_number} plugin {plugin_id}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to get plugin info for track {track_number} plugin {plugin_id}"
-            )
-    except Exception as e:
-        logger.error(f"Error in get_plugin_info: {e}")
+            dynamic = _EXAMPLE_PLUGIN_INFO[0 if plugin_id == 0 else 1]
+            
+        plugin_info = {
+            **_PLUGIN_INFO_TEMPLATE,
+            **dynamic,
+            "track": track_number,
+            "plugin_id": plugin_id
+        }
+        
+        logger.info("Got plugin info for track %s plugin %s", track_number, plugin_id)
+        return plugin_info
+    else:
+        logger.error("Failed to get plugin info for track %s plugin %s", track_number, plugin_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            detail=f"Failed to get plugin info for track {track_number} plugin {plugin_id}"
         )
 
 @router.get(
     "/discovery/scan",
     operation_id="scan_all_plugins"
 )
-async def scan_all_plugins():
+@api_errors
+async def scan_all_plugins(
+    request: Request,
+    response: Response,
+    include_parameters: bool = Query(False, description="Also discover the parameters of every plugin found")
+):
     """Scan all tracks for plugins and return comprehensive plugin map using real OSC discovery"""
-    try:
-        # Ensure OSC listener is running
-        start_osc_listener()
-        
-        osc_listener = get_osc_listener()
-        
-        # Scan multiple tracks (typical session might have 8-32 tracks)
-        tracks_to_scan = range(8)  # Scan first 8 tracks
-        total_plugins = 0
-        plugin_types = {}
-        tracks_data = {}
-        
-        for track_index in tracks_to_scan:
-            plugins = osc_listener.discover_plugins(track_index, timeout=3.0)
-            if plugins:
-                track_plugins = []
-                for plugin in plugins:
-                    plugin_type = _determine_plugin_type(plugin.name)
-                    
-                    track_plugins.append({
-                        "id": plugin.id,
-                        "name": plugin.name,
-                        "type": plugin_type,
-                        "active": plugin.enabled
-                    })
-                    
-                    # Count plugin types
-                    if plugin_type in plugin_types:
-                        plugin_types[plugin_type] += 1
-                    else:
-                        plugin_types[plugin_type] = 1
-                        
-                    total_plugins += 1
-                    
-                tracks_data[str(track_index + 1)] = track_plugins
-                
-        from datetime import datetime
-        
-        plugin_map = {
-            "scan_time": datetime.now().isoformat() + "Z",
-            "total_tracks": len([k for k, v in tracks_data.items() if v]),
-            "total_plugins": total_plugins,
-            "tracks": tracks_data,
-            "plugin_types": plugin_types
-        }
-        
-        logger.info(f"Completed plugin discovery scan: {total_plugins} plugins across {len(tracks_data)} tracks")
-        return plugin_map
-        
-    except Exception as e:
-        logger.error(f"Error in scan_all_plugins: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    # The listener is started once by the app's startup event
+    osc_listener = get_osc_listener()
+    
+    # Scan multiple tracks (typical session might have 8-32 tracks)
+    tracks_to_scan = range(8)  # Scan first 8 tracks
+    total_plugins = 0
+    plugin_types = Counter()
+    tracks_data = {}
+    
+    # Discover all tracks concurrently so the scan takes one timeout
+    # window rather than one per track
+    results = await asyncio.gather(*[
+        asyncio.to_thread(_discover_plugins_cached, osc_listener, track_index, 3.0)
+        for track_index in tracks_to_scan
+    ])
+    
+    for track_index, plugins in zip(tracks_to_scan, results):
+        if plugins:
+            types = [_determine_plugin_type(p.name) for p in plugins]
+            plugin_types.update(types)
+            track_plugins = [
+                {"id": p.id, "name": p.name, "type": t, "active": p.enabled}
+                for p, t in zip(plugins, types)
+            ]
+            total_plugins += len(plugins)
+            
+            # Only tracks with plugins get an entry, so len(tracks_data)
+            # is the track count
+            tracks_data[str(track_index + 1)] = track_plugins
+    
+    if include_parameters:
+        # Parameter feedback is tied to the listener's current plugin, so
+        # discovery is serialized there; run the whole batch in one worker
+        # thread rather than parking a pool thread per plugin on its lock
+        work = [
+            (int(track_key) - 1, track_plugin)
+            for track_key, track_plugins in tracks_data.items()
+            for track_plugin in track_plugins
+        ]
+        discovered = await asyncio.to_thread(lambda: [
+            _discover_parameters_cached(osc_listener, track_index, track_plugin["id"], 3.0)
+            for track_index, track_plugin in work
+        ])
+        for (_, track_plugin), params in zip(work, discovered):
+            track_plugin["parameters"] = [_parameter_dict(p) for p in params]
+            
+    # Tag the scan by its content so clients can skip unchanged payloads
+    etag = _scan_etag(tracks_data)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    plugin_map = {
+        "scan_time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "total_tracks": len(tracks_data),
+        "total_plugins": total_plugins,
+        "tracks": tracks_data,
+        "plugin_types": dict(plugin_types)
+    }
+    
+    logger.info("Completed plugin discovery scan: %s plugins across %s tracks", total_plugins, len(tracks_data))
+    return plugin_map
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/activate",
     operation_id="set_plugin_activate"
 )
+@api_errors
 async def set_plugin_activate(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
     request: PluginActivateRequest = ...
 ):
     """Activate or bypass a plugin"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number - 1
-        
-        # Select track and plugin, then activate/deactivate
-        success = osc_client.set_plugin_activate(track_index, plugin_id, request.active)
-        
-        if success:
-            action = "activated" if request.active else "bypassed"
-            logger.info(f"Plugin {action}: track {track_number} plugin {plugin_id}")
-            return {
-                "status": "success",
-                "action": "set_plugin_activate",
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "active": request.active,
-                "message": f"Plugin {plugin_id} {action} on track {track_number}",
-                "osc_address": "/select/plugin/activate"
-            }
-        else:
-            logger.error(f"Failed to set plugin activation for track {track_number} plugin {plugin_id}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set plugin activation for track {track_number} plugin {plugin_id}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_plugin_activate: {e}")
+    osc_client = get_osc_client()
+    track_index = track_number - 1
+    
+    # Select track and plugin, then activate/deactivate. OSC sends (and their
+    # logging) are blocking, so they run off the event loop.
+    success = await asyncio.to_thread(osc_client.set_plugin_activate, track_index, plugin_id, request.active)
+    
+    if success:
+        invalidate_discovery_cache(track_index, plugin_id)
+        action = "activated" if request.active else "bypassed"
+        logger.info("Plugin %s: track %s plugin %s", action, track_number, plugin_id)
+        return {
+            "status": "success",
+            "action": "set_plugin_activate",
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "active": request.active,
+            "message": f"Plugin {plugin_id} {action} on track {track_number}",
+            "osc_address": "/select/plugin/activate"
+        }
+    else:
+        logger.error("Failed to set plugin activation for track %s plugin %s", track_number, plugin_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            detail=f"Failed to set plugin activation for track {track_number} plugin {plugin_id}"
         )
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/bypass",
     operation_id="bypass_plugin"
 )
+@api_errors
 async def bypass_plugin(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32)
 ):
     """Bypass a plugin (convenience endpoint)"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number - 1
-        
-        success = osc_client.set_plugin_activate(track_index, plugin_id, False)
-        
-        if success:
-            logger.info(f"Plugin bypassed: track {track_number} plugin {plugin_id}")
-            return {
-                "status": "success",
-                "action": "bypass_plugin",
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "active": False,
-                "message": f"Plugin {plugin_id} bypassed on track {track_number}",
-                "osc_address": "/select/plugin/activate"
-            }
-        else:
-            logger.error(f"Failed to bypass plugin for track {track_number} plugin {plugin_id}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to bypass plugin for track {track_number} plugin {plugin_id}"
-            )
-    except Exception as e:
-        logger.error(f"Error in bypass_plugin: {e}")
+    osc_client = get_osc_client()
+    track_index = track_number - 1
+    
+    success = await asyncio.to_thread(osc_client.set_plugin_activate, track_index, plugin_id, False)
+    
+    if success:
+        invalidate_discovery_cache(track_index, plugin_id)
+        logger.info("Plugin bypassed: track %s plugin %s", track_number, plugin_id)
+        return {
+            "status": "success",
+            "action": "bypass_plugin",
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "active": False,
+            "message": f"Plugin {plugin_id} bypassed on track {track_number}",
+            "osc_address": "/select/plugin/activate"
+        }
+    else:
+        logger.error("Failed to bypass plugin for track %s plugin %s", track_number, plugin_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            detail=f"Failed to bypass plugin for track {track_number} plugin {plugin_id}"
         )
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/enable",
     operation_id="enable_plugin"
 )
+@api_errors
 async def enable_plugin(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32)
 ):
     """Enable a plugin (convenience endpoint)"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number - 1
-        
-        success = osc_client.set_plugin_activate(track_index, plugin_id, True)
-        
-        if success:
-            logger.info(f"Plugin enabled: track {track_number} plugin {plugin_id}")
-            return {
-                "status": "success",
-                "action": "enable_plugin",
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "active": True,
-                "message": f"Plugin {plugin_id} enabled on track {track_number}",
-                "osc_address": "/select/plugin/activate"
-            }
-        else:
-            logger.error(f"Failed to enable plugin for track {track_number} plugin {plugin_id}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to enable plugin for track {track_number} plugin {plugin_id}"
-            )
-    except Exception as e:
-        logger.error(f"Error in enable_plugin: {e}")
+    osc_client = get_osc_client()
+    track_index = track_number - 1
+    
+    success = await asyncio.to_thread(osc_client.set_plugin_activate, track_index, plugin_id, True)
+    
+    if success:
+        invalidate_discovery_cache(track_index, plugin_id)
+        logger.info("Plugin enabled: track %s plugin %s", track_number, plugin_id)
+        return {
+            "status": "success",
+            "action": "enable_plugin",
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "active": True,
+            "message": f"Plugin {plugin_id} enabled on track {track_number}",
+            "osc_address": "/select/plugin/activate"
+        }
+    else:
+        logger.error("Failed to enable plugin for track %s plugin %s", track_number, plugin_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            detail=f"Failed to enable plugin for track {track_number} plugin {plugin_id}"
         )
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/parameter/{parameter_name}",
     operation_id="set_smart_parameter"
 )
+@api_errors
 async def set_smart_parameter(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
@@ -428,30 +552,42 @@ async def set_smart_parameter(
     request: SmartParameterRequest = ...
 ):
     """Set plugin parameter with smart real-world value conversion"""
+    return await _set_smart_parameter_impl(track_number, plugin_id, parameter_name, request.to_dict())
+
+async def _set_smart_parameter_impl(
+    track_number: int,
+    plugin_id: int,
+    parameter_name: str,
+    params_dict: Dict[str, Any]
+):
+    """Shared body of set_smart_parameter and its convenience endpoints"""
     try:
         osc_client = get_osc_client()
         track_index = track_number - 1
         
         # Determine parameter type based on name and available values
-        param_type = _determine_parameter_type(parameter_name, request.to_dict())
+        name_lower = _canon(parameter_name)
+        param_type = _resolve_parameter_type(name_lower, params_dict)
         
         # Create smart parameter converter
         smart_param = SmartParameterValue(param_type)
         
         # Convert real-world value to OSC 0-1 value
-        osc_value = smart_param.to_osc(request.to_dict())
+        osc_value = smart_param.to_osc(params_dict)
         
         # Get parameter ID for this parameter name (simplified for now)
-        parameter_id = _get_parameter_id(parameter_name)
+        parameter_id = _get_parameter_id_lc(name_lower)
         
         # Send OSC message
-        success = osc_client.set_plugin_parameter(track_index, plugin_id, parameter_id, osc_value)
+        success = await asyncio.to_thread(osc_client.set_plugin_parameter, track_index, plugin_id, parameter_id, osc_value)
         
         if success:
+            invalidate_discovery_cache(track_index, plugin_id)
+            
             # Convert back to show what was actually set
             actual_value = smart_param.from_osc(osc_value)
             
-            logger.info(f"Parameter set: track {track_number} plugin {plugin_id} {parameter_name} = {actual_value}")
+            logger.info("Parameter set: track %s plugin %s %s = %s", track_number, plugin_id, parameter_name, actual_value)
             return {
                 "status": "success",
                 "action": "set_smart_parameter",
@@ -459,35 +595,96 @@ async def set_smart_parameter(
                 "plugin_id": plugin_id,
                 "parameter_name": parameter_name,
                 "parameter_id": parameter_id,
-                "input_value": request.to_dict(),
+                "input_value": params_dict,
                 "actual_value": actual_value,
                 "osc_value": osc_value,
                 "message": f"Parameter '{parameter_name}' set to {actual_value}",
                 "osc_address": f"/select/plugin/parameter"
             }
         else:
-            logger.error(f"Failed to set parameter {parameter_name} for track {track_number} plugin {plugin_id}")
+            logger.error("Failed to set parameter %s for track %s plugin %s", parameter_name, track_number, plugin_id)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to set parameter {parameter_name} for track {track_number} plugin {plugin_id}"
             )
     except ValueError as e:
-        logger.error(f"Parameter conversion error: {e}")
+        logger.error("Parameter conversion error: %s", e)
         raise HTTPException(
             status_code=422,
             detail=f"Parameter conversion error: {str(e)}"
         )
-    except Exception as e:
-        logger.error(f"Error in set_smart_parameter: {e}")
+
+@router.post(
+    "/track/{track_number}/plugin/{plugin_id}/parameters",
+    operation_id="set_plugin_parameters"
+)
+@api_errors
+async def set_plugin_parameters(
+    track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
+    plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
+    request: Dict[str, SmartParameterRequest] = Body(..., description="Parameter name -> real-world value")
+):
+    """Set several plugin parameters at once, sent to Ardour as a single OSC bundle"""
+    if not request:
+        raise HTTPException(status_code=422, detail="At least one parameter is required")
+        
+    osc_client = get_osc_client()
+    track_index = track_number - 1
+    
+    try:
+        # Convert every value up front so a bad one fails the whole batch
+        converted = {}
+        for parameter_name, values in request.items():
+            params_dict = values.to_dict()
+            name_lower = _canon(parameter_name)
+            smart_param = SmartParameterValue(_resolve_parameter_type(name_lower, params_dict))
+            osc_value = smart_param.to_osc(params_dict)
+            converted[parameter_name] = (_get_parameter_id_lc(name_lower), smart_param, osc_value, params_dict)
+    except ValueError as e:
+        logger.error("Parameter conversion error: %s", e)
+        raise HTTPException(
+            status_code=422,
+            detail=f"Parameter conversion error: {str(e)}"
+        )
+        
+    success = await asyncio.to_thread(
+        osc_client.set_plugin_parameters, track_index, plugin_id,
+        {parameter_id: osc_value for parameter_id, _, osc_value, _ in converted.values()}
+    )
+    
+    if success:
+        invalidate_discovery_cache(track_index, plugin_id)
+        logger.info("Parameters set: track %s plugin %s %s", track_number, plugin_id, list(converted))
+        return {
+            "status": "success",
+            "action": "set_plugin_parameters",
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "parameters": {
+                parameter_name: {
+                    "parameter_id": parameter_id,
+                    "input_value": params_dict,
+                    "actual_value": smart_param.from_osc(osc_value),
+                    "osc_value": osc_value
+                }
+                for parameter_name, (parameter_id, smart_param, osc_value, params_dict) in converted.items()
+            },
+            "count": len(converted),
+            "message": f"{len(converted)} parameters set on track {track_number} plugin {plugin_id}",
+            "osc_address": "/select/plugin/parameter"
+        }
+    else:
+        logger.error("Failed to set parameters for track %s plugin %s", track_number, plugin_id)
         raise HTTPException(
             status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            detail=f"Failed to set parameters for track {track_number} plugin {plugin_id}"
         )
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/compressor/threshold",
     operation_id="set_compressor_threshold"
 )
+@api_errors
 async def set_compressor_threshold(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
@@ -497,13 +694,14 @@ async def set_compressor_threshold(
     if request.db is None:
         raise HTTPException(status_code=422, detail="Compressor threshold requires 'db' value")
     
-    # Use the generic smart parameter endpoint
-    return await set_smart_parameter(track_number, plugin_id, "threshold", request)
+    # Share the generic smart parameter logic
+    return await _set_smart_parameter_impl(track_number, plugin_id, "threshold", request.to_dict())
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/compressor/ratio",
     operation_id="set_compressor_ratio"
 )
+@api_errors
 async def set_compressor_ratio(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
@@ -513,12 +711,13 @@ async def set_compressor_ratio(
     if request.ratio is None:
         raise HTTPException(status_code=422, detail="Compressor ratio requires 'ratio' value")
     
-    return await set_smart_parameter(track_number, plugin_id, "ratio", request)
+    return await _set_smart_parameter_impl(track_number, plugin_id, "ratio", request.to_dict())
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/eq/frequency",
     operation_id="set_eq_frequency"
 )
+@api_errors
 async def set_eq_frequency(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
@@ -528,12 +727,13 @@ async def set_eq_frequency(
     if request.hz is None:
         raise HTTPException(status_code=422, detail="EQ frequency requires 'hz' value")
     
-    return await set_smart_parameter(track_number, plugin_id, "frequency", request)
+    return await _set_smart_parameter_impl(track_number, plugin_id, "frequency", request.to_dict())
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/eq/gain",
     operation_id="set_eq_gain"
 )
+@api_errors
 async def set_eq_gain(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
@@ -543,7 +743,7 @@ async def set_eq_gain(
     if request.db is None:
         raise HTTPException(status_code=422, detail="EQ gain requires 'db' value")
     
-    return await set_smart_parameter(track_number, plugin_id, "gain", request)
+    return await _set_smart_parameter_impl(track_number, plugin_id, "gain", request.to_dict())
 
 # Dynamic Parameter Mapping Endpoints
 
@@ -551,158 +751,129 @@ async def set_eq_gain(
     "/track/{track_number}/plugin/{plugin_id}/parameters/names",
     operation_id="list_parameter_names"
 )
+@api_errors
 async def list_parameter_names(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32)
 ):
     """List all available parameter names for a plugin"""
-    try:
-        track_index = track_number - 1
-        parameter_mapper = get_parameter_mapper()
-        
-        parameter_names = parameter_mapper.list_parameter_names(track_index, plugin_id)
-        
-        if parameter_names:
-            logger.info(f"Found {len(parameter_names)} parameter names for track {track_number} plugin {plugin_id}")
-            return {
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "parameter_names": parameter_names,
-                "count": len(parameter_names)
-            }
-        else:
-            logger.warning(f"No parameter names found for track {track_number} plugin {plugin_id}")
-            return {
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "parameter_names": [],
-                "count": 0
-            }
-            
-    except Exception as e:
-        logger.error(f"Error listing parameter names: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    track_index = track_number - 1
+    parameter_mapper = get_parameter_mapper()
+    
+    parameter_names = parameter_mapper.list_parameter_names(track_index, plugin_id)
+    
+    if parameter_names:
+        logger.info("Found %s parameter names for track %s plugin %s", len(parameter_names), track_number, plugin_id)
+        return {
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "parameter_names": parameter_names,
+            "count": len(parameter_names)
+        }
+    else:
+        logger.warning("No parameter names found for track %s plugin %s", track_number, plugin_id)
+        return {
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "parameter_names": [],
+            "count": 0
+        }
 
 @router.get(
     "/track/{track_number}/plugin/{plugin_id}/parameter/{parameter_name}/info",
     operation_id="get_parameter_info"
 )
+@api_errors
 async def get_parameter_info(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
     parameter_name: str = Path(..., description="Parameter name")
 ):
     """Get detailed information about a specific parameter"""
-    try:
-        track_index = track_number - 1
-        parameter_mapper = get_parameter_mapper()
-        
-        param_info = parameter_mapper.get_parameter_info(track_index, plugin_id, parameter_name)
-        
-        if param_info:
-            logger.info(f"Found parameter info for {parameter_name} on track {track_number} plugin {plugin_id}")
-            return {
-                "track": track_number,
-                "plugin_id": plugin_id,
-                "parameter": param_info
-            }
-        else:
-            logger.warning(f"Parameter {parameter_name} not found for track {track_number} plugin {plugin_id}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Parameter '{parameter_name}' not found for track {track_number} plugin {plugin_id}"
-            )
-            
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting parameter info: {e}")
+    track_index = track_number - 1
+    parameter_mapper = get_parameter_mapper()
+    
+    param_info = parameter_mapper.get_parameter_info(track_index, plugin_id, parameter_name)
+    
+    if param_info:
+        logger.info("Found parameter info for %s on track %s plugin %s", parameter_name, track_number, plugin_id)
+        return {
+            "track": track_number,
+            "plugin_id": plugin_id,
+            "parameter": param_info
+        }
+    else:
+        logger.warning("Parameter %s not found for track %s plugin %s", parameter_name, track_number, plugin_id)
         raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
+            status_code=404,
+            detail=f"Parameter '{parameter_name}' not found for track {track_number} plugin {plugin_id}"
         )
 
 @router.get(
     "/track/{track_number}/plugin/{plugin_id}/parameters/search",
     operation_id="search_parameters"
 )
+@api_errors
 async def search_parameters(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
     pattern: str = Path(..., description="Search pattern")
 ):
     """Search for parameters by name pattern"""
-    try:
-        track_index = track_number - 1
-        parameter_mapper = get_parameter_mapper()
-        
-        matches = parameter_mapper.find_parameter_by_pattern(track_index, plugin_id, pattern)
-        
-        results = []
-        for match in matches:
-            results.append({
-                "name": match.parameter_name,
-                "id": match.parameter_id,
-                "type": match.parameter_type,
-                "unit": match.unit,
-                "current_value": match.current_value
-            })
-            
-        logger.info(f"Found {len(results)} parameters matching pattern '{pattern}'")
-        return {
-            "track": track_number,
-            "plugin_id": plugin_id,
-            "pattern": pattern,
-            "matches": results,
-            "count": len(results)
-        }
+    track_index = track_number - 1
+    parameter_mapper = get_parameter_mapper()
+    
+    matches = parameter_mapper.find_parameter_by_pattern(track_index, plugin_id, pattern)
+    
+    results = []
+    for match in matches:
+        results.append({
+            "name": match.parameter_name,
+            "id": match.parameter_id,
+            "type": match.parameter_type,
+            "unit": match.unit,
+            "current_value": match.current_value
+        })
         
-    except Exception as e:
-        logger.error(f"Error searching parameters: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    logger.info("Found %s parameters matching pattern '%s'", len(results), pattern)
+    return {
+        "track": track_number,
+        "plugin_id": plugin_id,
+        "pattern": pattern,
+        "matches": results,
+        "count": len(results)
+    }
 
 @router.get(
     "/track/{track_number}/plugin/{plugin_id}/parameters/suggestions",
     operation_id="get_parameter_suggestions"
 )
+@api_errors
 async def get_parameter_suggestions(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
     input_name: str = Path(..., description="Input parameter name for suggestions")
 ):
     """Get smart parameter name suggestions"""
-    try:
-        track_index = track_number - 1
-        parameter_mapper = get_parameter_mapper()
-        
-        suggestions = parameter_mapper.get_smart_parameter_suggestions(track_index, plugin_id, input_name)
-        
-        logger.info(f"Generated {len(suggestions)} suggestions for input '{input_name}'")
-        return {
-            "track": track_number,
-            "plugin_id": plugin_id,
-            "input_name": input_name,
-            "suggestions": suggestions,
-            "count": len(suggestions)
-        }
-        
-    except Exception as e:
-        logger.error(f"Error getting parameter suggestions: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    track_index = track_number - 1
+    parameter_mapper = get_parameter_mapper()
+    
+    suggestions = parameter_mapper.get_smart_parameter_suggestions(track_index, plugin_id, input_name)
+    
+    logger.info("Generated %s suggestions for input '%s'", len(suggestions), input_name)
+    return {
+        "track": track_number,
+        "plugin_id": plugin_id,
+        "input_name": input_name,
+        "suggestions": suggestions,
+        "count": len(suggestions)
+    }
 
 @router.post(
     "/track/{track_number}/plugin/{plugin_id}/parameter/{parameter_name}/dynamic",
     operation_id="set_dynamic_parameter"
 )
+@api_errors
 async def set_dynamic_parameter(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     plugin_id: int = Path(..., description="Plugin ID (0-based)", ge=0, le=32),
@@ -746,16 +917,18 @@ async def set_dynamic_parameter(
         osc_value = smart_param.to_osc(request.to_dict())
         
         # Send OSC message using discovered parameter ID
-        success = osc_client.set_plugin_parameter(track_index, plugin_id, parameter_id, osc_value)
+        success = await asyncio.to_thread(osc_client.set_plugin_parameter, track_index, plugin_id, parameter_id, osc_value)
         
         if success:
+            invalidate_discovery_cache(track_index, plugin_id)
+            
             # Update cached value
             parameter_mapper.update_parameter_value(track_index, plugin_id, parameter_name, osc_value)
             
             # Convert back to show what was actually set
             actual_value = smart_param.from_osc(osc_value)
             
-            logger.info(f"Dynamic parameter set: track {track_number} plugin {plugin_id} {parameter_name} = {actual_value}")
+            logger.info("Dynamic parameter set: track %s plugin %s %s = %s", track_number, plugin_id, parameter_name, actual_value)
             return {
                 "status": "success",
                 "action": "set_dynamic_parameter",
@@ -771,172 +944,186 @@ async def set_dynamic_parameter(
                 "osc_address": f"/select/plugin/parameter"
             }
         else:
-            logger.error(f"Failed to set dynamic parameter {parameter_name}")
+            logger.error("Failed to set dynamic parameter %s", parameter_name)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to set parameter {parameter_name}"
             )
             
-    except HTTPException:
-        raise
     except ValueError as e:
-        logger.error(f"Dynamic parameter conversion error: {e}")
+        logger.error("Dynamic parameter conversion error: %s", e)
         raise HTTPException(
             status_code=422,
             detail=f"Parameter conversion error: {str(e)}"
         )
-    except Exception as e:
-        logger.error(f"Error in set_dynamic_parameter: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
 
-def _determine_parameter_type_from_info(param_info: Dict[str, Any], value_dict: Dict[str, Any]) -> ParameterType:
-    """Determine parameter type based on discovered parameter info and provided values"""
+def _canon(name: str) -> str:
+    """Lowercase a parameter or plugin name for lookups
     
-    # First check what type of value was provided
-    if "db" in value_dict:
-        if "threshold" in param_info['name'].lower():
-            return ParameterType.DB_THRESHOLD
-        else:
-            return ParameterType.DB_GAIN
-    elif "hz" in value_dict:
-        return ParameterType.FREQUENCY
-    elif "ratio" in value_dict:
-        return ParameterType.RATIO
-    elif "percent" in value_dict:
-        return ParameterType.PERCENTAGE
-    elif "ms" in value_dict:
-        return ParameterType.TIME_MS
-    elif "sec" in value_dict:
-        return ParameterType.TIME_SEC
-    elif "q" in value_dict:
-        return ParameterType.Q_FACTOR
-    elif "value" in value_dict:
-        return ParameterType.RAW
+    Names are usually ASCII and already lowercase, which is returned as is.
+    """
+    return name if name.isascii() and name.islower() else name.lower()
+
+# Value unit key -> parameter type, in the priority used when a request
+# carries several units. "db" is resolved by name (threshold vs gain).
+_UNIT_TO_TYPE = {
+    "db": None,
+    "hz": ParameterType.FREQUENCY,
+    "ratio": ParameterType.RATIO,
+    "percent": ParameterType.PERCENTAGE,
+    "ms": ParameterType.TIME_MS,
+    "sec": ParameterType.TIME_SEC,
+    "q": ParameterType.Q_FACTOR,
+    "value": ParameterType.RAW
+}
+_UNIT_KEYS = frozenset(_UNIT_TO_TYPE)
+_UNIT_PRIORITY = {key: i for i, key in enumerate(_UNIT_TO_TYPE)}
+
+# Discovered parameter type -> parameter type
+_DISCOVERED_TYPE_TO_TYPE = {
+    "frequency": ParameterType.FREQUENCY,
+    "gain": ParameterType.DB_GAIN,
+    "threshold": ParameterType.DB_THRESHOLD,
+    "ratio": ParameterType.RATIO,
+    "time": ParameterType.TIME_MS
+}
+
+# Parameter name keyword -> parameter type, checked in order
+_NAME_KEYWORD_TO_TYPE = (
+    ("threshold", ParameterType.DB_THRESHOLD),
+    ("gain", ParameterType.DB_GAIN),
+    ("freq", ParameterType.FREQUENCY),
+    ("ratio", ParameterType.RATIO),
+    ("attack", ParameterType.TIME_MS),
+    ("release", ParameterType.TIME_MS)
+)
+
+def _resolve_parameter_type(
+    name_lower: str,
+    value_dict: Dict[str, Any],
+    discovered_type: Optional[str] = None
+) -> ParameterType:
+    """Determine parameter type from the provided value's unit
+    
+    Without a unit, falls back to the discovered parameter type when one is
+    given, otherwise to keywords in the (lowercased) parameter name.
+    """
+    key = None
+    if len(value_dict) == 1:
+        # Common case: a single unit such as {"db": -12.0}
+        key = next(iter(value_dict))
+        if key not in _UNIT_KEYS:
+            key = None
     else:
-        # Fallback to parameter type from discovery
-        param_type = param_info.get('type', 'generic')
-        if param_type == 'frequency':
-            return ParameterType.FREQUENCY
-        elif param_type == 'gain' or param_type == 'threshold':
-            return ParameterType.DB_GAIN if param_type == 'gain' else ParameterType.DB_THRESHOLD
-        elif param_type == 'ratio':
-            return ParameterType.RATIO
-        elif param_type == 'time':
-            return ParameterType.TIME_MS
-        else:
-            return ParameterType.RAW
+        hit = _UNIT_KEYS.intersection(value_dict)
+        if hit:
+            key = min(hit, key=_UNIT_PRIORITY.__getitem__)
+    
+    if key == "db":
+        return ParameterType.DB_THRESHOLD if "threshold" in name_lower else ParameterType.DB_GAIN
+    if key is not None:
+        return _UNIT_TO_TYPE[key]
+    
+    if discovered_type is not None:
+        return _DISCOVERED_TYPE_TO_TYPE.get(discovered_type, ParameterType.RAW)
+    for keyword, keyword_type in _NAME_KEYWORD_TO_TYPE:
+        if keyword in name_lower:
+            return keyword_type
+    return ParameterType.RAW
+
+def _determine_parameter_type_from_info(param_info: Dict[str, Any], value_dict: Dict[str, Any]) -> ParameterType:
+    """Determine parameter type based on discovered parameter info and provided values"""
+    return _resolve_parameter_type(_canon(param_info['name']), value_dict, param_info.get('type', 'generic'))
 
 def _determine_parameter_type(parameter_name: str, value_dict: Dict[str, Any]) -> ParameterType:
     """Determine parameter type based on parameter name and available values"""
-    
-    # Check what type of value was provided
-    if "db" in value_dict:
-        if "threshold" in parameter_name.lower():
-            return ParameterType.DB_THRESHOLD
-        else:
-            return ParameterType.DB_GAIN
-    elif "hz" in value_dict:
-        return ParameterType.FREQUENCY
-    elif "ratio" in value_dict:
-        return ParameterType.RATIO
-    elif "percent" in value_dict:
-        return ParameterType.PERCENTAGE
-    elif "ms" in value_dict:
-        return ParameterType.TIME_MS
-    elif "sec" in value_dict:
-        return ParameterType.TIME_SEC
-    elif "q" in value_dict:
-        return ParameterType.Q_FACTOR
-    elif "value" in value_dict:
-        return ParameterType.RAW
-    else:
-        # Fallback based on parameter name
-        param_lower = parameter_name.lower()
-        if "threshold" in param_lower:
-            return ParameterType.DB_THRESHOLD
-        elif "gain" in param_lower:
-            return ParameterType.DB_GAIN
-        elif "freq" in param_lower:
-            return ParameterType.FREQUENCY
-        elif "ratio" in param_lower:
-            return ParameterType.RATIO
-        elif "attack" in param_lower or "release" in param_lower:
-            return ParameterType.TIME_MS
-        else:
-            return ParameterType.RAW
+    return _resolve_parameter_type(_canon(parameter_name), value_dict)
+
+# Common parameter names -> parameter IDs (simplified mapping)
+_PARAMETER_ID_MAP = {
+    "threshold": 1,
+    "ratio": 2,
+    "attack": 3,
+    "release": 4,
+    "gain": 1,
+    "frequency": 1,
+    "freq": 1,
+    "low_freq": 1,
+    "mid_freq": 2,
+    "high_freq": 3,
+    "low_gain": 2,
+    "mid_gain": 3,
+    "high_gain": 4,
+    "q": 4,
+    "bandwidth": 5
+}
 
 def _get_parameter_id(parameter_name: str) -> int:
     """Get parameter ID for parameter name (simplified mapping)"""
+    return _get_parameter_id_lc(_canon(parameter_name))
+
+def _get_parameter_id_lc(name_lower: str) -> int:
+    """_get_parameter_id for a name the caller has already lowercased"""
     # In a real implementation, this would query Ardour for parameter mappings
     # For now, use a simple mapping based on common parameter names
-    parameter_map = {
-        "threshold": 1,
-        "ratio": 2,
-        "attack": 3,
-        "release": 4,
-        "gain": 1,
-        "frequency": 1,
-        "freq": 1,
-        "low_freq": 1,
-        "mid_freq": 2,
-        "high_freq": 3,
-        "low_gain": 2,
-        "mid_gain": 3,
-        "high_gain": 4,
-        "q": 4,
-        "bandwidth": 5
-    }
-    
-    return parameter_map.get(parameter_name.lower(), 1)
+    return _PARAMETER_ID_MAP.get(name_lower, 1)
 
+# Plugin name keyword -> plugin type, checked in order (first match wins)
+_PLUGIN_KEYWORDS = (
+    ("compressor", "compressor"), ("comp", "compressor"),
+    ("eq", "eq"), ("equalizer", "eq"),
+    ("reverb", "reverb"), ("verb", "reverb"),
+    ("delay", "delay"), ("echo", "delay"),
+    ("limiter", "limiter"), ("limit", "limiter"),
+    ("gate", "gate"), ("expander", "gate"),
+    ("distortion", "distortion"), ("overdrive", "distortion"),
+    ("chorus", "modulation"), ("flanger", "modulation"), ("phaser", "modulation"),
+    ("filter", "filter"),
+    ("synth", "instrument")
+)
+
+@lru_cache(maxsize=1024)
 def _determine_plugin_type(plugin_name: str) -> str:
     """Determine plugin type based on plugin name"""
-    name_lower = plugin_name.lower()
-    
-    if 'compressor' in name_lower or 'comp' in name_lower:
-        return 'compressor'
-    elif 'eq' in name_lower or 'equalizer' in name_lower:
-        return 'eq'
-    elif 'reverb' in name_lower or 'verb' in name_lower:
-        return 'reverb'
-    elif 'delay' in name_lower or 'echo' in name_lower:
-        return 'delay'
-    elif 'limiter' in name_lower or 'limit' in name_lower:
-        return 'limiter'
-    elif 'gate' in name_lower or 'expander' in name_lower:
-        return 'gate'
-    elif 'distortion' in name_lower or 'overdrive' in name_lower:
-        return 'distortion'
-    elif 'chorus' in name_lower or 'flanger' in name_lower or 'phaser' in name_lower:
-        return 'modulation'
-    elif 'filter' in name_lower:
-        return 'filter'
-    elif 'synth' in name_lower:
-        return 'instrument'
-    else:
-        return 'unknown'
+    name_lower = _canon(plugin_name)
+    for keyword, plugin_type in _PLUGIN_KEYWORDS:
+        if keyword in name_lower:
+            return plugin_type
+    return 'unknown'
         
+def _scan_etag(tracks_data: Dict[str, list]) -> str:
+    """Build a strong ETag from the scanned tracks (plugin types derive from them)"""
+    payload = json.dumps(tracks_data, sort_keys=True, separators=(",", ":")).encode()
+    return f'"{hashlib.blake2b(payload, digest_size=8).hexdigest()}"'
+
+def _parameter_dict(param) -> Dict[str, Any]:
+    """Convert a discovered listener parameter to the ParameterInfo shape"""
+    return {
+        "id": param.id,
+        "name": param.name,
+        "value_raw": param.value,
+        "value_display": _format_parameter_value(param.value, param.type, param.unit),
+        "min_value": param.min_value,
+        "max_value": param.max_value,
+        "unit": param.unit
+    }
+
+# param_type -> (scale, offset, bound formatter) mapping normalized 0-1 values
+# onto their display range as value * scale + offset
+_PARAM_FORMAT = {
+    'frequency': (20000 - 20, 20, "{:.1f} Hz".format),      # 20 Hz - 20 kHz
+    'gain': (12 - (-60), -60, "{:.1f} dB".format),          # -60 dB - +12 dB
+    'threshold': (12 - (-60), -60, "{:.1f} dB".format),     # -60 dB - +12 dB
+    'ratio': (20 - 1, 1, "{:.1f}:1".format),                # 1:1 - 20:1
+    'time': (1000 - 0.1, 0.1, "{:.1f} ms".format),          # 0.1 ms - 1000 ms
+}
+
 def _format_parameter_value(value: float, param_type: str, unit: str) -> str:
     """Format parameter value for display"""
-    if param_type == 'frequency':
-        # Convert 0-1 to Hz range (20-20000)
-        hz_value = 20 + (value * (20000 - 20))
-        return f"{hz_value:.1f} Hz"
-    elif param_type == 'gain' or param_type == 'threshold':
-        # Convert 0-1 to dB range (-60 to +12)
-        db_value = -60 + (value * (12 - (-60)))
-        return f"{db_value:.1f} dB"
-    elif param_type == 'ratio':
-        # Convert 0-1 to ratio (1:1 to 20:1)
-        ratio_value = 1 + (value * (20 - 1))
-        return f"{ratio_value:.1f}:1"
-    elif param_type == 'time':
-        # Convert 0-1 to ms range (0.1 to 1000)
-        ms_value = 0.1 + (value * (1000 - 0.1))
-        return f"{ms_value:.1f} ms"
+    entry = _PARAM_FORMAT.get(param_type)
+    if entry is not None:
+        scale, offset, fmt = entry
+        return fmt(value * scale + offset)
     elif unit:
         return f"{value:.2f} {unit}"
     else:
@@ -3,331 +3,208 @@ Recording control endpoints for Ardour MCP Server
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, Path
-from pydantic import BaseModel, Field
+from fastapi import APIRouter, Path
 from mcp_server.osc_client import get_osc_client
+from mcp_server.responses import FastJSONResponse
+from mcp_server.api.errors import safe_endpoint, send_failed
+from mcp_server.api.models import BooleanRequest
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/recording", tags=["recording"])
+router = APIRouter(prefix="/recording", tags=["recording"], default_response_class=FastJSONResponse)
 
-class RecordingEnableRequest(BaseModel):
-    """Request model for recording enable control"""
-    enabled: bool = Field(..., description="True to enable recording, False to disable")
+# Constant parts of the success responses; handlers only add the dynamic fields
+_ACTION_MSG = {True: "enabled", False: "disabled"}
 
-class PunchRecordingRequest(BaseModel):
-    """Request model for punch recording control"""
-    enabled: bool = Field(..., description="True to enable punch recording, False to disable")
+_ENABLE_OK = {"status": "success", "action": "set_recording_enable", "osc_address": "/rec_enable_toggle"}
+_DISABLE_OK = {
+    "status": "success",
+    "action": "disable_recording",
+    "enabled": False,
+    "message": "Global recording disabled",
+    "osc_address": "/rec_enable_toggle"
+}
+_PUNCH_IN_OK = {"status": "success", "action": "set_punch_in", "osc_address": "/toggle_punch_in"}
+_PUNCH_OUT_OK = {"status": "success", "action": "set_punch_out", "osc_address": "/toggle_punch_out"}
+_INPUT_MONITOR_OK = {"status": "success", "action": "set_global_input_monitor", "osc_address": "/toggle_monitor_input"}
+_TRACK_INPUT_MONITOR_OK = {"status": "success", "action": "set_track_input_monitor"}
+_START_OK = {
+    "status": "success",
+    "action": "start_recording",
+    "message": "Recording started (enabled + transport play)",
+    "osc_commands": ("/rec_enable_toggle", "/transport_play")
+}
+_STOP_OK = {
+    "status": "success",
+    "action": "stop_recording",
+    "message": "Recording stopped (transport stop + disabled)",
+    "osc_commands": ("/transport_stop", "/rec_enable_toggle")
+}
 
-class InputMonitorRequest(BaseModel):
-    """Request model for input monitoring control"""
-    enabled: bool = Field(..., description="True to enable input monitoring, False to disable")
+# In a real implementation, this would parse actual status from Ardour
+# For now, return example status
+_EXAMPLE_STATUS = {
+    "recording_enabled": False,
+    "punch_in_enabled": False,
+    "punch_out_enabled": False,
+    "input_monitoring_enabled": False,
+    "currently_recording": False,
+    "armed_tracks": (),
+    "message": "Recording status retrieved",
+    "osc_address": "/recording/status"
+}
 
 @router.post(
     "/enable",
     operation_id="set_recording_enable"
 )
-async def set_recording_enable(request: RecordingEnableRequest):
+@safe_endpoint
+async def set_recording_enable(request: BooleanRequest):
     """Enable or disable global recording"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_recording_enable(request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Global recording {action}")
-            return {
-                "status": "success",
-                "action": "set_recording_enable",
-                "enabled": request.enabled,
-                "message": f"Global recording {action}",
-                "osc_address": "/rec_enable_toggle"
-            }
-        else:
-            logger.error("Failed to set global recording enable")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to set global recording enable"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_recording_enable: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = await osc_client.set_recording_enable_async(request.enabled)
+    if not success:
+        return send_failed("Failed to set global recording enable")
+    
+    action = _ACTION_MSG[request.enabled]
+    logger.info("Global recording %s", action)
+    return {**_ENABLE_OK, "enabled": request.enabled, "message": f"Global recording {action}"}
 
 @router.post(
     "/disable",
     operation_id="disable_recording"
 )
+@safe_endpoint
 async def disable_recording():
     """Disable global recording (convenience endpoint)"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_recording_enable(False)
-        
-        if success:
-            logger.info("Global recording disabled")
-            return {
-                "status": "success",
-                "action": "disable_recording",
-                "enabled": False,
-                "message": "Global recording disabled",
-                "osc_address": "/rec_enable_toggle"
-            }
-        else:
-            logger.error("Failed to disable global recording")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to disable global recording"
-            )
-    except Exception as e:
-        logger.error(f"Error in disable_recording: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = await osc_client.set_recording_enable_async(False)
+    if not success:
+        return send_failed("Failed to disable global recording")
+    
+    logger.info("Global recording disabled")
+    return _DISABLE_OK
 
 @router.post(
     "/punch-in",
     operation_id="set_punch_in"
 )
-async def set_punch_in(request: PunchRecordingRequest):
+@safe_endpoint
+async def set_punch_in(request: BooleanRequest):
     """Enable or disable punch-in recording"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_punch_in(request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Punch-in recording {action}")
-            return {
-                "status": "success",
-                "action": "set_punch_in",
-                "enabled": request.enabled,
-                "message": f"Punch-in recording {action}",
-                "osc_address": "/toggle_punch_in"
-            }
-        else:
-            logger.error("Failed to set punch-in recording")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to set punch-in recording"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_punch_in: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = await osc_client.set_punch_in_async(request.enabled)
+    if not success:
+        return send_failed("Failed to set punch-in recording")
+    
+    action = _ACTION_MSG[request.enabled]
+    logger.info("Punch-in recording %s", action)
+    return {**_PUNCH_IN_OK, "enabled": request.enabled, "message": f"Punch-in recording {action}"}
 
 @router.post(
     "/punch-out",
     operation_id="set_punch_out"
 )
-async def set_punch_out(request: PunchRecordingRequest):
+@safe_endpoint
+async def set_punch_out(request: BooleanRequest):
     """Enable or disable punch-out recording"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_punch_out(request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Punch-out recording {action}")
-            return {
-                "status": "success",
-                "action": "set_punch_out",
-                "enabled": request.enabled,
-                "message": f"Punch-out recording {action}",
-                "osc_address": "/toggle_punch_out"
-            }
-        else:
-            logger.error("Failed to set punch-out recording")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to set punch-out recording"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_punch_out: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = await osc_client.set_punch_out_async(request.enabled)
+    if not success:
+        return send_failed("Failed to set punch-out recording")
+    
+    action = _ACTION_MSG[request.enabled]
+    logger.info("Punch-out recording %s", action)
+    return {**_PUNCH_OUT_OK, "enabled": request.enabled, "message": f"Punch-out recording {action}"}
 
 @router.post(
     "/input-monitor",
     operation_id="set_global_input_monitor"
 )
-async def set_global_input_monitor(request: InputMonitorRequest):
+@safe_endpoint
+async def set_global_input_monitor(request: BooleanRequest):
     """Enable or disable global input monitoring"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_global_input_monitor(request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Global input monitoring {action}")
-            return {
-                "status": "success",
-                "action": "set_global_input_monitor",
-                "enabled": request.enabled,
-                "message": f"Global input monitoring {action}",
-                "osc_address": "/toggle_monitor_input"
-            }
-        else:
-            logger.error("Failed to set global input monitoring")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to set global input monitoring"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_global_input_monitor: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = await osc_client.set_global_input_monitor_async(request.enabled)
+    if not success:
+        return send_failed("Failed to set global input monitoring")
+    
+    action = _ACTION_MSG[request.enabled]
+    logger.info("Global input monitoring %s", action)
+    return {**_INPUT_MONITOR_OK, "enabled": request.enabled, "message": f"Global input monitoring {action}"}
 
 @router.post(
     "/track/{track_number}/input-monitor",
     operation_id="set_track_input_monitor"
 )
+@safe_endpoint
 async def set_track_input_monitor(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
-    request: InputMonitorRequest = ...
+    request: BooleanRequest = ...
 ):
     """Enable or disable input monitoring for specific track"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number - 1
-        
-        success = osc_client.set_track_input_monitor(track_index, request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Track {track_number} input monitoring {action}")
-            return {
-                "status": "success",
-                "action": "set_track_input_monitor",
-                "track": track_number,
-                "enabled": request.enabled,
-                "message": f"Track {track_number} input monitoring {action}",
-                "osc_address": f"/strip/{track_index}/monitor_input"
-            }
-        else:
-            logger.error(f"Failed to set input monitoring for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set input monitoring for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_track_input_monitor: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    track_index = track_number - 1
+    
+    success = await osc_client.set_track_input_monitor_async(track_index, request.enabled)
+    if not success:
+        return send_failed(f"Failed to set input monitoring for track {track_number}")
+    
+    action = _ACTION_MSG[request.enabled]
+    logger.info("Track %s input monitoring %s", track_number, action)
+    return {
+        **_TRACK_INPUT_MONITOR_OK,
+        "track": track_number,
+        "enabled": request.enabled,
+        "message": f"Track {track_number} input monitoring {action}",
+        "osc_address": f"/strip/{track_index}/monitor_input"
+    }
 
 @router.get(
     "/status",
     operation_id="get_recording_status"
 )
+@safe_endpoint
 async def get_recording_status():
     """Get current recording status"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.get_recording_status()
-        
-        if success:
-            # In a real implementation, this would parse actual status from Ardour
-            # For now, return example status
-            status = {
-                "recording_enabled": False,
-                "punch_in_enabled": False,
-                "punch_out_enabled": False,
-                "input_monitoring_enabled": False,
-                "currently_recording": False,
-                "armed_tracks": [],
-                "message": "Recording status retrieved",
-                "osc_address": "/recording/status"
-            }
-            
-            logger.info("Recording status retrieved")
-            return status
-        else:
-            logger.error("Failed to get recording status")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to get recording status"
-            )
-    except Exception as e:
-        logger.error(f"Error in get_recording_status: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = await osc_client.get_recording_status_async()
+    if not success:
+        return send_failed("Failed to get recording status")
+    
+    logger.info("Recording status retrieved")
+    return _EXAMPLE_STATUS
 
 @router.post(
     "/start",
     operation_id="start_recording"
 )
+@safe_endpoint
 async def start_recording():
     """Start recording (convenience endpoint)"""
-    try:
-        osc_client = get_osc_client()
-        
-        # Enable recording and start transport
-        enable_success = osc_client.set_recording_enable(True)
-        start_success = osc_client.transport_play()
-        
-        if enable_success and start_success:
-            logger.info("Recording started")
-            return {
-                "status": "success",
-                "action": "start_recording",
-                "message": "Recording started (enabled + transport play)",
-                "osc_commands": ["/rec_enable_toggle", "/transport_play"]
-            }
-        else:
-            logger.error("Failed to start recording")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to start recording"
-            )
-    except Exception as e:
-        logger.error(f"Error in start_recording: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    
+    # Enable recording and start transport, sent as one OSC bundle so
+    # the pair cannot be reordered or half-applied
+    success = await osc_client.start_recording_async()
+    if not success:
+        return send_failed("Failed to start recording")
+    
+    logger.info("Recording started")
+    return _START_OK
 
 @router.post(
     "/stop",
     operation_id="stop_recording"
 )
+@safe_endpoint
 async def stop_recording():
     """Stop recording (convenience endpoint)"""
-    try:
-        osc_client = get_osc_client()
-        
-        # Stop transport and disable recording
-        stop_success = osc_client.transport_stop()
-        disable_success = osc_client.set_recording_enable(False)
-        
-        if stop_success and disable_success:
-            logger.info("Recording stopped")
-            return {
-                "status": "success",
-                "action": "stop_recording",
-                "message": "Recording stopped (transport stop + disabled)",
-                "osc_commands": ["/transport_stop", "/rec_enable_toggle"]
-            }
-        else:
-            logger.error("Failed to stop recording")
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to stop recording"
-            )
-    except Exception as e:
-        logger.error(f"Error in stop_recording: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
\ No newline at end of file
+    osc_client = get_osc_client()
+    
+    # Stop transport and disable recording in one OSC bundle
+    success = await osc_client.stop_recording_async()
+    if not success:
+        return send_failed("Failed to stop recording")
+    
+    logger.info("Recording stopped")
+    return _STOP_OK
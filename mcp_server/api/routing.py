@@ -0,0 +1,50 @@
+"""
+Route classes for Ardour MCP Server API routers
+"""
+
+import inspect
+from typing import Any, Callable, Coroutine
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.routing import APIRoute
+from starlette.requests import Request
+from starlette.responses import Response
+
+class FastRoute(APIRoute):
+    """APIRoute that calls parameterless endpoints directly
+    
+    Endpoints that take no arguments, have no dependencies and no response
+    model skip FastAPI's request parsing and dependency resolution; their
+    result is wrapped in the route's response class as is. Every other
+    endpoint is handled by the standard APIRoute pipeline.
+    
+    Dependencies added when the router is included are not run for the
+    direct endpoints, so only use it for routers included without any.
+    """
+    
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        if not self._is_parameterless():
+            return super().get_route_handler()
+        
+        endpoint = self.dependant.call
+        response_class = self.response_class
+        if isinstance(response_class, DefaultPlaceholder):
+            response_class = response_class.value
+        status_code = self.status_code or 200
+        
+        async def app(request: Request) -> Response:
+            result = await endpoint()
+            if isinstance(result, Response):
+                return result
+            return response_class(content=result, status_code=status_code)
+        
+        return app
+    
+    def _is_parameterless(self) -> bool:
+        """True if the endpoint needs nothing from the request"""
+        dependant = self.dependant
+        return (
+            inspect.iscoroutinefunction(dependant.call)
+            and not inspect.signature(dependant.call).parameters
+            and not dependant.dependencies
+            and self.response_field is None
+        )
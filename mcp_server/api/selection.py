@@ -3,15 +3,98 @@ Selection control endpoints for Ardour MCP Server
 Implements Selected Strip Operations and Selected Plugin Operations
 """
 
+import json
 import logging
-from typing import Optional, Dict, Any, List
-from fastapi import APIRouter, HTTPException, Path, Query
+import re
+from typing import Optional, Dict, Any, List, Tuple
+from fastapi import APIRouter, Depends, Header, Path, Query, Request, Response
 from pydantic import BaseModel, Field
-from mcp_server.osc_client import get_osc_client
+from pythonosc.osc_message import OscMessage
+from starlette.convertors import StringConvertor, register_url_convertor
+from mcp_server.osc_client import get_osc_client, encode_message, encode_bundle
 from mcp_server.selection_manager import get_selection_manager, SelectionType
+from mcp_server.responses import FastJSONResponse, wants_minimal
+from mcp_server.api.errors import api_errors, send_failed
+from mcp_server.api.models import BooleanRequest, parse_json_body
+from mcp_server.api.routing import FastRoute
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/selection", tags=["selection"])
+router = APIRouter(
+    prefix="/selection",
+    tags=["selection"],
+    default_response_class=FastJSONResponse,
+    route_class=FastRoute
+)
+
+# OSC argument for a bool (indexed by the bool itself)
+_BOOL_INT = (0, 1)
+
+# Static fields of each endpoint's success response, merged with the request-specific ones
+_STRIP_SELECT_OK = {"status": "success", "action": "strip_select", "osc_address": "/strip/select"}
+_STRIP_EXPAND_OK = {"status": "success", "action": "strip_expand", "osc_address": "/strip/expand"}
+_SET_EXPANSION_MODE_OK = {"status": "success", "action": "set_expansion_mode", "osc_address": "/select/expand"}
+_HIDE_STRIP_OK = {"status": "success", "action": "hide_strip", "osc_address": "/select/hide"}
+_SET_STRIP_NAME_OK = {"status": "success", "action": "set_strip_name", "osc_address": "/select/name"}
+_SET_STRIP_COMMENT_OK = {
+    "status": "success",
+    "action": "set_strip_comment",
+    "message": "Selected strip comment set",
+    "osc_address": "/select/comment"
+}
+_SET_STRIP_GROUP_OK = {"status": "success", "action": "set_strip_group", "osc_address": "/select/group"}
+_SET_GAIN_OK = {"status": "success", "action": "set_gain", "osc_address": "/select/gain"}
+_SET_FADER_OK = {"status": "success", "action": "set_fader", "osc_address": "/select/fader"}
+_SET_DB_DELTA_OK = {"status": "success", "action": "set_db_delta", "osc_address": "/select/db_delta"}
+_SET_VCA_OK = {"status": "success", "action": "set_vca", "osc_address": "/select/vca"}
+_TOGGLE_VCA_OK = {"status": "success", "action": "toggle_vca", "osc_address": "/select/vca/toggle"}
+_SET_TRIM_OK = {"status": "success", "action": "set_trim", "osc_address": "/select/trimdB"}
+_SET_SEND_GAIN_OK = {"status": "success", "action": "set_send_gain", "osc_address": "/select/send_gain"}
+_SET_SEND_FADER_OK = {"status": "success", "action": "set_send_fader", "osc_address": "/select/send_fader"}
+_SET_SEND_ENABLE_OK = {"status": "success", "action": "set_send_enable", "osc_address": "/select/send_enable"}
+_SET_SEND_PAGE_OK = {"status": "success", "action": "set_send_page", "osc_address": "/select/send_page"}
+_SELECT_PLUGIN_OK = {"status": "success", "action": "select_plugin", "osc_address": "/select/plugin"}
+_SET_PLUGIN_PAGE_OK = {"status": "success", "action": "set_plugin_page", "osc_address": "/select/plug_page"}
+_SET_PLUGIN_ACTIVATE_OK = {
+    "status": "success",
+    "action": "set_plugin_activate",
+    "osc_address": "/select/plugin/activate"
+}
+_SET_PLUGIN_PARAMETER_OK = {
+    "status": "success",
+    "action": "set_plugin_parameter",
+    "osc_address": "/select/plugin/parameter"
+}
+_SET_AUTOMATION_OK = {"status": "success", "action": "set_automation"}
+_SET_TOUCH_OK = {"status": "success", "action": "set_touch"}
+
+# Responses without request-specific fields, serialized once
+_SPILL_STRIPS_BODY = json.dumps({
+    "status": "success",
+    "action": "spill_strips",
+    "message": "Strips spilled for selected strip",
+    "osc_address": "/select/spill"
+}, separators=(",", ":")).encode()
+_CLEAR_SELECTION_BODY = json.dumps({
+    "status": "success",
+    "action": "clear_selection",
+    "message": "Selection cleared"
+}, separators=(",", ":")).encode()
+_PLUGIN_PAGE_IGNORED_BODY = json.dumps({
+    "status": "ignored",
+    "message": "Direction=0 is ignored"
+}, separators=(",", ":")).encode()
+
+# Names of Ardour's automation modes, indexed by mode number
+_AUTOMATION_MODES = ("Manual", "Play", "Write", "Touch")
+
+# dB ranges accepted by Ardour
+_GAIN_DB_RANGE = (-193, 6)
+_TRIM_DB_RANGE = (-20, 20)
+
+def _db_field(description: str, db_range: Tuple[float, float]):
+    """Field for a dB value, rejected with a 422 outside db_range"""
+    ge, le = db_range
+    return Field(..., description=description, ge=ge, le=le)
 
 # Request Models
 
@@ -19,6 +102,7 @@ class StripSelectRequest(BaseModel):
     """Request model for strip selection"""
     strip_id: int = Field(..., description="Strip ID to select", ge=0)
     select: bool = Field(True, description="True to select, False ignored")
+    expand: Optional[bool] = Field(None, description="Also expand (True) or contract (False) the strip in the same OSC bundle")
 
 class StripExpandRequest(BaseModel):
     """Request model for strip expansion"""
@@ -47,15 +131,11 @@ class GroupRequest(BaseModel):
 
 class GroupStateRequest(BaseModel):
     """Request model for group state"""
-    state: int = Field(..., description="Group state (0 or 1)")
-
-class BooleanRequest(BaseModel):
-    """Request model for boolean operations"""
-    enabled: bool = Field(..., description="True to enable, False to disable")
+    state: bool = Field(..., description="Group state (true/1 or false/0)")
 
 class GainRequest(BaseModel):
     """Request model for gain control"""
-    gain_db: float = Field(..., description="Gain in dB", ge=-193, le=6)
+    gain_db: float = _db_field("Gain in dB", _GAIN_DB_RANGE)
 
 class FaderRequest(BaseModel):
     """Request model for fader control"""
@@ -84,7 +164,7 @@ class TouchRequest(BaseModel):
 
 class TrimRequest(BaseModel):
     """Request model for trim control"""
-    trim_db: float = Field(..., description="Trim in dB", ge=-20, le=20)
+    trim_db: float = _db_field("Trim in dB", _TRIM_DB_RANGE)
 
 class PanRequest(BaseModel):
     """Request model for pan control"""
@@ -93,7 +173,7 @@ class PanRequest(BaseModel):
 class SendGainRequest(BaseModel):
     """Request model for send gain control"""
     send_id: int = Field(..., description="Send ID", ge=0)
-    gain_db: float = Field(..., description="Send gain in dB", ge=-193, le=6)
+    gain_db: float = _db_field("Send gain in dB", _GAIN_DB_RANGE)
 
 class SendFaderRequest(BaseModel):
     """Request model for send fader control"""
@@ -122,1290 +202,803 @@ class PluginParameterRequest(BaseModel):
     parameter_id: int = Field(..., description="Parameter ID (1-based)", ge=1)
     value: float = Field(..., description="Parameter value", ge=0.0, le=1.0)
 
+def _json_body(model: type):
+    """Dependency validating the raw request body into `model` (see parse_json_body)"""
+    async def parse(request: Request):
+        return parse_json_body(model, await request.body())
+    
+    return parse
+
+def _json_body_openapi(model: type) -> Dict[str, Any]:
+    """openapi_extra documenting `model` as the JSON request body of a _json_body route"""
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": model.model_json_schema()}}
+        }
+    }
+
 # API Endpoints
 
 @router.get(
     "/current",
     operation_id="get_current_selection"
 )
+@api_errors
 async def get_current_selection():
     """Get current selection state"""
-    try:
-        selection_manager = get_selection_manager()
-        return {
-            "status": "success",
-            "selection": selection_manager.to_dict()
-        }
-    except Exception as e:
-        logger.error(f"Error getting current selection: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    selection_manager = get_selection_manager()
+    return Response(
+        content=b'{"status":"success","selection":' + selection_manager.to_json_bytes() + b'}',
+        media_type="application/json"
+    )
 
 @router.post(
     "/strip/select",
     operation_id="select_strip"
 )
+@api_errors
 async def select_strip(request: StripSelectRequest):
     """Select a strip (GUI selection)"""
-    try:
-        if not request.select:
-            # 0 is ignored per Ardour spec
-            return {"status": "ignored", "message": "Select=0 is ignored"}
-        
-        selection_manager = get_selection_manager()
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/strip/select", request.strip_id, 1)
-        
-        if success:
-            # Update selection state
-            selection_manager.select_strip(request.strip_id, force_gui_selection=True)
-            
-            logger.info(f"Strip {request.strip_id} selected")
-            return {
-                "status": "success",
-                "action": "strip_select",
-                "strip_id": request.strip_id,
-                "message": f"Strip {request.strip_id} selected (GUI selection and expanded)",
-                "osc_address": "/strip/select"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in select_strip: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    if not request.select:
+        # 0 is ignored per Ardour spec
+        return {"status": "ignored", "message": "Select=0 is ignored"}
+    
+    selection_manager = get_selection_manager()
+    osc_client = get_osc_client()
+    
+    # Send OSC message, bundled with the expansion change when one is requested
+    if request.expand is None:
+        success = osc_client.queue_message("/strip/select", request.strip_id, 1)
+    else:
+        success = osc_client.queue_packet(encode_bundle([
+            ("/strip/select", (request.strip_id, 1)),
+            ("/strip/expand", (request.strip_id, _BOOL_INT[request.expand]))
+        ]))
+    if not success:
+        return send_failed()
+    
+    # Update selection state
+    selection_manager.select_strip(request.strip_id, force_gui_selection=True)
+    
+    logger.info("Strip %s selected", request.strip_id)
+    response = {
+        **_STRIP_SELECT_OK,
+        "strip_id": request.strip_id,
+        "message": f"Strip {request.strip_id} selected (GUI selection and expanded)"
+    }
+    if request.expand is not None:
+        selection_manager.expand_strip(request.strip_id, request.expand)
+        action = "expanded" if request.expand else "contracted"
+        response["expanded"] = request.expand
+        response["message"] = f"Strip {request.strip_id} selected and {action}"
+    return response
 
 @router.post(
     "/strip/expand",
     operation_id="expand_strip"
 )
+@api_errors
 async def expand_strip(request: StripExpandRequest):
     """Expand a strip (local expansion)"""
-    try:
-        selection_manager = get_selection_manager()
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/strip/expand", request.strip_id, 1 if request.expand else 0)
-        
-        if success:
-            # Update selection state
-            selection_manager.expand_strip(request.strip_id, request.expand)
-            
-            action = "expanded" if request.expand else "contracted"
-            logger.info(f"Strip {request.strip_id} {action}")
-            return {
-                "status": "success",
-                "action": "strip_expand",
-                "strip_id": request.strip_id,
-                "expanded": request.expand,
-                "message": f"Strip {request.strip_id} {action}",
-                "osc_address": "/strip/expand"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in expand_strip: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    selection_manager = get_selection_manager()
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/strip/expand", request.strip_id, _BOOL_INT[request.expand])
+    if not success:
+        return send_failed()
+    
+    # Update selection state
+    selection_manager.expand_strip(request.strip_id, request.expand)
+    
+    action = "expanded" if request.expand else "contracted"
+    logger.info("Strip %s %s", request.strip_id, action)
+    return {
+        **_STRIP_EXPAND_OK,
+        "strip_id": request.strip_id,
+        "expanded": request.expand,
+        "message": f"Strip {request.strip_id} {action}"
+    }
 
 @router.post(
     "/expand",
     operation_id="set_expansion_mode"
 )
+@api_errors
 async def set_expansion_mode(request: ExpandRequest):
     """Set expansion mode for current selection"""
-    try:
-        selection_manager = get_selection_manager()
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/select/expand", 1 if request.expand else 0)
-        
-        if success:
-            # Update selection state
-            current_strip = selection_manager.get_selected_strip_id()
-            if current_strip is not None:
-                selection_manager.expand_strip(current_strip, request.expand)
-            
-            mode = "expanded" if request.expand else "select"
-            logger.info(f"Selection mode set to {mode}")
-            return {
-                "status": "success",
-                "action": "set_expansion_mode",
-                "expanded": request.expand,
-                "message": f"Selection mode set to {mode}",
-                "osc_address": "/select/expand"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in set_expansion_mode: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    selection_manager = get_selection_manager()
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/select/expand", _BOOL_INT[request.expand])
+    if not success:
+        return send_failed()
+    
+    # Update selection state
+    current_strip = selection_manager.get_selected_strip_id()
+    if current_strip is not None:
+        selection_manager.expand_strip(current_strip, request.expand)
+    
+    mode = "expanded" if request.expand else "select"
+    logger.info("Selection mode set to %s", mode)
+    return {
+        **_SET_EXPANSION_MODE_OK,
+        "expanded": request.expand,
+        "message": f"Selection mode set to {mode}"
+    }
 
 @router.post(
     "/hide",
     operation_id="hide_strip"
 )
+@api_errors
 async def hide_strip(request: HideRequest):
     """Hide/show selected strip"""
-    try:
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/select/hide", 1 if request.hide else 0)
-        
-        if success:
-            action = "hidden" if request.hide else "shown"
-            logger.info(f"Selected strip {action}")
-            return {
-                "status": "success",
-                "action": "hide_strip",
-                "hidden": request.hide,
-                "message": f"Selected strip {action}",
-                "osc_address": "/select/hide"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in hide_strip: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/select/hide", _BOOL_INT[request.hide])
+    if not success:
+        return send_failed()
+    
+    action = "hidden" if request.hide else "shown"
+    logger.info("Selected strip %s", action)
+    return {
+        **_HIDE_STRIP_OK,
+        "hidden": request.hide,
+        "message": f"Selected strip {action}"
+    }
 
 @router.post(
     "/name",
     operation_id="set_strip_name"
 )
+@api_errors
 async def set_strip_name(request: NameRequest):
     """Set name for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/select/name", request.name)
-        
-        if success:
-            logger.info(f"Selected strip renamed to '{request.name}'")
-            return {
-                "status": "success",
-                "action": "set_strip_name",
-                "name": request.name,
-                "message": f"Selected strip renamed to '{request.name}'",
-                "osc_address": "/select/name"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in set_strip_name: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/select/name", request.name)
+    if not success:
+        return send_failed()
+    
+    logger.info("Selected strip renamed to '%s'", request.name)
+    return {
+        **_SET_STRIP_NAME_OK,
+        "name": request.name,
+        "message": f"Selected strip renamed to '{request.name}'"
+    }
 
 @router.post(
     "/comment",
     operation_id="set_strip_comment"
 )
+@api_errors
 async def set_strip_comment(request: CommentRequest):
     """Set comment for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/select/comment", request.comment)
-        
-        if success:
-            logger.info(f"Selected strip comment set to '{request.comment}'")
-            return {
-                "status": "success",
-                "action": "set_strip_comment",
-                "comment": request.comment,
-                "message": f"Selected strip comment set",
-                "osc_address": "/select/comment"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in set_strip_comment: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/select/comment", request.comment)
+    if not success:
+        return send_failed()
+    
+    logger.info("Selected strip comment set to '%s'", request.comment)
+    return {
+        **_SET_STRIP_COMMENT_OK,
+        "comment": request.comment
+    }
 
 @router.post(
     "/group",
     operation_id="set_strip_group"
 )
+@api_errors
 async def set_strip_group(request: GroupRequest):
     """Set group for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/select/group", request.group_name)
-        
-        if success:
-            logger.info(f"Selected strip assigned to group '{request.group_name}'")
-            return {
-                "status": "success",
-                "action": "set_strip_group",
-                "group_name": request.group_name,
-                "message": f"Selected strip assigned to group '{request.group_name}'",
-                "osc_address": "/select/group"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-            
-    except Exception as e:
-        logger.error(f"Error in set_strip_group: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-# Group state operations
-@router.post(
-    "/group/enable",
-    operation_id="set_group_enable"
-)
-async def set_group_enable(request: GroupStateRequest):
-    """Set group enable state"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/enable", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_enable",
-                "state": request.state,
-                "message": f"Group enable state set to {request.state}",
-                "osc_address": "/select/group/enable"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_enable: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/gain",
-    operation_id="set_group_gain"
-)
-async def set_group_gain(request: GroupStateRequest):
-    """Set group gain sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/gain", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_gain",
-                "state": request.state,
-                "message": f"Group gain sharing set to {request.state}",
-                "osc_address": "/select/group/gain"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_gain: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/relative",
-    operation_id="set_group_relative"
-)
-async def set_group_relative(request: GroupStateRequest):
-    """Set group relative state"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/relative", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_relative",
-                "state": request.state,
-                "message": f"Group relative state set to {request.state}",
-                "osc_address": "/select/group/relative"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_relative: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/mute",
-    operation_id="set_group_mute"
-)
-async def set_group_mute(request: GroupStateRequest):
-    """Set group mute sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/mute", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_mute",
-                "state": request.state,
-                "message": f"Group mute sharing set to {request.state}",
-                "osc_address": "/select/group/mute"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_mute: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/solo",
-    operation_id="set_group_solo"
-)
-async def set_group_solo(request: GroupStateRequest):
-    """Set group solo sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/solo", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_solo",
-                "state": request.state,
-                "message": f"Group solo sharing set to {request.state}",
-                "osc_address": "/select/group/solo"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_solo: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/recenable",
-    operation_id="set_group_recenable"
-)
-async def set_group_recenable(request: GroupStateRequest):
-    """Set group recenable sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/recenable", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_recenable",
-                "state": request.state,
-                "message": f"Group recenable sharing set to {request.state}",
-                "osc_address": "/select/group/recenable"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_recenable: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/select",
-    operation_id="set_group_select"
-)
-async def set_group_select(request: GroupStateRequest):
-    """Set group select sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/select", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_select",
-                "state": request.state,
-                "message": f"Group select sharing set to {request.state}",
-                "osc_address": "/select/group/select"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_select: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/active",
-    operation_id="set_group_active"
-)
-async def set_group_active(request: GroupStateRequest):
-    """Set group active sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/active", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_active",
-                "state": request.state,
-                "message": f"Group active sharing set to {request.state}",
-                "osc_address": "/select/group/active"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_active: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/color",
-    operation_id="set_group_color"
-)
-async def set_group_color(request: GroupStateRequest):
-    """Set group color sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/color", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_color",
-                "state": request.state,
-                "message": f"Group color sharing set to {request.state}",
-                "osc_address": "/select/group/color"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_color: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/group/monitoring",
-    operation_id="set_group_monitoring"
-)
-async def set_group_monitoring(request: GroupStateRequest):
-    """Set group monitoring sharing"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/group/monitoring", request.state)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_group_monitoring",
-                "state": request.state,
-                "message": f"Group monitoring sharing set to {request.state}",
-                "osc_address": "/select/group/monitoring"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_group_monitoring: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-# Basic strip operations
-@router.post(
-    "/recenable",
-    operation_id="set_recenable"
-)
-async def set_recenable(request: BooleanRequest):
-    """Set record enable for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/recenable", 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_recenable",
-                "enabled": request.enabled,
-                "message": f"Record enable {action} for selected strip",
-                "osc_address": "/select/recenable"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_recenable: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/record_safe",
-    operation_id="set_record_safe"
-)
-async def set_record_safe(request: BooleanRequest):
-    """Set record safe for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/record_safe", 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_record_safe",
-                "enabled": request.enabled,
-                "message": f"Record safe {action} for selected strip",
-                "osc_address": "/select/record_safe"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_record_safe: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/mute",
-    operation_id="set_mute"
-)
-async def set_mute(request: BooleanRequest):
-    """Set mute for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/mute", 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_mute",
-                "enabled": request.enabled,
-                "message": f"Mute {action} for selected strip",
-                "osc_address": "/select/mute"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_mute: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/solo",
-    operation_id="set_solo"
-)
-async def set_solo(request: BooleanRequest):
-    """Set solo for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/solo", 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_solo",
-                "enabled": request.enabled,
-                "message": f"Solo {action} for selected strip",
-                "osc_address": "/select/solo"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_solo: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/solo_iso",
-    operation_id="set_solo_iso"
-)
-async def set_solo_iso(request: BooleanRequest):
-    """Set solo isolate for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/solo_iso", 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_solo_iso",
-                "enabled": request.enabled,
-                "message": f"Solo isolate {action} for selected strip",
-                "osc_address": "/select/solo_iso"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_solo_iso: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/select/group", request.group_name)
+    if not success:
+        return send_failed()
+    
+    logger.info("Selected strip assigned to group '%s'", request.group_name)
+    return {
+        **_SET_STRIP_GROUP_OK,
+        "group_name": request.group_name,
+        "message": f"Selected strip assigned to group '{request.group_name}'"
+    }
+
+# On/off operations are served by a single route: its path regex only matches
+# the operation names below, and the handler looks the operation up by name.
+# Maps operation path -> (request model, flag field, (off, on) packets, (off, on) response bodies)
+_DISPATCH: Dict[str, Tuple[type, str, Tuple[OscMessage, OscMessage], Tuple[bytes, bytes]]] = {}
+
+# Documents each dispatched operation under its own path and operation_id in
+# the OpenAPI schema; never mounted, requests are served by the dispatch route
+schema_router = APIRouter(prefix="/selection", tags=["selection"])
+
+def _add_flag_operation(path: str, operation_id: str, osc_address: str, summary: str, model: type, field: str, bodies: Tuple[bytes, bytes]):
+    """Add a dispatched operation sending `model.field` to osc_address as 1/0"""
+    packets = (encode_message(osc_address, (0,)), encode_message(osc_address, (1,)))
+    op = path.lstrip("/")
+    _DISPATCH[op] = (model, field, packets, bodies)
+    
+    # Documents the operation; served the same way as the dispatch route
+    async def endpoint(request: Request):
+        return await dispatch_flag_operation(op, request)
+    
+    endpoint.__name__ = operation_id
+    endpoint.__doc__ = summary
+    schema_router.add_api_route(
+        path, endpoint, methods=["POST"], operation_id=operation_id,
+        openapi_extra=_json_body_openapi(model)
+    )
+
+# Group state operations: (path, operation_id, OSC address, summary, message)
+_GROUP_STATE_ROUTES = (
+    ("/group/enable", "set_group_enable", "/select/group/enable", "Set group enable state", "Group enable state set to {}"),
+    ("/group/gain", "set_group_gain", "/select/group/gain", "Set group gain sharing", "Group gain sharing set to {}"),
+    ("/group/relative", "set_group_relative", "/select/group/relative", "Set group relative state", "Group relative state set to {}"),
+    ("/group/mute", "set_group_mute", "/select/group/mute", "Set group mute sharing", "Group mute sharing set to {}"),
+    ("/group/solo", "set_group_solo", "/select/group/solo", "Set group solo sharing", "Group solo sharing set to {}"),
+    ("/group/recenable", "set_group_recenable", "/select/group/recenable", "Set group recenable sharing", "Group recenable sharing set to {}"),
+    ("/group/select", "set_group_select", "/select/group/select", "Set group select sharing", "Group select sharing set to {}"),
+    ("/group/active", "set_group_active", "/select/group/active", "Set group active sharing", "Group active sharing set to {}"),
+    ("/group/color", "set_group_color", "/select/group/color", "Set group color sharing", "Group color sharing set to {}"),
+    ("/group/monitoring", "set_group_monitoring", "/select/group/monitoring", "Set group monitoring sharing", "Group monitoring sharing set to {}"),
+)
+
+def _add_group_state_operation(path: str, operation_id: str, osc_address: str, summary: str, message: str):
+    """Add a dispatched operation that sends a GroupStateRequest's state to osc_address as 1/0"""
+    # Only two messages and responses are possible, so encode both up front
+    bodies = tuple(
+        json.dumps({
+            "status": "success",
+            "action": operation_id,
+            "state": state,
+            "message": message.format(state),
+            "osc_address": osc_address
+        }, separators=(",", ":")).encode()
+        for state in _BOOL_INT
+    )
+    _add_flag_operation(path, operation_id, osc_address, summary, GroupStateRequest, "state", bodies)
+
+for _route in _GROUP_STATE_ROUTES:
+    _add_group_state_operation(*_route)
+
+# Basic strip operations: (path, operation_id, OSC address, summary, enabled message, disabled message)
+_BOOLEAN_ROUTES = (
+    (
+        "/recenable", "set_recenable", "/select/recenable", "Set record enable for selected strip",
+        "Record enable enabled for selected strip", "Record enable disabled for selected strip"
+    ),
+    (
+        "/record_safe", "set_record_safe", "/select/record_safe", "Set record safe for selected strip",
+        "Record safe enabled for selected strip", "Record safe disabled for selected strip"
+    ),
+    (
+        "/mute", "set_mute", "/select/mute", "Set mute for selected strip",
+        "Mute enabled for selected strip", "Mute disabled for selected strip"
+    ),
+    (
+        "/solo", "set_solo", "/select/solo", "Set solo for selected strip",
+        "Solo enabled for selected strip", "Solo disabled for selected strip"
+    ),
+    (
+        "/solo_iso", "set_solo_iso", "/select/solo_iso", "Set solo isolate for selected strip",
+        "Solo isolate enabled for selected strip", "Solo isolate disabled for selected strip"
+    ),
+    (
+        "/solo_safe", "set_solo_safe", "/select/solo_safe", "Set solo safe for selected strip",
+        "Solo safe enabled for selected strip", "Solo safe disabled for selected strip"
+    ),
+    (
+        "/monitor_input", "set_monitor_input", "/select/monitor_input", "Set monitor input for selected strip",
+        "Monitor mode set to input for selected strip", "Monitor mode set to auto for selected strip"
+    ),
+    (
+        "/monitor_disk", "set_monitor_disk", "/select/monitor_disk", "Set monitor disk for selected strip",
+        "Monitor mode set to disk for selected strip", "Monitor mode set to auto for selected strip"
+    ),
+    (
+        "/polarity", "set_polarity", "/select/polarity", "Set polarity invert for selected strip",
+        "Polarity set to inverted for selected strip", "Polarity set to normal for selected strip"
+    ),
+)
+
+def _add_boolean_operation(path: str, operation_id: str, osc_address: str, summary: str, on_message: str, off_message: str):
+    """Add a dispatched operation that sends a BooleanRequest to osc_address as 1/0"""
+    # Only two messages and responses are possible, so encode both up front
+    bodies = tuple(
+        json.dumps({
+            "status": "success",
+            "action": operation_id,
+            "enabled": enabled,
+            "message": on_message if enabled else off_message,
+            "osc_address": osc_address
+        }, separators=(",", ":")).encode()
+        for enabled in (False, True)
+    )
+    _add_flag_operation(path, operation_id, osc_address, summary, BooleanRequest, "enabled", bodies)
 
-@router.post(
-    "/solo_safe",
-    operation_id="set_solo_safe"
-)
-async def set_solo_safe(request: BooleanRequest):
-    """Set solo safe for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/solo_safe", 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_solo_safe",
-                "enabled": request.enabled,
-                "message": f"Solo safe {action} for selected strip",
-                "osc_address": "/select/solo_safe"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_solo_safe: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+for _route in _BOOLEAN_ROUTES:
+    _add_boolean_operation(*_route)
 
-@router.post(
-    "/monitor_input",
-    operation_id="set_monitor_input"
-)
-async def set_monitor_input(request: BooleanRequest):
-    """Set monitor input for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/monitor_input", 1 if request.enabled else 0)
-        
-        if success:
-            mode = "input" if request.enabled else "auto"
-            return {
-                "status": "success",
-                "action": "set_monitor_input",
-                "enabled": request.enabled,
-                "message": f"Monitor mode set to {mode} for selected strip",
-                "osc_address": "/select/monitor_input"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_monitor_input: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+class _OperationConvertor(StringConvertor):
+    """Path convertor matching exactly the dispatched operation names"""
+    regex = "|".join(re.escape(op) for op in _DISPATCH)
 
-@router.post(
-    "/monitor_disk",
-    operation_id="set_monitor_disk"
-)
-async def set_monitor_disk(request: BooleanRequest):
-    """Set monitor disk for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/monitor_disk", 1 if request.enabled else 0)
-        
-        if success:
-            mode = "disk" if request.enabled else "auto"
-            return {
-                "status": "success",
-                "action": "set_monitor_disk",
-                "enabled": request.enabled,
-                "message": f"Monitor mode set to {mode} for selected strip",
-                "osc_address": "/select/monitor_disk"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_monitor_disk: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+register_url_convertor("selection_op", _OperationConvertor())
 
 @router.post(
-    "/polarity",
-    operation_id="set_polarity"
+    "/{op:selection_op}",
+    include_in_schema=False
 )
-async def set_polarity(request: BooleanRequest):
-    """Set polarity invert for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/polarity", 1 if request.enabled else 0)
-        
-        if success:
-            action = "inverted" if request.enabled else "normal"
-            return {
-                "status": "success",
-                "action": "set_polarity",
-                "enabled": request.enabled,
-                "message": f"Polarity set to {action} for selected strip",
-                "osc_address": "/select/polarity"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_polarity: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+@api_errors
+async def dispatch_flag_operation(op: str, request: Request):
+    """Serve the on/off operations registered in _DISPATCH"""
+    model, field, packets, bodies = _DISPATCH[op]
+    flag = getattr(parse_json_body(model, await request.body()), field)
+    
+    if not get_osc_client().queue_packet(packets[flag]):
+        return send_failed()
+    if wants_minimal(request.headers.get("prefer")):
+        return Response(status_code=204)
+    return Response(content=bodies[flag], media_type="application/json")
 
 @router.post(
     "/gain",
-    operation_id="set_gain"
+    operation_id="set_gain",
+    openapi_extra=_json_body_openapi(GainRequest)
 )
-async def set_gain(request: GainRequest):
+@api_errors
+async def set_gain(
+    request: GainRequest = Depends(_json_body(GainRequest)),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
+):
     """Set gain for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/gain", request.gain_db)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_gain",
-                "gain_db": request.gain_db,
-                "message": f"Gain set to {request.gain_db}dB for selected strip",
-                "osc_address": "/select/gain"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_gain: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_float("/select/gain", request.gain_db)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {
+        **_SET_GAIN_OK,
+        "gain_db": request.gain_db,
+        "message": f"Gain set to {request.gain_db}dB for selected strip"
+    }
 
 @router.post(
     "/fader",
-    operation_id="set_fader"
+    operation_id="set_fader",
+    openapi_extra=_json_body_openapi(FaderRequest)
 )
-async def set_fader(request: FaderRequest):
+@api_errors
+async def set_fader(
+    request: FaderRequest = Depends(_json_body(FaderRequest)),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
+):
     """Set fader position for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/fader", request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_fader",
-                "position": request.position,
-                "message": f"Fader set to {request.position} for selected strip",
-                "osc_address": "/select/fader"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_fader: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_float("/select/fader", request.position)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {
+        **_SET_FADER_OK,
+        "position": request.position,
+        "message": f"Fader set to {request.position} for selected strip"
+    }
 
 @router.post(
     "/db_delta",
-    operation_id="set_db_delta"
+    operation_id="set_db_delta",
+    openapi_extra=_json_body_openapi(DeltaRequest)
 )
-async def set_db_delta(request: DeltaRequest):
+@api_errors
+async def set_db_delta(
+    request: DeltaRequest = Depends(_json_body(DeltaRequest)),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
+):
     """Apply gain delta to selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/db_delta", request.delta)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_db_delta",
-                "delta": request.delta,
-                "message": f"Gain delta {request.delta}dB applied to selected strip",
-                "osc_address": "/select/db_delta"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_db_delta: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/db_delta", request.delta)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {
+        **_SET_DB_DELTA_OK,
+        "delta": request.delta,
+        "message": f"Gain delta {request.delta}dB applied to selected strip"
+    }
 
 @router.post(
     "/vca",
     operation_id="set_vca"
 )
+@api_errors
 async def set_vca(request: VCARequest):
     """Set VCA control for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/vca", request.name, request.state)
-        
-        if success:
-            action = "enabled" if request.state else "disabled"
-            return {
-                "status": "success",
-                "action": "set_vca",
-                "name": request.name,
-                "state": request.state,
-                "message": f"VCA '{request.name}' {action} for selected strip",
-                "osc_address": "/select/vca"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_vca: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/vca", request.name, request.state)
+    if not success:
+        return send_failed()
+    
+    action = "enabled" if request.state else "disabled"
+    return {
+        **_SET_VCA_OK,
+        "name": request.name,
+        "state": request.state,
+        "message": f"VCA '{request.name}' {action} for selected strip"
+    }
 
 @router.post(
     "/vca/toggle",
     operation_id="toggle_vca"
 )
+@api_errors
 async def toggle_vca(request: VCAToggleRequest):
     """Toggle VCA control for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/vca/toggle", request.name)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "toggle_vca",
-                "name": request.name,
-                "message": f"VCA '{request.name}' toggled for selected strip",
-                "osc_address": "/select/vca/toggle"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in toggle_vca: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/vca/toggle", request.name)
+    if not success:
+        return send_failed()
+    
+    return {
+        **_TOGGLE_VCA_OK,
+        "name": request.name,
+        "message": f"VCA '{request.name}' toggled for selected strip"
+    }
 
 @router.post(
     "/spill",
     operation_id="spill_strips"
 )
+@api_errors
 async def spill_strips():
     """Spill strips related to selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/spill")
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "spill_strips",
-                "message": "Strips spilled for selected strip",
-                "osc_address": "/select/spill"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in spill_strips: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/spill")
+    if not success:
+        return send_failed()
+    
+    return Response(content=_SPILL_STRIPS_BODY, media_type="application/json")
 
 @router.post(
     "/trim",
-    operation_id="set_trim"
+    operation_id="set_trim",
+    openapi_extra=_json_body_openapi(TrimRequest)
 )
-async def set_trim(request: TrimRequest):
+@api_errors
+async def set_trim(
+    request: TrimRequest = Depends(_json_body(TrimRequest)),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
+):
     """Set trim for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/trimdB", request.trim_db)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_trim",
-                "trim_db": request.trim_db,
-                "message": f"Trim set to {request.trim_db}dB for selected strip",
-                "osc_address": "/select/trimdB"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_trim: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-# Pan operations
-@router.post(
-    "/pan_stereo_position",
-    operation_id="set_pan_stereo_position"
-)
-async def set_pan_stereo_position(request: PanRequest):
-    """Set stereo pan position for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/pan_stereo_position", request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_pan_stereo_position",
-                "position": request.position,
-                "message": f"Pan position set to {request.position} for selected strip",
-                "osc_address": "/select/pan_stereo_position"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_pan_stereo_position: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/pan_stereo_width",
-    operation_id="set_pan_stereo_width"
-)
-async def set_pan_stereo_width(request: PanRequest):
-    """Set stereo pan width for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/pan_stereo_width", request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_pan_stereo_width",
-                "width": request.position,
-                "message": f"Pan width set to {request.position} for selected strip",
-                "osc_address": "/select/pan_stereo_width"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_pan_stereo_width: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/pan_elevation_position",
-    operation_id="set_pan_elevation_position"
-)
-async def set_pan_elevation_position(request: PanRequest):
-    """Set pan elevation position for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/pan_elevation_position", request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_pan_elevation_position",
-                "position": request.position,
-                "message": f"Pan elevation set to {request.position} for selected strip",
-                "osc_address": "/select/pan_elevation_position"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_pan_elevation_position: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/pan_frontback_position",
-    operation_id="set_pan_frontback_position"
-)
-async def set_pan_frontback_position(request: PanRequest):
-    """Set pan front/back position for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/pan_frontback_position", request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_pan_frontback_position",
-                "position": request.position,
-                "message": f"Pan front/back set to {request.position} for selected strip",
-                "osc_address": "/select/pan_frontback_position"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_pan_frontback_position: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
-
-@router.post(
-    "/pan_lfe_control",
-    operation_id="set_pan_lfe_control"
-)
-async def set_pan_lfe_control(request: PanRequest):
-    """Set LFE control for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/pan_lfe_control", request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_pan_lfe_control",
-                "value": request.position,
-                "message": f"LFE control set to {request.position} for selected strip",
-                "osc_address": "/select/pan_lfe_control"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_pan_lfe_control: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_float("/select/trimdB", request.trim_db)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {
+        **_SET_TRIM_OK,
+        "trim_db": request.trim_db,
+        "message": f"Trim set to {request.trim_db}dB for selected strip"
+    }
+
+# Pan operations: (path, operation_id, OSC address, response field, summary, message)
+_PAN_ROUTES = (
+    (
+        "/pan_stereo_position", "set_pan_stereo_position", "/select/pan_stereo_position", "position",
+        "Set stereo pan position for selected strip", "Pan position set to {} for selected strip"
+    ),
+    (
+        "/pan_stereo_width", "set_pan_stereo_width", "/select/pan_stereo_width", "width",
+        "Set stereo pan width for selected strip", "Pan width set to {} for selected strip"
+    ),
+    (
+        "/pan_elevation_position", "set_pan_elevation_position", "/select/pan_elevation_position", "position",
+        "Set pan elevation position for selected strip", "Pan elevation set to {} for selected strip"
+    ),
+    (
+        "/pan_frontback_position", "set_pan_frontback_position", "/select/pan_frontback_position", "position",
+        "Set pan front/back position for selected strip", "Pan front/back set to {} for selected strip"
+    ),
+    (
+        "/pan_lfe_control", "set_pan_lfe_control", "/select/pan_lfe_control", "value",
+        "Set LFE control for selected strip", "LFE control set to {} for selected strip"
+    ),
+)
+
+# Maps pan path -> (OSC address, static response fields, value field, message)
+_PAN_OPERATIONS: Dict[str, Tuple[str, Dict[str, str], str, str]] = {}
+
+@api_errors
+async def set_pan(
+    kind: str,
+    request: PanRequest = Depends(_json_body(PanRequest)),
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
+):
+    """Serve the pan operations registered in _PAN_OPERATIONS"""
+    osc_address, static_fields, field, message = _PAN_OPERATIONS[kind]
+    success = get_osc_client().queue_float(osc_address, request.position)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {**static_fields, field: request.position, "message": message.format(request.position)}
+
+def _add_pan_operation(path: str, operation_id: str, osc_address: str, field: str, summary: str, message: str):
+    """Add a pan operation sending PanRequest.position to osc_address, echoed back as field"""
+    kind = path.lstrip("/")
+    _PAN_OPERATIONS[kind] = (
+        osc_address,
+        {"status": "success", "action": operation_id, "osc_address": osc_address},
+        field,
+        message
+    )
+    
+    # Documents the operation; requests are served by the pan route below
+    async def endpoint(request: PanRequest, prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")):
+        return await set_pan(kind, request, prefer)
+    
+    endpoint.__name__ = operation_id
+    endpoint.__doc__ = summary
+    schema_router.add_api_route(path, endpoint, methods=["POST"], operation_id=operation_id)
+
+for _route in _PAN_ROUTES:
+    _add_pan_operation(*_route)
+
+class _PanConvertor(StringConvertor):
+    """Path convertor matching exactly the pan operation names"""
+    regex = "|".join(re.escape(kind) for kind in _PAN_OPERATIONS)
+
+register_url_convertor("selection_pan", _PanConvertor())
+
+router.add_api_route("/{kind:selection_pan}", set_pan, methods=["POST"], include_in_schema=False)
 
 # Send operations
 @router.post(
     "/send_gain",
     operation_id="set_send_gain"
 )
-async def set_send_gain(request: SendGainRequest):
+@api_errors
+async def set_send_gain(request: SendGainRequest, prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")):
     """Set send gain for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/send_gain", request.send_id, request.gain_db)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_send_gain",
-                "send_id": request.send_id,
-                "gain_db": request.gain_db,
-                "message": f"Send {request.send_id} gain set to {request.gain_db}dB for selected strip",
-                "osc_address": "/select/send_gain"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_send_gain: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_int_float("/select/send_gain", request.send_id, request.gain_db)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {
+        **_SET_SEND_GAIN_OK,
+        "send_id": request.send_id,
+        "gain_db": request.gain_db,
+        "message": f"Send {request.send_id} gain set to {request.gain_db}dB for selected strip"
+    }
 
 @router.post(
     "/send_fader",
     operation_id="set_send_fader"
 )
-async def set_send_fader(request: SendFaderRequest):
+@api_errors
+async def set_send_fader(request: SendFaderRequest, prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")):
     """Set send fader for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/send_fader", request.send_id, request.position)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_send_fader",
-                "send_id": request.send_id,
-                "position": request.position,
-                "message": f"Send {request.send_id} fader set to {request.position} for selected strip",
-                "osc_address": "/select/send_fader"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_send_fader: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_int_float("/select/send_fader", request.send_id, request.position)
+    if not success:
+        return send_failed()
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    return {
+        **_SET_SEND_FADER_OK,
+        "send_id": request.send_id,
+        "position": request.position,
+        "message": f"Send {request.send_id} fader set to {request.position} for selected strip"
+    }
 
 @router.post(
     "/send_enable",
     operation_id="set_send_enable"
 )
+@api_errors
 async def set_send_enable(request: SendEnableRequest):
     """Set send enable for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/send_enable", request.send_id, 1 if request.enabled else 0)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            return {
-                "status": "success",
-                "action": "set_send_enable",
-                "send_id": request.send_id,
-                "enabled": request.enabled,
-                "message": f"Send {request.send_id} {action} for selected strip",
-                "osc_address": "/select/send_enable"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_send_enable: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/send_enable", request.send_id, _BOOL_INT[request.enabled])
+    if not success:
+        return send_failed()
+    
+    action = "enabled" if request.enabled else "disabled"
+    return {
+        **_SET_SEND_ENABLE_OK,
+        "send_id": request.send_id,
+        "enabled": request.enabled,
+        "message": f"Send {request.send_id} {action} for selected strip"
+    }
 
 @router.post(
     "/send_page",
     operation_id="set_send_page"
 )
+@api_errors
 async def set_send_page(request: DeltaRequest):
     """Navigate send pages for selected strip"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/send_page", request.delta)
-        
-        if success:
-            direction = "up" if request.delta > 0 else "down"
-            return {
-                "status": "success",
-                "action": "set_send_page",
-                "delta": request.delta,
-                "message": f"Send page moved {direction} by {abs(request.delta)} for selected strip",
-                "osc_address": "/select/send_page"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_send_page: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/send_page", request.delta)
+    if not success:
+        return send_failed()
+    
+    direction = "up" if request.delta > 0 else "down"
+    return {
+        **_SET_SEND_PAGE_OK,
+        "delta": request.delta,
+        "message": f"Send page moved {direction} by {abs(request.delta)} for selected strip"
+    }
 
 # Plugin operations
 @router.post(
     "/plugin",
     operation_id="select_plugin"
 )
+@api_errors
 async def select_plugin(request: PluginSelectRequest):
     """Select plugin by delta from current plugin"""
-    try:
-        selection_manager = get_selection_manager()
-        osc_client = get_osc_client()
-        
-        # Send OSC message
-        success = osc_client.send_message("/select/plugin", request.delta)
-        
-        if success:
-            # Update selection state
-            selection_manager.select_plugin_delta(request.delta)
-            
-            current_plugin = selection_manager.get_selected_plugin_id()
-            return {
-                "status": "success",
-                "action": "select_plugin",
-                "delta": request.delta,
-                "current_plugin": current_plugin,
-                "message": f"Plugin selection moved by {request.delta}",
-                "osc_address": "/select/plugin"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in select_plugin: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    selection_manager = get_selection_manager()
+    osc_client = get_osc_client()
+    
+    # Send OSC message
+    success = osc_client.queue_message("/select/plugin", request.delta)
+    if not success:
+        return send_failed()
+    
+    # Update selection state and read back the result under one lock
+    current_plugin = selection_manager.move_plugin_selection(request.delta)
+    return {
+        **_SELECT_PLUGIN_OK,
+        "delta": request.delta,
+        "current_plugin": current_plugin,
+        "message": f"Plugin selection moved by {request.delta}"
+    }
 
 @router.post(
     "/plugin_page",
     operation_id="set_plugin_page"
 )
+@api_errors
 async def set_plugin_page(request: PluginPageRequest):
     """Navigate plugin pages"""
-    try:
-        if request.direction == 0:
-            # 0 is ignored per Ardour spec
-            return {"status": "ignored", "message": "Direction=0 is ignored"}
-        
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/plug_page", request.direction)
-        
-        if success:
-            direction = "up" if request.direction > 0 else "down"
-            return {
-                "status": "success",
-                "action": "set_plugin_page",
-                "direction": request.direction,
-                "message": f"Plugin page moved {direction}",
-                "osc_address": "/select/plug_page"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_plugin_page: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    if request.direction == 0:
+        # 0 is ignored per Ardour spec
+        return Response(content=_PLUGIN_PAGE_IGNORED_BODY, media_type="application/json")
+    
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/plug_page", request.direction)
+    if not success:
+        return send_failed()
+    
+    direction = "up" if request.direction > 0 else "down"
+    return {
+        **_SET_PLUGIN_PAGE_OK,
+        "direction": request.direction,
+        "message": f"Plugin page moved {direction}"
+    }
 
 @router.post(
     "/plugin/activate",
     operation_id="set_plugin_activate"
 )
+@api_errors
 async def set_plugin_activate(request: PluginActivateRequest):
     """Activate/bypass selected plugin"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/plugin/activate", 1 if request.active else 0)
-        
-        if success:
-            action = "activated" if request.active else "bypassed"
-            return {
-                "status": "success",
-                "action": "set_plugin_activate",
-                "active": request.active,
-                "message": f"Selected plugin {action}",
-                "osc_address": "/select/plugin/activate"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_plugin_activate: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/plugin/activate", _BOOL_INT[request.active])
+    if not success:
+        return send_failed()
+    
+    action = "activated" if request.active else "bypassed"
+    return {
+        **_SET_PLUGIN_ACTIVATE_OK,
+        "active": request.active,
+        "message": f"Selected plugin {action}"
+    }
 
 @router.post(
     "/plugin/parameter",
     operation_id="set_plugin_parameter"
 )
+@api_errors
 async def set_plugin_parameter(request: PluginParameterRequest):
     """Set parameter for selected plugin"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message("/select/plugin/parameter", request.parameter_id, request.value)
-        
-        if success:
-            return {
-                "status": "success",
-                "action": "set_plugin_parameter",
-                "parameter_id": request.parameter_id,
-                "value": request.value,
-                "message": f"Plugin parameter {request.parameter_id} set to {request.value}",
-                "osc_address": "/select/plugin/parameter"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_plugin_parameter: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message("/select/plugin/parameter", request.parameter_id, request.value)
+    if not success:
+        return send_failed()
+    
+    return {
+        **_SET_PLUGIN_PARAMETER_OK,
+        "parameter_id": request.parameter_id,
+        "value": request.value,
+        "message": f"Plugin parameter {request.parameter_id} set to {request.value}"
+    }
 
 # Automation and touch controls
 @router.post(
     "/automation/{control_name}",
     operation_id="set_automation"
 )
+@api_errors
 async def set_automation(
     control_name: str = Path(..., description="Control name (gain, mute, solo, etc.)"),
     request: AutomationRequest = ...
 ):
     """Set automation mode for selected strip control"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message(f"/select/{control_name}/automation", request.mode)
-        
-        if success:
-            mode_names = {0: "Manual", 1: "Play", 2: "Write", 3: "Touch"}
-            mode_name = mode_names.get(request.mode, f"Mode {request.mode}")
-            
-            return {
-                "status": "success",
-                "action": "set_automation",
-                "control": control_name,
-                "mode": request.mode,
-                "mode_name": mode_name,
-                "message": f"Automation mode for {control_name} set to {mode_name}",
-                "osc_address": f"/select/{control_name}/automation"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_automation: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message(f"/select/{control_name}/automation", request.mode)
+    if not success:
+        return send_failed()
+    
+    mode = request.mode
+    mode_name = _AUTOMATION_MODES[mode] if 0 <= mode < len(_AUTOMATION_MODES) else f"Mode {mode}"
+    
+    return {
+        **_SET_AUTOMATION_OK,
+        "control": control_name,
+        "mode": request.mode,
+        "mode_name": mode_name,
+        "message": f"Automation mode for {control_name} set to {mode_name}",
+        "osc_address": f"/select/{control_name}/automation"
+    }
 
 @router.post(
     "/touch/{control_name}",
     operation_id="set_touch"
 )
+@api_errors
 async def set_touch(
     control_name: str = Path(..., description="Control name (gain, mute, solo, etc.)"),
     request: TouchRequest = ...
 ):
     """Set touch state for selected strip control"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.send_message(f"/select/{control_name}/touch", request.state)
-        
-        if success:
-            action = "touched" if request.state else "released"
-            return {
-                "status": "success",
-                "action": "set_touch",
-                "control": control_name,
-                "state": request.state,
-                "message": f"Touch state for {control_name} set to {action}",
-                "osc_address": f"/select/{control_name}/touch"
-            }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to send OSC message")
-    except Exception as e:
-        logger.error(f"Error in set_touch: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
+    osc_client = get_osc_client()
+    success = osc_client.queue_message(f"/select/{control_name}/touch", request.state)
+    if not success:
+        return send_failed()
+    
+    action = "touched" if request.state else "released"
+    return {
+        **_SET_TOUCH_OK,
+        "control": control_name,
+        "state": request.state,
+        "message": f"Touch state for {control_name} set to {action}",
+        "osc_address": f"/select/{control_name}/touch"
+    }
 
 @router.delete(
     "/clear",
     operation_id="clear_selection"
 )
+@api_errors
 async def clear_selection():
     """Clear current selection"""
-    try:
-        selection_manager = get_selection_manager()
-        selection_manager.clear_selection()
-        
-        return {
-            "status": "success",
-            "action": "clear_selection",
-            "message": "Selection cleared"
-        }
-    except Exception as e:
-        logger.error(f"Error in clear_selection: {e}")
-        raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
\ No newline at end of file
+    selection_manager = get_selection_manager()
+    selection_manager.clear_selection()
+    
+    return Response(content=_CLEAR_SELECTION_BODY, media_type="application/json")
\ No newline at end of file
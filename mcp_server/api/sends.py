@@ -3,12 +3,30 @@ Send/Aux control endpoints for Ardour MCP Server
 """
 
 import logging
-from fastapi import APIRouter, HTTPException, Path
+import re
+import time
+from typing import Dict, Optional, Tuple
+from fastapi import APIRouter, Header, Path, Request, Response
 from pydantic import BaseModel, Field
+from starlette.convertors import StringConvertor, register_url_convertor
 from mcp_server.osc_client import get_osc_client
+from mcp_server.responses import FastJSONResponse, wants_minimal
+from mcp_server.api.errors import safe_endpoint, send_failed
+from mcp_server.api.models import BooleanRequest, parse_json_body
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/sends", tags=["sends"])
+router = APIRouter(prefix="/sends", tags=["sends"], default_response_class=FastJSONResponse)
+
+_ACTION_MSG = {True: "enabled", False: "disabled"}
+
+# Static fields of each endpoint's success response, merged with the request-specific ones
+_LIST_SENDS_OK = {"status": "success", "action": "list_sends"}
+
+# Track number -> time the track's send list was last requested. Ardour
+# answers a request with its whole send list, so a repeat within the TTL
+# (a UI polling the list) is not sent again.
+SEND_LIST_TTL = 0.1
+_send_list_requested: Dict[int, float] = {}
 
 class SendLevelRequest(BaseModel):
     """Request model for send level control"""
@@ -19,10 +37,6 @@ class SendLevelRequest(BaseModel):
         le=1.0
     )
 
-class SendEnableRequest(BaseModel):
-    """Request model for send enable/disable"""
-    enabled: bool = Field(..., description="True to enable send, False to disable")
-
 class SendGainRequest(BaseModel):
     """Request model for send gain control"""
     gain_db: float = Field(
@@ -32,163 +46,123 @@ class SendGainRequest(BaseModel):
         le=6.0
     )
 
-@router.post(
-    "/track/{track_number}/send/{send_number}/level",
-    operation_id="set_send_level"
-)
-async def set_send_level(
-    track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
-    send_number: int = Path(..., description="Send number (1-based)", ge=1, le=32),
-    request: SendLevelRequest = ...
-):
-    """Set send level for a track to specific aux"""
-    try:
-        osc_client = get_osc_client()
-        # Keep 1-based indexing for OSC (Ardour expects /strip/1/ for first track)
-        track_index = track_number
-        send_index = send_number - 1  # Sends might still be 0-based
-        
-        success = osc_client.set_send_level(track_index, send_index, request.level)
-        
-        if success:
-            logger.info(f"Send level set: track {track_number} send {send_number} = {request.level}")
-            return {
-                "status": "success",
-                "action": "set_send_level",
-                "track": track_number,
-                "send": send_number,
-                "level": request.level,
-                "message": f"Send {send_number} level set to {request.level:.2f} for track {track_number}",
-                "osc_address": f"/strip/{track_index}/send/{send_index}/fader"
-            }
-        else:
-            logger.error(f"Failed to set send level for track {track_number} send {send_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set send level for track {track_number} send {send_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_send_level: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
-
-@router.post(
-    "/track/{track_number}/send/{send_number}/gain",
-    operation_id="set_send_gain"
+# Send controls: (operation, operation_id, OSC client method, OSC address suffix,
+# request model, request field, summary, message)
+_SEND_ROUTES = (
+    (
+        "level", "set_send_level", "set_send_level", "fader", SendLevelRequest, "level",
+        "Set send level for a track to specific aux", "Send {send} level set to {value:.2f} for track {track}"
+    ),
+    (
+        "gain", "set_send_gain", "set_send_gain", "gain", SendGainRequest, "gain_db",
+        "Set send gain in dB for a track to specific aux", "Send {send} gain set to {value} dB for track {track}"
+    ),
+    (
+        "enable", "set_send_enable", "set_send_enable", "enable", BooleanRequest, "enabled",
+        "Enable or disable a send", "Send {send} {state} for track {track}"
+    ),
 )
-async def set_send_gain(
+
+# Maps operation -> (OSC client method, OSC address suffix, request model,
+# request field, static response fields, message)
+_SEND_OPERATIONS: Dict[str, Tuple[str, str, type, str, Dict[str, str], str]] = {}
+
+# Documents the send controls for OpenAPI; never mounted, requests are
+# served by the send control route below
+schema_router = APIRouter(prefix="/sends", tags=["sends"])
+
+@safe_endpoint
+async def set_send_control(
+    op: str,
+    request: Request,
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     send_number: int = Path(..., description="Send number (1-based)", ge=1, le=32),
-    request: SendGainRequest = ...
+    prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
 ):
-    """Set send gain in dB for a track to specific aux"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number
-        send_index = send_number - 1
-        
-        success = osc_client.set_send_gain(track_index, send_index, request.gain_db)
-        
-        if success:
-            logger.info(f"Send gain set: track {track_number} send {send_number} = {request.gain_db} dB")
-            return {
-                "status": "success",
-                "action": "set_send_gain",
-                "track": track_number,
-                "send": send_number,
-                "gain_db": request.gain_db,
-                "message": f"Send {send_number} gain set to {request.gain_db} dB for track {track_number}",
-                "osc_address": f"/strip/{track_index}/send/{send_index}/gain"
-            }
-        else:
-            logger.error(f"Failed to set send gain for track {track_number} send {send_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set send gain for track {track_number} send {send_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_send_gain: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
-
-@router.post(
-    "/track/{track_number}/send/{send_number}/enable",
-    operation_id="set_send_enable"
+    """Serve the send controls registered in _SEND_OPERATIONS"""
+    method, suffix, model, field, static_fields, message = _SEND_OPERATIONS[op]
+    value = getattr(parse_json_body(model, await request.body()), field)
+    
+    osc_client = get_osc_client()
+    # Keep 1-based indexing for OSC (Ardour expects /strip/1/ for first track)
+    track_index = track_number
+    send_index = send_number - 1  # Sends might still be 0-based
+    
+    success = getattr(osc_client, method)(track_index, send_index, value)
+    if not success:
+        return send_failed(f"Failed to set send {op} for track {track_number} send {send_number}")
+    if wants_minimal(prefer):
+        return Response(status_code=204)
+    
+    logger.info("Send %s set: track %s send %s = %s", op, track_number, send_number, value)
+    return {
+        **static_fields,
+        "track": track_number,
+        "send": send_number,
+        field: value,
+        "message": message.format(
+            send=send_number, track=track_number, value=value, state=_ACTION_MSG[bool(value)]
+        ),
+        "osc_address": f"/strip/{track_index}/send/{send_index}/{suffix}"
+    }
+
+def _add_send_operation(op: str, operation_id: str, method: str, suffix: str, model: type, field: str, summary: str, message: str):
+    """Add a send control calling `method` with `model.field`"""
+    _SEND_OPERATIONS[op] = (method, suffix, model, field, {"status": "success", "action": operation_id}, message)
+    
+    # Documents the operation; served the same way as the send control route
+    async def endpoint(
+        http_request: Request,
+        track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
+        send_number: int = Path(..., description="Send number (1-based)", ge=1, le=32),
+        request: model = ...,
+        prefer: Optional[str] = Header(None, description="'return=minimal' for an empty 204 response")
+    ):
+        return await set_send_control(op, http_request, track_number, send_number, prefer)
+    
+    endpoint.__name__ = operation_id
+    endpoint.__doc__ = summary
+    schema_router.add_api_route(
+        f"/track/{{track_number}}/send/{{send_number}}/{op}", endpoint,
+        methods=["POST"], operation_id=operation_id
+    )
+
+for _route in _SEND_ROUTES:
+    _add_send_operation(*_route)
+
+class _SendOpConvertor(StringConvertor):
+    """Path convertor matching exactly the send control names"""
+    regex = "|".join(re.escape(op) for op in _SEND_OPERATIONS)
+
+register_url_convertor("send_op", _SendOpConvertor())
+
+router.add_api_route(
+    "/track/{track_number}/send/{send_number}/{op:send_op}", set_send_control,
+    methods=["POST"], include_in_schema=False
 )
-async def set_send_enable(
-    track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
-    send_number: int = Path(..., description="Send number (1-based)", ge=1, le=32),
-    request: SendEnableRequest = ...
-):
-    """Enable or disable a send"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number
-        send_index = send_number - 1
-        
-        success = osc_client.set_send_enable(track_index, send_index, request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Send {action}: track {track_number} send {send_number}")
-            return {
-                "status": "success",
-                "action": "set_send_enable",
-                "track": track_number,
-                "send": send_number,
-                "enabled": request.enabled,
-                "message": f"Send {send_number} {action} for track {track_number}",
-                "osc_address": f"/strip/{track_index}/send/{send_index}/enable"
-            }
-        else:
-            logger.error(f"Failed to set send enable for track {track_number} send {send_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set send enable for track {track_number} send {send_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_send_enable: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
 
 @router.get(
     "/track/{track_number}/sends",
     operation_id="list_track_sends"
 )
+@safe_endpoint
 async def list_track_sends(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256)
 ):
     """List all sends for a track"""
-    try:
-        osc_client = get_osc_client()
-        track_index = track_number - 1
-        
-        success = osc_client.list_track_sends(track_index)
-        
-        if success:
-            logger.info(f"Listed sends for track {track_number}")
-            return {
-                "status": "success",
-                "action": "list_sends",
-                "track": track_number,
-                "message": f"Send list requested for track {track_number}",
-                "osc_address": f"/strip/{track_index}/sends"
-            }
-        else:
-            logger.error(f"Failed to list sends for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to list sends for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in list_track_sends: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
\ No newline at end of file
+    track_index = track_number - 1
+    
+    now = time.monotonic()
+    if now - _send_list_requested.get(track_number, -SEND_LIST_TTL) >= SEND_LIST_TTL:
+        success = get_osc_client().list_track_sends(track_index)
+        if not success:
+            return send_failed(f"Failed to list sends for track {track_number}")
+        _send_list_requested[track_number] = now
+        logger.info("Listed sends for track %s", track_number)
+    
+    return {
+        **_LIST_SENDS_OK,
+        "track": track_number,
+        "message": f"Send list requested for track {track_number}",
+        "osc_address": f"/strip/{track_index}/sends"
+    }
\ No newline at end of file
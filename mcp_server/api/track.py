@@ -3,14 +3,36 @@ Track control endpoints for Ardour MCP Server
 """
 
 import logging
+from typing import Any, Dict, List, Literal, Tuple
 from fastapi import APIRouter, Path, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from mcp_server.osc_client import get_osc_client
 from mcp_server.osc_listener import get_osc_listener
+from mcp_server.api.errors import api_errors, safe_endpoint, send_failed
+from mcp_server.api.models import BooleanRequest
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/track", tags=["track"])
 
+# Static fields of each endpoint's success response, merged with the request-specific ones
+_SET_FADER_OK = {"status": "success", "action": "set_fader"}
+_SET_MUTE_OK = {"status": "success", "action": "set_mute"}
+_SET_SOLO_OK = {"status": "success", "action": "set_solo"}
+_SET_NAME_OK = {"status": "success", "action": "set_name"}
+_SET_RECORD_ENABLE_OK = {"status": "success", "action": "set_record_enable"}
+_SET_RECORD_SAFE_OK = {"status": "success", "action": "set_record_safe"}
+_SET_PAN_OK = {"status": "success", "action": "set_pan"}
+
+_ACTION_MSG = {True: "enabled", False: "disabled"}
+_MUTE_MSG = {True: "muted", False: "unmuted"}
+_SOLO_MSG = {True: "soloed", False: "unsoloed"}
+
+# OSC address of each strip control for every track, indexed by track number - 1
+_STRIP_ADDRESSES: Dict[str, Tuple[str, ...]] = {
+    suffix: tuple(f"/strip/{index}/{suffix}" for index in range(256))
+    for suffix in ("gain", "mute", "solo", "name", "recenable", "record_safe", "pan_stereo_position")
+}
+
 class FaderRequest(BaseModel):
     """Request model for fader control"""
     gain_db: float = Field(
@@ -32,10 +54,6 @@ class NameRequest(BaseModel):
     """Request model for track naming"""
     name: str = Field(..., description="New name for the track", min_length=1, max_length=100)
 
-class RecordEnableRequest(BaseModel):
-    """Request model for record enable control"""
-    enabled: bool = Field(..., description="True to enable recording, False to disable")
-
 class RecordSafeRequest(BaseModel):
     """Request model for record safe control"""
     safe: bool = Field(..., description="True to enable record safe, False to disable")
@@ -49,269 +67,250 @@ class PanRequest(BaseModel):
         le=1.0
     )
 
+# Track changes accepted by the batch endpoint: op -> (request model of the
+# single-track endpoint, its field, OSC address suffix under /strip/{index}/)
+_BATCH_OPERATIONS = {
+    "fader": (FaderRequest, "gain_db", "gain"),
+    "mute": (MuteRequest, "mute", "mute"),
+    "solo": (SoloRequest, "solo", "solo"),
+    "pan": (PanRequest, "pan_position", "pan_stereo_position"),
+    "name": (NameRequest, "name", "name"),
+    "rec": (BooleanRequest, "enabled", "recenable"),
+    "recsafe": (RecordSafeRequest, "safe", "record_safe"),
+}
+
+class TrackOperation(BaseModel):
+    """One track change in a batch request"""
+    track: int = Field(..., description="Track number (1-based)", ge=1, le=256)
+    op: Literal["fader", "mute", "solo", "pan", "name", "rec", "recsafe"] = Field(
+        ..., description="Control to change, as in the single-track endpoints"
+    )
+    value: Any = Field(
+        ..., description="New value: gain in dB (fader), -1.0 to 1.0 (pan), name, or true/false"
+    )
+    
+    @model_validator(mode="after")
+    def _validate_value(self):
+        """Validate the value with the request model of the op's own endpoint"""
+        model, field, _ = _BATCH_OPERATIONS[self.op]
+        self.value = getattr(model.model_validate({field: self.value}), field)
+        return self
+
+class BatchRequest(BaseModel):
+    """Request model for several track changes sent together"""
+    operations: List[TrackOperation] = Field(
+        ..., description="Track changes, applied by Ardour in order", min_length=1, max_length=128
+    )
+
+@router.post(
+    "/batch",
+    operation_id="set_tracks_batch"
+)
+@api_errors
+async def set_tracks_batch(request: BatchRequest):
+    """Apply several track changes at once, sent to Ardour as a single OSC bundle"""
+    messages = []
+    for operation in request.operations:
+        suffix = _BATCH_OPERATIONS[operation.op][2]
+        value = operation.value
+        arg = (1 if value else 0) if isinstance(value, bool) else value
+        messages.append((_STRIP_ADDRESSES[suffix][operation.track - 1], (arg,)))
+    
+    success = get_osc_client().send_bundle(messages)
+    if not success:
+        return send_failed(f"Failed to apply {len(messages)} track changes")
+    
+    logger.info("Applied %s track changes in one bundle", len(messages))
+    return {
+        "status": "success",
+        "action": "set_tracks_batch",
+        "count": len(messages),
+        "operations": [
+            {"track": operation.track, "op": operation.op, "value": operation.value, "osc_address": address}
+            for operation, (address, _) in zip(request.operations, messages)
+        ],
+        "message": f"{len(messages)} track changes sent as one OSC bundle"
+    }
+
 @router.post(
     "/{track_number}/fader",
     operation_id="set_fader"
 )
+@safe_endpoint
 async def set_fader(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     request: FaderRequest = ...
 ):
     """Set track fader level"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_strip_gain(track_number, request.gain_db)
-        
-        if success:
-            logger.info(f"Fader set to {request.gain_db}dB for track {track_number}")
-            return {
-                "status": "success", 
-                "action": "set_fader",
-                "track": track_number,
-                "gain_db": request.gain_db,
-                "message": f"Fader set to {request.gain_db}dB for track {track_number}",
-                "osc_address": f"/strip/{track_number-1}/gain"
-            }
-        else:
-            logger.error(f"Failed to set fader for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set fader for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_fader: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.set_strip_gain(track_number, request.gain_db)
+    if not success:
+        return send_failed(f"Failed to set fader for track {track_number}")
+    
+    logger.info("Fader set to %sdB for track %s", request.gain_db, track_number)
+    return {
+        **_SET_FADER_OK,
+        "track": track_number,
+        "gain_db": request.gain_db,
+        "message": f"Fader set to {request.gain_db}dB for track {track_number}",
+        "osc_address": _STRIP_ADDRESSES["gain"][track_number - 1]
+    }
 
 @router.post(
     "/{track_number}/mute",
     operation_id="set_mute"
 )
+@safe_endpoint
 async def set_mute(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     request: MuteRequest = ...
 ):
     """Mute/unmute track"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.strip_mute(track_number, request.mute)
-        
-        if success:
-            action = "muted" if request.mute else "unmuted"
-            logger.info(f"Track {track_number} {action}")
-            return {
-                "status": "success",
-                "action": "set_mute",
-                "track": track_number,
-                "mute": request.mute,
-                "message": f"Track {track_number} {action}",
-                "osc_address": f"/strip/{track_number-1}/mute"
-            }
-        else:
-            logger.error(f"Failed to set mute for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set mute for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_mute: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.strip_mute(track_number, request.mute)
+    if not success:
+        return send_failed(f"Failed to set mute for track {track_number}")
+    
+    action = _MUTE_MSG[request.mute]
+    logger.info("Track %s %s", track_number, action)
+    return {
+        **_SET_MUTE_OK,
+        "track": track_number,
+        "mute": request.mute,
+        "message": f"Track {track_number} {action}",
+        "osc_address": _STRIP_ADDRESSES["mute"][track_number - 1]
+    }
 
 @router.post(
     "/{track_number}/solo",
     operation_id="set_solo"
 )
+@safe_endpoint
 async def set_solo(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     request: SoloRequest = ...
 ):
     """Solo/unsolo track"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.strip_solo(track_number, request.solo)
-        
-        if success:
-            action = "soloed" if request.solo else "unsoloed"
-            logger.info(f"Track {track_number} {action}")
-            return {
-                "status": "success",
-                "action": "set_solo",
-                "track": track_number,
-                "solo": request.solo,
-                "message": f"Track {track_number} {action}",
-                "osc_address": f"/strip/{track_number-1}/solo"
-            }
-        else:
-            logger.error(f"Failed to set solo for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set solo for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_solo: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.strip_solo(track_number, request.solo)
+    if not success:
+        return send_failed(f"Failed to set solo for track {track_number}")
+    
+    action = _SOLO_MSG[request.solo]
+    logger.info("Track %s %s", track_number, action)
+    return {
+        **_SET_SOLO_OK,
+        "track": track_number,
+        "solo": request.solo,
+        "message": f"Track {track_number} {action}",
+        "osc_address": _STRIP_ADDRESSES["solo"][track_number - 1]
+    }
 
 @router.post(
     "/{track_number}/name",
     operation_id="set_track_name"
 )
+@safe_endpoint
 async def set_track_name(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     request: NameRequest = ...
 ):
     """Set track name"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_strip_name(track_number, request.name)
-        
-        if success:
-            logger.info(f"Track {track_number} renamed to '{request.name}'")
-            return {
-                "status": "success",
-                "action": "set_name",
-                "track": track_number,
-                "name": request.name,
-                "message": f"Track {track_number} renamed to '{request.name}'",
-                "osc_address": f"/strip/{track_number-1}/name"
-            }
-        else:
-            logger.error(f"Failed to rename track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to rename track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_track_name: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.set_strip_name(track_number, request.name)
+    if not success:
+        return send_failed(f"Failed to rename track {track_number}")
+    
+    logger.info("Track %s renamed to '%s'", track_number, request.name)
+    return {
+        **_SET_NAME_OK,
+        "track": track_number,
+        "name": request.name,
+        "message": f"Track {track_number} renamed to '{request.name}'",
+        "osc_address": _STRIP_ADDRESSES["name"][track_number - 1]
+    }
 
 @router.post(
     "/{track_number}/record-enable",
     operation_id="set_record_enable"
 )
+@safe_endpoint
 async def set_record_enable(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
-    request: RecordEnableRequest = ...
+    request: BooleanRequest = ...
 ):
     """Enable/disable recording for track"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_strip_record_enable(track_number, request.enabled)
-        
-        if success:
-            action = "enabled" if request.enabled else "disabled"
-            logger.info(f"Track {track_number} recording {action}")
-            return {
-                "status": "success",
-                "action": "set_record_enable",
-                "track": track_number,
-                "enabled": request.enabled,
-                "message": f"Track {track_number} recording {action}",
-                "osc_address": f"/strip/{track_number-1}/recenable"
-            }
-        else:
-            logger.error(f"Failed to set record enable for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set record enable for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_record_enable: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.set_strip_record_enable(track_number, request.enabled)
+    if not success:
+        return send_failed(f"Failed to set record enable for track {track_number}")
+    
+    action = _ACTION_MSG[request.enabled]
+    logger.info("Track %s recording %s", track_number, action)
+    return {
+        **_SET_RECORD_ENABLE_OK,
+        "track": track_number,
+        "enabled": request.enabled,
+        "message": f"Track {track_number} recording {action}",
+        "osc_address": _STRIP_ADDRESSES["recenable"][track_number - 1]
+    }
 
 @router.post(
     "/{track_number}/record-safe",
     operation_id="set_record_safe"
 )
+@safe_endpoint
 async def set_record_safe(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     request: RecordSafeRequest = ...
 ):
     """Enable/disable record safe for track"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_strip_record_safe(track_number, request.safe)
-        
-        if success:
-            action = "enabled" if request.safe else "disabled"
-            logger.info(f"Track {track_number} record safe {action}")
-            return {
-                "status": "success",
-                "action": "set_record_safe",
-                "track": track_number,
-                "safe": request.safe,
-                "message": f"Track {track_number} record safe {action}",
-                "osc_address": f"/strip/{track_number-1}/record_safe"
-            }
-        else:
-            logger.error(f"Failed to set record safe for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set record safe for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_record_safe: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.set_strip_record_safe(track_number, request.safe)
+    if not success:
+        return send_failed(f"Failed to set record safe for track {track_number}")
+    
+    action = _ACTION_MSG[request.safe]
+    logger.info("Track %s record safe %s", track_number, action)
+    return {
+        **_SET_RECORD_SAFE_OK,
+        "track": track_number,
+        "safe": request.safe,
+        "message": f"Track {track_number} record safe {action}",
+        "osc_address": _STRIP_ADDRESSES["record_safe"][track_number - 1]
+    }
 
 @router.post(
     "/{track_number}/pan",
     operation_id="set_pan"
 )
+@safe_endpoint
 async def set_pan(
     track_number: int = Path(..., description="Track number (1-based)", ge=1, le=256),
     request: PanRequest = ...
 ):
     """Set track pan position"""
-    try:
-        osc_client = get_osc_client()
-        success = osc_client.set_strip_pan(track_number, request.pan_position)
-        
-        if success:
-            # Create descriptive pan position
-            if request.pan_position < -0.5:
-                pos_desc = f"left ({request.pan_position:.2f})"
-            elif request.pan_position > 0.5:
-                pos_desc = f"right ({request.pan_position:.2f})"
-            else:
-                pos_desc = f"center ({request.pan_position:.2f})"
-                
-            logger.info(f"Track {track_number} pan set to {pos_desc}")
-            return {
-                "status": "success",
-                "action": "set_pan",
-                "track": track_number,
-                "pan_position": request.pan_position,
-                "message": f"Track {track_number} pan set to {pos_desc}",
-                "osc_address": f"/strip/{track_number-1}/pan_stereo_position"
-            }
-        else:
-            logger.error(f"Failed to set pan for track {track_number}")
-            raise HTTPException(
-                status_code=500,
-                detail=f"Failed to set pan for track {track_number}"
-            )
-    except Exception as e:
-        logger.error(f"Error in set_pan: {e}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error: {str(e)}"
-        )
+    osc_client = get_osc_client()
+    success = osc_client.set_strip_pan(track_number, request.pan_position)
+    if not success:
+        return send_failed(f"Failed to set pan for track {track_number}")
+    
+    # Create descriptive pan position
+    if request.pan_position < -0.5:
+        pos_desc = f"left ({request.pan_position:.2f})"
+    elif request.pan_position > 0.5:
+        pos_desc = f"right ({request.pan_position:.2f})"
+    else:
+        pos_desc = f"center ({request.pan_position:.2f})"
+    
+    logger.info("Track %s pan set to %s", track_number, pos_desc)
+    return {
+        **_SET_PAN_OK,
+        "track": track_number,
+        "pan_position": request.pan_position,
+        "message": f"Track {track_number} pan set to {pos_desc}",
+        "osc_address": _STRIP_ADDRESSES["pan_stereo_position"][track_number - 1]
+    }
 
 @router.get(
     "/list",
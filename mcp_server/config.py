@@ -20,10 +20,20 @@ class Settings(BaseSettings):
     osc_target_ip: str = Field(default="127.0.0.1", env="OSC_TARGET_IP")
     osc_target_port: int = Field(default=3819, env="OSC_TARGET_PORT")
     osc_listen_port: int = Field(default=3820, env="OSC_LISTEN_PORT")
+    # Milliseconds the sender waits for more queued messages before sending a
+    # batch; 0 only batches messages that are already waiting. A window also
+    # delays queued messages relative to ones sent directly.
+    osc_batch_window_ms: float = Field(default=0.0, env="OSC_BATCH_WINDOW_MS")
+    # Send buffer requested for the OSC sockets (bytes, capped by the kernel);
+    # 0 keeps the system default
+    osc_sndbuf: int = Field(default=1 << 20, env="OSC_SNDBUF")
     
     # FastAPI Server Configuration
     http_host: str = Field(default="0.0.0.0", env="HTTP_HOST")
     http_port: int = Field(default=8000, env="HTTP_PORT")
+    # Idle seconds a keep-alive connection is held open; long enough that the
+    # MCP client's pooled connection survives the gap between tool calls
+    http_keep_alive: int = Field(default=15, env="HTTP_KEEP_ALIVE")
     
     # Application Configuration
     debug: bool = Field(default=False, env="DEBUG")
@@ -61,12 +71,15 @@ def get_osc_config() -> dict:
     return {
         "ip": settings.osc_target_ip,
         "port": settings.osc_target_port,
-        "listen_port": settings.osc_listen_port
+        "listen_port": settings.osc_listen_port,
+        "batch_window": settings.osc_batch_window_ms / 1000,
+        "sndbuf": settings.osc_sndbuf
     }
 
 def get_server_config() -> dict:
     """Get HTTP server configuration"""
     return {
         "host": settings.http_host,
-        "port": settings.http_port
+        "port": settings.http_port,
+        "keep_alive": settings.http_keep_alive
     }
\ No newline at end of file
@@ -7,12 +7,15 @@ import sys
 import time
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import get_openapi
 from fastapi.responses import JSONResponse
 from dotenv import load_dotenv
 import os
 
 from mcp_server.api import transport, track, session, sends, plugins, recording, selection
 from mcp_server.config import get_settings
+from mcp_server.responses import FastJSONResponse
+from mcp_server.osc_client import get_osc_client
 from mcp_server.osc_listener import start_osc_listener
 
 # Load environment variables
@@ -35,7 +38,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Ardour MCP Server",
     description="A FastAPI server for controlling Ardour DAW via OSC messages",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=FastJSONResponse
 )
 
 # Exception handlers
@@ -81,6 +85,19 @@ app.include_router(plugins.router)
 app.include_router(recording.router)
 app.include_router(selection.router)
 
+def custom_openapi():
+    """OpenAPI schema including the selection and send operations served by dispatch routes"""
+    if app.openapi_schema is None:
+        app.openapi_schema = get_openapi(
+            title=app.title,
+            version=app.version,
+            description=app.description,
+            routes=app.routes + selection.schema_router.routes + sends.schema_router.routes
+        )
+    return app.openapi_schema
+
+app.openapi = custom_openapi
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -115,17 +132,22 @@ async def health_check():
 
 @app.on_event("startup")
 async def startup_event():
-    """Initialize OSC listener on startup"""
+    """Initialize OSC listener and queued sender on startup"""
     logger.info("Starting OSC listener for plugin discovery...")
     try:
         start_osc_listener()
         logger.info("OSC listener started successfully")
     except Exception as e:
         logger.error(f"Failed to start OSC listener: {e}")
+    
+    try:
+        await get_osc_client().start_sender()
+    except Exception as e:
+        logger.error(f"Failed to start OSC sender: {e}")
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Clean up OSC listener on shutdown"""
+    """Clean up OSC listener and flush queued OSC packets on shutdown"""
     logger.info("Stopping OSC listener...")
     try:
         from mcp_server.osc_listener import stop_osc_listener
@@ -133,6 +155,11 @@ async def shutdown_event():
         logger.info("OSC listener stopped successfully")
     except Exception as e:
         logger.error(f"Failed to stop OSC listener: {e}")
+    
+    try:
+        await get_osc_client().stop_sender()
+    except Exception as e:
+        logger.error(f"Failed to stop OSC sender: {e}")
 
 if __name__ == "__main__":
     import uvicorn
@@ -144,5 +171,6 @@ if __name__ == "__main__":
         "mcp_server.main:app",
         host=host,
         port=port,
+        timeout_keep_alive=settings.http_keep_alive,
         reload=True
     )
\ No newline at end of file
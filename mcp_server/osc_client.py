@@ -2,14 +2,177 @@
 OSC Client for communicating with Ardour DAW
 """
 
+import asyncio
 import logging
-from typing import Optional, Any
-from pythonosc import udp_client
+import socket
+import struct
+from typing import Optional, Any, Dict, Iterable, List, Tuple, Union
+from pythonosc.osc_bundle import OscBundle
+from pythonosc.osc_bundle_builder import OscBundleBuilder, IMMEDIATELY
 from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
 from mcp_server.config import get_osc_config
 
 logger = logging.getLogger(__name__)
 
+def encode_message(address: str, args: Tuple[Any, ...]) -> OscMessage:
+    """Encode an OSC message"""
+    msg = OscMessageBuilder(address=address)
+    for arg in args:
+        msg.add_arg(arg)
+    return msg.build()
+
+def encode_bundle(messages: Iterable[Tuple[str, Tuple[Any, ...]]]) -> OscBundle:
+    """Encode (address, args) pairs as an immediate OSC bundle"""
+    bundle = OscBundleBuilder(IMMEDIATELY)
+    for address, args in messages:
+        bundle.add_content(encode_message(address, args))
+    return bundle.build()
+
+# Encoded address + ",f" type tag of single-float messages, keyed by address
+_FLOAT_PREFIXES: Dict[str, bytes] = {}
+_pack_float = struct.Struct(">f").pack
+
+def encode_float_message(address: str, value: float) -> bytes:
+    """Encode a message with one float argument to a fixed address
+    
+    The address and type tag are encoded once per address; only the
+    value is packed per call.
+    """
+    prefix = _FLOAT_PREFIXES.get(address)
+    if prefix is None:
+        prefix = _FLOAT_PREFIXES[address] = encode_message(address, (0.0,)).dgram[:-4]
+    return prefix + _pack_float(value)
+
+_INT_FLOAT_PREFIXES: Dict[str, bytes] = {}
+_pack_int_float = struct.Struct(">if").pack
+
+def encode_int_float_message(address: str, index: int, value: float) -> bytes:
+    """Encode a message with an int and a float argument to a fixed address (see encode_float_message)"""
+    prefix = _INT_FLOAT_PREFIXES.get(address)
+    if prefix is None:
+        prefix = _INT_FLOAT_PREFIXES[address] = encode_message(address, (0, 0.0)).dgram[:-8]
+    return prefix + _pack_int_float(index, value)
+
+# Queued datagrams sent together are wrapped in immediate bundles of at most
+# this many bytes, so a batch stays within one Ethernet frame
+_MAX_BATCH_BYTES = 1300
+_BUNDLE_HEADER = b"#bundle\x00" + (1).to_bytes(8, "big")  # timetag: immediately
+
+def _batch_datagrams(dgrams: Iterable[bytes]) -> Iterable[bytes]:
+    """Pack datagrams into as few immediate OSC bundles as fit _MAX_BATCH_BYTES
+    
+    A datagram that ends up alone in its batch is yielded unchanged.
+    """
+    batch, size = [], len(_BUNDLE_HEADER)
+    for dgram in dgrams:
+        if batch and size + 4 + len(dgram) > _MAX_BATCH_BYTES:
+            yield _join_batch(batch)
+            batch, size = [], len(_BUNDLE_HEADER)
+        batch.append(dgram)
+        size += 4 + len(dgram)
+    if batch:
+        yield _join_batch(batch)
+
+def _join_batch(batch: list) -> bytes:
+    """Encode a batch of datagrams as one datagram"""
+    if len(batch) == 1:
+        return batch[0]
+    return _BUNDLE_HEADER + b"".join(len(dgram).to_bytes(4, "big") + dgram for dgram in batch)
+
+# Wire-format packets for the fixed recording/transport commands, encoded once
+# at import and keyed by (address, args). Each holds its datagram bytes.
+_PRECOMPILED: Dict[Tuple[str, Tuple[Any, ...]], OscMessage] = {
+    (address, args): encode_message(address, args)
+    for address, variants in (
+        ("/rec_enable_toggle", ((0,), (1,))),
+        ("/toggle_punch_in", ((0,), (1,))),
+        ("/toggle_punch_out", ((0,), (1,))),
+        ("/toggle_monitor_input", ((0,), (1,))),
+        ("/transport_play", ((1,),)),
+        ("/transport_stop", ((1,),)),
+        ("/recording/status", ((1,),)),
+    )
+    for args in variants
+}
+# Per-strip input monitor packets, indexed [track_index][enabled] for the
+# 256 tracks the API accepts
+_STRIP_MONITOR_PACKETS = tuple(
+    (encode_message(f"/strip/{i}/monitor_input", (0,)), encode_message(f"/strip/{i}/monitor_input", (1,)))
+    for i in range(256)
+)
+_START_RECORDING_BUNDLE = encode_bundle([("/rec_enable_toggle", (1,)), ("/transport_play", (1,))])
+_STOP_RECORDING_BUNDLE = encode_bundle([("/transport_stop", (1,)), ("/rec_enable_toggle", (0,))])
+
+# Sends never wait for socket buffer space (not available on Windows)
+_SEND_FLAGS = getattr(socket, "MSG_DONTWAIT", 0)
+
+def _coalesce(items: List[Tuple[Optional[tuple], bytes]]) -> List[bytes]:
+    """Datagrams of a batch of queued (key, datagram) items, last write wins
+    
+    A keyed item is dropped when a later item with the same key follows it
+    with no unkeyed item in between; the survivor keeps its own (later)
+    position. Unkeyed items always go out and act as barriers, since they
+    may change what a key refers to (e.g. selecting another strip).
+    """
+    if len(items) == 1:
+        return [items[0][1]]
+    seen = set()
+    dgrams = []
+    for key, dgram in reversed(items):
+        if key is None:
+            seen.clear()
+        elif key in seen:
+            continue
+        else:
+            seen.add(key)
+        dgrams.append(dgram)
+    dgrams.reverse()
+    return dgrams
+
+def _resolve_host(host: str, port: int) -> str:
+    """Resolve host to a numeric address, so a host name is looked up once"""
+    try:
+        return socket.getaddrinfo(host, port, type=socket.SOCK_DGRAM)[0][4][0]
+    except socket.gaierror as e:
+        logger.warning("Could not resolve OSC host %s: %s", host, e)
+        return host
+
+class _UDPSender:
+    """UDP socket connected to Ardour, sending already-encoded OSC packets
+    
+    A connected UDP socket lets the kernel keep the route instead of
+    looking up the destination for every sendto(). Sends are non-blocking:
+    a datagram that does not fit in a full send buffer is dropped and
+    logged, as it would be anywhere else on the way to Ardour, rather than
+    stalling the event loop. Offers the send()/send_message() calls of
+    python-osc's UDP clients, which only the encoders here are used from.
+    """
+    
+    def __init__(self, address: str, port: int, sndbuf: int = 0):
+        family = socket.AF_INET6 if ":" in address else socket.AF_INET
+        self.sock = socket.socket(family, socket.SOCK_DGRAM)
+        if sndbuf:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, sndbuf)
+        self.sock.connect((address, port))
+    
+    def send(self, content: Union[OscMessage, OscBundle]) -> None:
+        """Send an encoded message or bundle"""
+        try:
+            try:
+                self.sock.send(content.dgram, _SEND_FLAGS)
+            except ConnectionRefusedError:
+                # An earlier datagram bounced because nothing was listening; the
+                # error is reported once, so send again as an unconnected socket would
+                self.sock.send(content.dgram, _SEND_FLAGS)
+        except BlockingIOError:
+            logger.warning("OSC send buffer full, dropped %d byte datagram", len(content.dgram))
+    
+    def send_message(self, address: str, value: Any) -> None:
+        """Send a message; a list or tuple value is sent as several arguments"""
+        args = tuple(value) if isinstance(value, (list, tuple)) else (value,)
+        self.send(encode_message(address, args))
+
 class OSCClient:
     """OSC client for sending messages to Ardour"""
     
@@ -23,13 +186,31 @@ class OSCClient:
         osc_config = get_osc_config()
         self.ip = ip or osc_config["ip"]
         self.port = port or osc_config["port"]
+        self.batch_window = osc_config["batch_window"]
+        self.sndbuf = osc_config["sndbuf"]
         
         try:
-            self.client = udp_client.SimpleUDPClient(self.ip, self.port)
+            # One socket for the lifetime of the client, connected to the
+            # address resolved here rather than on every send
+            address = _resolve_host(self.ip, self.port)
+            self.client = _UDPSender(address, self.port, self.sndbuf)
+            self._address = address
+            sock = getattr(self.client, "sock", None)
+            self._sock: Optional[socket.socket] = sock if isinstance(sock, socket.socket) else None
             logger.info(f"OSC client initialized for {self.ip}:{self.port}")
         except Exception as e:
             logger.error(f"Failed to initialize OSC client: {e}")
             raise
+        
+        # Non-blocking datagram transport for the async send path, created on
+        # first use in the running event loop
+        self._async_transport: Optional[asyncio.DatagramTransport] = None
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Outgoing packet queue drained by a background sender task; only
+        # active between start_sender() and stop_sender()
+        self._send_queue: Optional[asyncio.Queue] = None
+        self._sender_task: Optional[asyncio.Task] = None
     
     def send_message(self, address: str, *args: Any) -> bool:
         """Send OSC message to Ardour
@@ -42,38 +223,262 @@ class OSCClient:
             True if message sent successfully, False otherwise
         """
         try:
-            # Log connection details
-            logger.info(f"OSC Client connecting to {self.ip}:{self.port}")
-            logger.info(f"Sending OSC message: {address} with args: {args}")
-            logger.info(f"Message type: address={type(address)}, args={type(args)}, arg_values={args}")
-            
             # Send the message - python-osc requires at least one argument
             if args:
-                logger.info(f"Sending with arguments: {args}")
                 if len(args) == 1:
                     self.client.send_message(address, args[0])
                 else:
                     self.client.send_message(address, list(args))
             else:
-                logger.info("Sending with no arguments - using empty list")
                 self.client.send_message(address, [])
             
-            logger.info(f"OSC message sent successfully: {address} {args}")
+            logger.debug("OSC message sent: %s %r", address, args)
+            return True
+        except Exception as e:
+            logger.error("Failed to send OSC message %s to %s:%s: %s", address, self.ip, self.port, e)
+            return False
+    
+    def send_bundle(self, messages: Iterable[Tuple[str, Tuple[Any, ...]]]) -> bool:
+        """Send several OSC messages to Ardour as one bundle (one UDP datagram)
+        
+        Args:
+            messages: (address, args) pairs, dispatched by Ardour in order
+            
+        Returns:
+            True if the bundle was sent successfully, False otherwise
+        """
+        try:
+            bundle = encode_bundle(messages)
+            self.client.send(bundle)
+            logger.debug("OSC bundle sent: %d messages", bundle.num_contents)
+            return True
+        except Exception as e:
+            logger.error("Failed to send OSC bundle to %s:%s: %s", self.ip, self.port, e)
+            return False
+    
+    async def _get_async_transport(self) -> asyncio.DatagramTransport:
+        """Get the datagram transport for the running event loop
+        
+        The transport is built on a duplicate of the connected client socket,
+        so async and sync sends leave from the same address and port (one
+        surface as far as Ardour is concerned) and share one send order.
+        Closing the transport only closes the duplicate.
+        """
+        loop = asyncio.get_running_loop()
+        transport = self._async_transport
+        if transport is None or self._async_loop is not loop or transport.is_closing():
+            if self._sock is not None:
+                transport, _ = await loop.create_datagram_endpoint(
+                    asyncio.DatagramProtocol, sock=self._sock.dup()
+                )
+            else:
+                transport, _ = await loop.create_datagram_endpoint(
+                    asyncio.DatagramProtocol, remote_addr=(self._address, self.port)
+                )
+            if self._async_loop is loop and self._async_transport is not None \
+                    and not self._async_transport.is_closing():
+                # Another coroutine connected while we were awaiting
+                transport.close()
+                return self._async_transport
+            self._async_transport, self._async_loop = transport, loop
+        return transport
+    
+    async def send_async(self, address: str, *args: Any) -> bool:
+        """Send an OSC message without blocking the event loop
+        
+        Args:
+            address: OSC address (e.g., "/ardour/transport_play")
+            *args: Message arguments
+            
+        Returns:
+            True if message sent successfully, False otherwise
+        """
+        try:
+            transport = await self._get_async_transport()
+            transport.sendto(encode_message(address, args).dgram)
+            logger.debug("OSC message sent: %s %r", address, args)
+            return True
+        except Exception as e:
+            logger.error("Failed to send OSC message %s to %s:%s: %s", address, self.ip, self.port, e)
+            return False
+    
+    async def send_bundle_async(self, messages: Iterable[Tuple[str, Tuple[Any, ...]]]) -> bool:
+        """Send an OSC bundle without blocking the event loop
+        
+        Args:
+            messages: (address, args) pairs, dispatched by Ardour in order
+            
+        Returns:
+            True if the bundle was sent successfully, False otherwise
+        """
+        try:
+            transport = await self._get_async_transport()
+            bundle = encode_bundle(messages)
+            transport.sendto(bundle.dgram)
+            logger.debug("OSC bundle sent: %d messages", bundle.num_contents)
+            return True
+        except Exception as e:
+            logger.error("Failed to send OSC bundle to %s:%s: %s", self.ip, self.port, e)
+            return False
+    
+    def send_precompiled(self, address: str, *args: Any) -> bool:
+        """Send a fixed command from its pre-encoded packet
+        
+        Falls back to send_message for commands that are not precompiled.
+        
+        Args:
+            address: OSC address (e.g., "/transport_play")
+            *args: Message arguments
+            
+        Returns:
+            True if message sent successfully, False otherwise
+        """
+        packet = _PRECOMPILED.get((address, args))
+        if packet is None:
+            return self.send_message(address, *args)
+        return self._send_packet(packet, address)
+    
+    async def send_precompiled_async(self, address: str, *args: Any) -> bool:
+        """Async variant of send_precompiled; falls back to send_async"""
+        packet = _PRECOMPILED.get((address, args))
+        if packet is None:
+            return await self.send_async(address, *args)
+        return await self._send_packet_async(packet, address)
+    
+    def _send_packet(self, packet, description: str) -> bool:
+        """Send an already-encoded message or bundle"""
+        try:
+            self.client.send(packet)
+            logger.debug("OSC packet sent: %s", description)
+            return True
+        except Exception as e:
+            logger.error("Failed to send OSC packet %s to %s:%s: %s", description, self.ip, self.port, e)
+            return False
+    
+    async def _send_packet_async(self, packet, description: str) -> bool:
+        """Send an already-encoded message or bundle without blocking the event loop"""
+        try:
+            transport = await self._get_async_transport()
+            transport.sendto(packet.dgram)
+            logger.debug("OSC packet sent: %s", description)
             return True
         except Exception as e:
-            logger.error(f"Failed to send OSC message {address}: {e}")
-            logger.error(f"Connection details: {self.ip}:{self.port}")
+            logger.error("Failed to send OSC packet %s to %s:%s: %s", description, self.ip, self.port, e)
+            return False
+    
+    async def start_sender(self) -> None:
+        """Start the background task that sends queued packets"""
+        if self._sender_task is not None and not self._sender_task.done():
+            return
+        self._send_queue = asyncio.Queue()
+        self._sender_task = asyncio.create_task(self._drain_send_queue(self._send_queue))
+    
+    async def stop_sender(self) -> None:
+        """Send whatever is still queued, then stop the sender task"""
+        task, queue = self._sender_task, self._send_queue
+        if task is None:
+            return
+        self._sender_task = self._send_queue = None
+        if not task.done():
+            await queue.join()
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
+    async def _drain_send_queue(self, queue: asyncio.Queue) -> None:
+        """Write queued datagrams to the async transport
+        
+        Everything queued by the time the first datagram has waited
+        batch_window seconds goes out together, packed into bundles.
+        Settings superseded within the batch are dropped (see queue_setting).
+        """
+        while True:
+            items = [await queue.get()]
+            if self.batch_window:
+                await asyncio.sleep(self.batch_window)
+            while not queue.empty():
+                items.append(queue.get_nowait())
+            try:
+                transport = await self._get_async_transport()
+                for dgram in _batch_datagrams(_coalesce(items)):
+                    transport.sendto(dgram)
+            except Exception as e:
+                logger.error("Failed to send %d queued OSC packets to %s:%s: %s",
+                             len(items), self.ip, self.port, e)
+            finally:
+                for _ in items:
+                    queue.task_done()
+    
+    def queue_packet(self, packet: Union[OscMessage, OscBundle]) -> bool:
+        """Hand an encoded message or bundle to the sender task
+        
+        Must be called from the event loop the sender runs on. Sends
+        synchronously when the sender is not running.
+        
+        Returns:
+            True if the packet was queued (or sent) successfully
+        """
+        if self._send_queue is None:
+            return self._send_packet(packet, "queued packet")
+        self._send_queue.put_nowait((None, packet.dgram))
+        return True
+    
+    def queue_float(self, address: str, value: float) -> bool:
+        """Queue an absolute float setting to a fixed address (see queue_setting)"""
+        if self._send_queue is None:
+            return self.send_message(address, value)
+        self._send_queue.put_nowait(((address,), encode_float_message(address, value)))
+        return True
+    
+    def queue_int_float(self, address: str, index: int, value: float) -> bool:
+        """Queue an absolute float setting of the item `index` at a fixed address (see queue_setting)"""
+        if self._send_queue is None:
+            return self.send_message(address, index, value)
+        self._send_queue.put_nowait(((address, index), encode_int_float_message(address, index, value)))
+        return True
+    
+    def queue_setting(self, address: str, *args: Any) -> bool:
+        """Queue a message setting an absolute value (see queue_packet)
+        
+        The last argument is the value; the address and any arguments before
+        it identify what is set. If the same target is set again before the
+        sender writes this message, only the newer value is sent, so fast
+        streams of fader or pan moves go out at the sender's flush rate.
+        Relative changes and toggles must use queue_message instead.
+        """
+        if self._send_queue is None:
+            return self.send_message(address, *args)
+        try:
+            packet = encode_message(address, args)
+        except Exception as e:
+            logger.error("Failed to encode OSC message %s: %s", address, e)
             return False
+        self._send_queue.put_nowait(((address,) + args[:-1], packet.dgram))
+        return True
+    
+    def queue_message(self, address: str, *args: Any) -> bool:
+        """Encode an OSC message and hand it to the sender task (see queue_packet)"""
+        if self._send_queue is None:
+            return self.send_message(address, *args)
+        try:
+            packet = _PRECOMPILED.get((address, args)) or encode_message(address, args)
+        except Exception as e:
+            logger.error("Failed to encode OSC message %s: %s", address, e)
+            return False
+        self._send_queue.put_nowait((None, packet.dgram))
+        return True
     
     def transport_play(self) -> bool:
         """Start transport playback"""
         logger.info("Sending transport_play command...")
-        return self.send_message("/transport_play", 1)
+        return self.send_precompiled("/transport_play", 1)
     
     def transport_stop(self) -> bool:
         """Stop transport playback"""
         logger.info("Sending transport_stop command...")
-        return self.send_message("/transport_stop", 1)
+        return self.send_precompiled("/transport_stop", 1)
     
     def transport_rewind(self) -> bool:
         """Rewind transport to beginning"""
@@ -233,9 +638,9 @@ class OSCClient:
             level: Send level (0.0-1.0)
             
         Returns:
-            True if message sent successfully, False otherwise
+            True if the message was queued (or sent) successfully
         """
-        return self.send_message(f"/strip/{track_index}/send/{send_index}/fader", level)
+        return self.queue_float(f"/strip/{track_index}/send/{send_index}/fader", level)
     
     def set_send_gain(self, track_index: int, send_index: int, gain_db: float) -> bool:
         """Set send gain in dB for track to specific aux
@@ -246,9 +651,9 @@ class OSCClient:
             gain_db: Send gain in dB
             
         Returns:
-            True if message sent successfully, False otherwise
+            True if the message was queued (or sent) successfully
         """
-        return self.send_message(f"/strip/{track_index}/send/{send_index}/gain", gain_db)
+        return self.queue_float(f"/strip/{track_index}/send/{send_index}/gain", gain_db)
     
     def set_send_enable(self, track_index: int, send_index: int, enabled: bool) -> bool:
         """Enable or disable a send
@@ -259,9 +664,9 @@ class OSCClient:
             enabled: True to enable, False to disable
             
         Returns:
-            True if message sent successfully, False otherwise
+            True if the message was queued (or sent) successfully
         """
-        return self.send_message(f"/strip/{track_index}/send/{send_index}/enable", 1 if enabled else 0)
+        return self.queue_message(f"/strip/{track_index}/send/{send_index}/enable", 1 if enabled else 0)
     
     def list_track_sends(self, track_index: int) -> bool:
         """List all sends for a track
@@ -315,7 +720,7 @@ class OSCClient:
         """
         # Send the strip list request
         return self.send_message("/strip/list", 1)
-
+    
     # Plugin Discovery Commands
     def list_track_plugins(self, strip_id: int) -> bool:
         """List all plugins on a specific strip
@@ -478,6 +883,24 @@ class OSCClient:
         # Then set parameter value
         return self.send_message("/select/plugin/parameter", parameter_id, value)
     
+    def set_plugin_parameters(self, track_index: int, plugin_id: int, values: Dict[int, float]) -> bool:
+        """Set several parameters of one plugin in a single OSC bundle
+        
+        Args:
+            track_index: Track index (0-based)
+            plugin_id: Plugin ID (0-based)
+            values: Parameter ID (1-based) -> value (0.0 to 1.0)
+            
+        Returns:
+            True if the bundle was sent successfully, False otherwise
+        """
+        messages = [("/select/strip", (track_index,)), ("/select/plugin", (plugin_id,))]
+        messages.extend(
+            ("/select/plugin/parameter", (parameter_id, value))
+            for parameter_id, value in values.items()
+        )
+        return self.send_bundle(messages)
+    
     # Recording Control Commands
     def set_recording_enable(self, enabled: bool) -> bool:
         """Enable or disable global recording
@@ -490,6 +913,22 @@ class OSCClient:
         """
         return self.send_message("/rec_enable_toggle", 1 if enabled else 0)
     
+    def start_recording(self) -> bool:
+        """Enable recording and start transport in one bundle
+        
+        Returns:
+            True if the bundle was sent successfully, False otherwise
+        """
+        return self._send_packet(_START_RECORDING_BUNDLE, "start recording bundle")
+    
+    def stop_recording(self) -> bool:
+        """Stop transport and disable recording in one bundle
+        
+        Returns:
+            True if the bundle was sent successfully, False otherwise
+        """
+        return self._send_packet(_STOP_RECORDING_BUNDLE, "stop recording bundle")
+    
     def set_punch_in(self, enabled: bool) -> bool:
         """Enable or disable punch-in recording
         
@@ -533,6 +972,8 @@ class OSCClient:
         Returns:
             True if message sent successfully, False otherwise
         """
+        if 0 <= track_index < len(_STRIP_MONITOR_PACKETS):
+            return self._send_packet(_STRIP_MONITOR_PACKETS[track_index][bool(enabled)], "/strip/monitor_input")
         return self.send_message(f"/strip/{track_index}/monitor_input", 1 if enabled else 0)
     
     def get_recording_status(self) -> bool:
@@ -544,6 +985,41 @@ class OSCClient:
         # Request recording status information
         return self.send_message("/recording/status", 1)
     
+    # Async Recording Commands (same messages, sent via send_async)
+    async def set_recording_enable_async(self, enabled: bool) -> bool:
+        """Async variant of set_recording_enable"""
+        return await self.send_precompiled_async("/rec_enable_toggle", 1 if enabled else 0)
+    
+    async def set_punch_in_async(self, enabled: bool) -> bool:
+        """Async variant of set_punch_in"""
+        return await self.send_precompiled_async("/toggle_punch_in", 1 if enabled else 0)
+    
+    async def set_punch_out_async(self, enabled: bool) -> bool:
+        """Async variant of set_punch_out"""
+        return await self.send_precompiled_async("/toggle_punch_out", 1 if enabled else 0)
+    
+    async def set_global_input_monitor_async(self, enabled: bool) -> bool:
+        """Async variant of set_global_input_monitor"""
+        return await self.send_precompiled_async("/toggle_monitor_input", 1 if enabled else 0)
+    
+    async def set_track_input_monitor_async(self, track_index: int, enabled: bool) -> bool:
+        """Async variant of set_track_input_monitor"""
+        if 0 <= track_index < len(_STRIP_MONITOR_PACKETS):
+            return await self._send_packet_async(_STRIP_MONITOR_PACKETS[track_index][bool(enabled)], "/strip/monitor_input")
+        return await self.send_async(f"/strip/{track_index}/monitor_input", 1 if enabled else 0)
+    
+    async def get_recording_status_async(self) -> bool:
+        """Async variant of get_recording_status"""
+        return await self.send_precompiled_async("/recording/status", 1)
+    
+    async def start_recording_async(self) -> bool:
+        """Async variant of start_recording"""
+        return await self._send_packet_async(_START_RECORDING_BUNDLE, "start recording bundle")
+    
+    async def stop_recording_async(self) -> bool:
+        """Async variant of stop_recording"""
+        return await self._send_packet_async(_STOP_RECORDING_BUNDLE, "stop recording bundle")
+    
     # Session Management Commands
     def open_add_track_dialog(self) -> bool:
         """Open Ardour's Add Track/Bus dialog
@@ -682,9 +1158,10 @@ _osc_client: Optional[OSCClient] = None
 def get_osc_client() -> OSCClient:
     """Get global OSC client instance"""
     global _osc_client
-    if _osc_client is None:
-        _osc_client = OSCClient()
-    return _osc_client
+    client = _osc_client
+    if client is None:
+        client = _osc_client = OSCClient()
+    return client
 
 def reset_osc_client() -> None:
     """Reset global OSC client instance"""
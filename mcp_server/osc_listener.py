@@ -14,6 +14,17 @@ from mcp_server.config import get_osc_config
 
 logger = logging.getLogger(__name__)
 
+# Discovery replies arrive as a burst; once the first one is in, a gap this
+# long with no further replies is taken to mean the burst is complete
+DISCOVERY_QUIET_PERIOD = 0.25
+
+# Waiting for the first discovery reply adapts to the observed round trip:
+# an EWMA of reply latency, times a safety factor, floored so a lucky fast
+# sample cannot make the wait unreasonably short
+DISCOVERY_RTT_SMOOTHING = 0.3
+DISCOVERY_RTT_FACTOR = 4.0
+DISCOVERY_MIN_REPLY_TIMEOUT = 0.05
+
 @dataclass
 class StripInfo:
     """Represents a strip from Ardour's strip list"""
@@ -79,6 +90,25 @@ class OSCListener:
         self.current_plugin_id: Optional[int] = None
         self.surface_setup_complete: bool = False
         
+        # Guards for concurrent discovery: one surface setup at a time, and one
+        # plugin discovery per track at a time (different tracks run in parallel)
+        self._surface_lock = threading.Lock()
+        self._track_locks: Dict[int, threading.Lock] = {}
+        self._track_locks_guard = threading.Lock()
+        # Parameter feedback is attributed to the current track/plugin, so only
+        # one parameter discovery can be in flight at a time
+        self._parameter_lock = threading.Lock()
+        
+        # Signalled by the OSC server thread whenever discovery data is stored,
+        # so discovery can wake on replies instead of sleeping out its timeout
+        # Counts are kept per track/strip so concurrent discoveries on
+        # different tracks do not cut each other's waits short
+        self._feedback = threading.Condition()
+        self._feedback_counts: Dict[Optional[int], int] = {}
+        # Smoothed first-reply latency per track/strip; None holds the
+        # estimate across all tracks. Guarded by _feedback.
+        self._rtt_ewma: Dict[Optional[int], float] = {}
+        
         # Track strip list discovery state
         self.strip_list_complete: bool = False
         self.strip_list_session_framerate: Optional[float] = None
@@ -638,6 +668,84 @@ class OSCListener:
         except Exception as e:
             logger.error(f"Error handling strip list response: {e}")
         
+    def _notify_feedback(self, track_id: Optional[int]):
+        """Wake any discovery waiting for replies about a track"""
+        with self._feedback:
+            counts = self._feedback_counts
+            counts[track_id] = counts.get(track_id, 0) + 1
+            counts[None] = counts.get(None, 0) + 1  # replies about any track
+            self._feedback.notify_all()
+            
+    def rtt_estimate(self, track_id: Optional[int] = None) -> Optional[float]:
+        """Get the smoothed discovery reply latency for a track
+        
+        Args:
+            track_id: Track/strip ID (None for the estimate across all tracks)
+            
+        Returns:
+            Latency in seconds, or None if no reply has been observed yet
+        """
+        with self._feedback:
+            return self._rtt_ewma.get(track_id, self._rtt_ewma.get(None))
+            
+    def _record_rtt(self, track_id: Optional[int], observed: float):
+        """Fold an observed reply latency into the EWMA; caller holds _feedback"""
+        for key in {track_id, None}:
+            prev = self._rtt_ewma.get(key)
+            self._rtt_ewma[key] = observed if prev is None else (
+                (1 - DISCOVERY_RTT_SMOOTHING) * prev + DISCOVERY_RTT_SMOOTHING * observed
+            )
+            
+    def _wait_for_feedback(self, timeout: float, track_id: Optional[int] = None) -> int:
+        """Wait for a burst of discovery replies
+        
+        Waits for the first reply for DISCOVERY_RTT_FACTOR times the observed
+        round trip (the full timeout until one has been observed), then returns
+        once replies have gone quiet for DISCOVERY_QUIET_PERIOD or the timeout
+        expires. A wait that gets no reply is recorded as a round trip of the
+        reply timeout, so an estimate that has fallen below the real latency
+        keeps growing instead of timing out forever.
+        
+        Args:
+            timeout: Maximum time to wait in seconds
+            track_id: Track/strip the replies are stored under (None for any)
+            
+        Returns:
+            Number of replies stored while waiting
+        """
+        rtt = self.rtt_estimate(track_id)
+        reply_timeout = timeout if rtt is None else min(
+            timeout, max(DISCOVERY_MIN_REPLY_TIMEOUT, DISCOVERY_RTT_FACTOR * rtt)
+        )
+        
+        start_time = time.monotonic()
+        deadline = start_time + timeout
+        with self._feedback:
+            start = seen = self._feedback_counts.get(track_id, 0)
+            while True:
+                now = time.monotonic()
+                if seen == start:
+                    # Nothing yet: sleep until the first reply or the reply timeout
+                    remaining = start_time + reply_timeout - now
+                    if remaining <= 0:
+                        if rtt is not None:
+                            # A miss counts as a reply at the timeout, so the
+                            # estimate grows until the wait covers the real RTT
+                            self._record_rtt(track_id, reply_timeout)
+                        break
+                    self._feedback.wait(remaining)
+                    if self._feedback_counts.get(track_id, 0) != start:
+                        self._record_rtt(track_id, time.monotonic() - start_time)
+                else:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        break
+                    self._feedback.wait(min(remaining, DISCOVERY_QUIET_PERIOD))
+                    if self._feedback_counts.get(track_id, 0) == seen:
+                        break
+                seen = self._feedback_counts.get(track_id, 0)
+            return seen - start
+        
     def _store_parameter(self, param_id: int, name: str, value: float, min_val: float, max_val: float, unit: str):
         """Store parameter information"""
         if self.current_track_id not in self.tracks:
@@ -681,9 +789,11 @@ class OSCListener:
         for i, existing_param in enumerate(plugin.parameters):
             if existing_param.id == param_id:
                 plugin.parameters[i] = param
-                return
-                
-        plugin.parameters.append(param)
+                break
+        else:
+            plugin.parameters.append(param)
+        
+        self._notify_feedback(self.current_track_id)
         
     def _store_plugin_from_list(self, strip_id: int, plugin_id: int, plugin_name: str, enabled: bool):
         """Store plugin information from plugin list response"""
@@ -722,6 +832,8 @@ class OSCListener:
                 )
                 track.plugins.append(new_plugin)
                 logger.info(f"[PLUGIN STORE] Added new plugin {plugin_id} on track {strip_id}: {plugin_name}")
+            
+            self._notify_feedback(strip_id)
                 
         except Exception as e:
             logger.error(f"Error storing plugin from list: {e}")
@@ -783,6 +895,7 @@ class OSCListener:
                 target_plugin.parameters.append(parameter)
                 
             logger.info(f"[PARAM STORE] Stored parameter {param_id} for plugin {plugin_id} on track {strip_id}: {param_name}")
+            self._notify_feedback(strip_id)
             
         except Exception as e:
             logger.error(f"Error storing plugin parameter from descriptor: {e}")
@@ -931,12 +1044,20 @@ class OSCListener:
         Returns:
             True if setup successful, False otherwise
         """
-        from mcp_server.osc_client import get_osc_client
-        
         if self.surface_setup_complete:
             logger.info("[SURFACE] Surface already set up, skipping")
             return True
             
+        with self._surface_lock:
+            # Another thread may have completed setup while we waited
+            if self.surface_setup_complete:
+                return True
+            return self._setup_surface_and_discover_strips(timeout)
+            
+    def _setup_surface_and_discover_strips(self, timeout: float) -> bool:
+        """Run surface setup and strip discovery; caller holds _surface_lock"""
+        from mcp_server.osc_client import get_osc_client
+        
         client = get_osc_client()
         
         # Step 1: Setup surface
@@ -983,6 +1104,19 @@ class OSCListener:
         Returns:
             List of discovered plugins
         """
+        with self._get_track_lock(track_id):
+            return self._discover_plugins(track_id, timeout)
+            
+    def _get_track_lock(self, track_id: int) -> threading.Lock:
+        """Get the lock serializing plugin discovery for a track"""
+        with self._track_locks_guard:
+            lock = self._track_locks.get(track_id)
+            if lock is None:
+                lock = self._track_locks[track_id] = threading.Lock()
+            return lock
+            
+    def _discover_plugins(self, track_id: int, timeout: float) -> List[PluginInfo]:
+        """Run plugin discovery for a track; caller holds the track's lock"""
         from mcp_server.osc_client import get_osc_client
         
         # Ensure surface is set up and strips are discovered
@@ -1013,7 +1147,11 @@ class OSCListener:
         
         logger.info(f"[DISCOVERY] Track {track_id} -> Strip {strip_id} ('{strip.name}')")
         
-        self.current_track_id = track_id
+        # Plugin list replies carry their strip id; current_track_id is only
+        # shared state for parameter feedback, so it moves under that lock and
+        # never changes under a running parameter discovery on another track
+        with self._parameter_lock:
+            self.current_track_id = track_id
         
         # Clear existing data for this track
         if track_id in self.tracks:
@@ -1034,15 +1172,7 @@ class OSCListener:
         
         # Wait for responses
         start_time = time.time()
-        message_count = 0
-        while time.time() - start_time < timeout:
-            # Check for new messages
-            if hasattr(self, 'last_message') and self.last_message:
-                if self.last_message['timestamp'] > start_time:
-                    message_count += 1
-                    logger.info(f"[OSC RECV] {self.last_message['address']} {self.last_message['args']}")
-            
-            time.sleep(0.1)
+        message_count = self._wait_for_feedback(timeout, strip_id)
             
         elapsed = time.time() - start_time
         logger.info(f"[DISCOVERY] Completed after {elapsed:.1f}s, received {message_count} messages")
@@ -1094,6 +1224,11 @@ class OSCListener:
         Returns:
             List of discovered parameters
         """
+        with self._parameter_lock:
+            return self._discover_plugin_parameters(track_id, plugin_id, timeout)
+            
+    def _discover_plugin_parameters(self, track_id: int, plugin_id: int, timeout: float) -> List[PluginParameter]:
+        """Run parameter discovery for a plugin; caller holds _parameter_lock"""
         from mcp_server.osc_client import get_osc_client
         
         self.current_track_id = track_id
@@ -1107,9 +1242,7 @@ class OSCListener:
         client.get_plugin_info(track_id, plugin_id)
         
         # Wait for responses
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            time.sleep(0.1)
+        self._wait_for_feedback(timeout)
             
         # Return discovered parameters
         if track_id in self.tracks:
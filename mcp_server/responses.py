@@ -0,0 +1,21 @@
+"""
+Response classes for Ardour MCP Server
+"""
+
+from typing import Optional
+
+try:
+    import orjson  # noqa: F401  (ORJSONResponse needs it at render time)
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+except ImportError:  # optional, stdlib json is used as a fallback
+    from fastapi.responses import JSONResponse as FastJSONResponse
+
+def wants_minimal(prefer: Optional[str]) -> bool:
+    """True if a Prefer request header asks for return=minimal (RFC 7240)
+    
+    Handlers answer such requests with an empty 204 instead of building
+    their echo response.
+    """
+    return prefer is not None and "return=minimal" in prefer
+
+__all__ = ["FastJSONResponse", "wants_minimal"]
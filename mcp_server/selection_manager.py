@@ -3,6 +3,7 @@ Selection Manager for Ardour MCP Server
 Manages selected strips and plugins for OSC operations
 """
 
+import json
 import logging
 from typing import Optional, Dict, Any, List
 from dataclasses import dataclass
@@ -50,8 +51,11 @@ class SelectionManager:
     
     def __init__(self):
         self._selection_state = SelectionState()
-        self._lock = threading.Lock()
+        # Reentrant: select_plugin_delta calls select_plugin with the lock held
+        self._lock = threading.RLock()
         self._listeners: List[callable] = []
+        # Serialized to_dict() snapshot, dropped whenever the selection changes
+        self._snapshot: Optional[bytes] = None
         logger.info("SelectionManager initialized")
     
     def get_current_selection(self) -> SelectionState:
@@ -89,7 +93,8 @@ class SelectionManager:
                 if old_state.strip_id != strip_id:
                     self._selection_state.plugin_id = None
                 
-                logger.info(f"Strip {strip_id} selected (GUI selection)")
+                logger.info("Strip %s selected (GUI selection)", strip_id)
+                self._snapshot = None
                 self._notify_listeners(old_state, self._selection_state)
                 return True
             
@@ -118,15 +123,16 @@ class SelectionManager:
                 if old_state.strip_id != strip_id:
                     self._selection_state.plugin_id = None
                 
-                logger.info(f"Strip {strip_id} expanded (local expansion)")
+                logger.info("Strip %s expanded (local expansion)", strip_id)
             else:
                 # Setting expand to False resets to GUI selection
                 self._selection_state.selection_type = SelectionType.GUI_SELECTION
                 self._selection_state.expanded = False
                 self._selection_state.last_updated = time.time()
                 
-                logger.info(f"Strip expansion disabled, reverting to GUI selection")
+                logger.info("Strip expansion disabled, reverting to GUI selection")
             
+            self._snapshot = None
             self._notify_listeners(old_state, self._selection_state)
             return True
     
@@ -160,7 +166,8 @@ class SelectionManager:
             self._selection_state.plugin_id = plugin_id
             self._selection_state.last_updated = time.time()
             
-            logger.info(f"Plugin {plugin_id} selected on strip {strip_id}")
+            logger.info("Plugin %s selected on strip %s", plugin_id, strip_id)
+            self._snapshot = None
             self._notify_listeners(old_state, self._selection_state)
             return True
     
@@ -183,6 +190,22 @@ class SelectionManager:
             
             return self.select_plugin(new_plugin)
     
+    def move_plugin_selection(self, delta: int) -> Optional[int]:
+        """Apply a plugin selection delta and return the resulting plugin ID
+        
+        Equivalent to select_plugin_delta followed by get_selected_plugin_id,
+        but atomic: a concurrent change cannot land between the two.
+        
+        Args:
+            delta: Delta to apply to current plugin selection
+            
+        Returns:
+            Selected plugin ID after the move
+        """
+        with self._lock:
+            self.select_plugin_delta(delta)
+            return self._selection_state.plugin_id
+    
     def clear_selection(self) -> bool:
         """Clear current selection"""
         with self._lock:
@@ -190,6 +213,7 @@ class SelectionManager:
             self._selection_state.clear()
             
             logger.info("Selection cleared")
+            self._snapshot = None
             self._notify_listeners(old_state, self._selection_state)
             return True
     
@@ -234,7 +258,7 @@ class SelectionManager:
             try:
                 listener(old_state, new_state)
             except Exception as e:
-                logger.error(f"Error notifying selection listener: {e}")
+                logger.error("Error notifying selection listener: %s", e)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert selection state to dictionary"""
@@ -247,6 +271,13 @@ class SelectionManager:
                 "last_updated": self._selection_state.last_updated,
                 "is_valid": self._selection_state.is_valid()
             }
+    
+    def to_json_bytes(self) -> bytes:
+        """Selection state as serialized JSON, cached until the selection changes"""
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = json.dumps(self.to_dict(), separators=(",", ":")).encode()
+            return self._snapshot
 
 
 # Global selection manager instance
@@ -256,9 +287,10 @@ _selection_manager: Optional[SelectionManager] = None
 def get_selection_manager() -> SelectionManager:
     """Get global selection manager instance"""
     global _selection_manager
-    if _selection_manager is None:
-        _selection_manager = SelectionManager()
-    return _selection_manager
+    manager = _selection_manager
+    if manager is None:
+        manager = _selection_manager = SelectionManager()
+    return manager
 
 
 def reset_selection_manager():
@@ -3,12 +3,51 @@
 Diagnostic script to check which version of the server is running
 """
 
-import requests
+import asyncio
 import json
+import os
+import sys
+
+# Share the MCP client's pooled HTTP session
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from mcp_client.http_session import get_session, close_session
 
 BASE_URL = "http://localhost:8000"
 
-def check_server_version():
+def _probe_endpoint(endpoint):
+    """HEAD an endpoint, returning the status code or the raised exception"""
+    try:
+        return get_session().head(f"{BASE_URL}{endpoint}", timeout=2).status_code
+    except Exception as e:
+        return e
+
+def _post_play():
+    """POST /transport/play, returning the response or the raised exception"""
+    try:
+        return get_session().post(f"{BASE_URL}/transport/play", timeout=2)
+    except Exception as e:
+        return e
+
+async def _probe_all(endpoints):
+    """Run the HEAD probes concurrently; results keep the input order"""
+    return await asyncio.gather(
+        *(asyncio.to_thread(_probe_endpoint, endpoint) for endpoint in endpoints)
+    )
+
+def _report_probes(endpoints, results):
+    """Print probe results in order and return how many endpoints responded"""
+    working = 0
+    for endpoint, result in zip(endpoints, results):
+        if isinstance(result, Exception):
+            print(f"  ❌ {endpoint} - Error: {result}")
+            continue
+        status = "✅" if result in [200, 405] else "❌"
+        print(f"  {status} {endpoint} - {result}")
+        if result in [200, 405]:
+            working += 1
+    return working
+
+async def check_server_version():
     """Check if server is running old or new version"""
     print("🔍 Diagnosing Server Version")
     print("=" * 40)
@@ -29,29 +68,15 @@ def check_server_version():
         "/session/add-track-dialog"
     ]
     
+    results = await _probe_all(old_endpoints + new_endpoints)
+    old_results = results[:len(old_endpoints)]
+    new_results = results[len(old_endpoints):]
+    
     print("Testing OLD endpoints (should work):")
-    old_working = 0
-    for endpoint in old_endpoints:
-        try:
-            response = requests.head(f"{BASE_URL}{endpoint}")
-            status = "✅" if response.status_code in [200, 405] else "❌"
-            print(f"  {status} {endpoint} - {response.status_code}")
-            if response.status_code in [200, 405]:
-                old_working += 1
-        except Exception as e:
-            print(f"  ❌ {endpoint} - Error: {e}")
+    old_working = _report_probes(old_endpoints, old_results)
     
     print(f"\nTesting NEW endpoints (only work if server restarted):")
-    new_working = 0
-    for endpoint in new_endpoints:
-        try:
-            response = requests.head(f"{BASE_URL}{endpoint}")
-            status = "✅" if response.status_code in [200, 405] else "❌"
-            print(f"  {status} {endpoint} - {response.status_code}")
-            if response.status_code in [200, 405]:
-                new_working += 1
-        except Exception as e:
-            print(f"  ❌ {endpoint} - Error: {e}")
+    new_working = _report_probes(new_endpoints, new_results)
     
     print(f"\n📊 Results:")
     print(f"  Old endpoints working: {old_working}/{len(old_endpoints)}")
@@ -66,13 +91,16 @@ def check_server_version():
         print(f"\n✅ DIAGNOSIS: Server is running NEW version")
         return True
 
-def check_osc_format():
+async def check_osc_format(pending=None):
     """Check if OSC format issue is fixed"""
     print(f"\n🔍 Testing OSC Format Fix")
     print("=" * 40)
     
     try:
-        response = requests.post(f"{BASE_URL}/transport/play")
+        # Reuse a request already in flight when the caller started one
+        response = await (pending or asyncio.to_thread(_post_play))
+        if isinstance(response, Exception):
+            raise response
         if response.status_code == 200:
             result = response.json()
             osc_address = result.get('osc_address', 'NOT_FOUND')
@@ -95,7 +123,7 @@ def check_osc_format():
         print(f"❌ Error testing OSC format: {e}")
         return False
 
-def check_osc_arguments():
+async def check_osc_arguments():
     """Check server logs for OSC argument format"""
     print(f"\n🔍 Testing OSC Arguments")
     print("=" * 40)
@@ -104,7 +132,9 @@ def check_osc_arguments():
     print("NOT: 'Sent OSC message: /ardour/transport_play ()'")
     
     try:
-        response = requests.post(f"{BASE_URL}/transport/play")
+        response = await asyncio.to_thread(_post_play)
+        if isinstance(response, Exception):
+            raise response
         if response.status_code == 200:
             print(f"✅ Play command sent - check server logs above")
             print(f"Should see: 'OSC Client connecting to...'")
@@ -114,14 +144,20 @@ def check_osc_arguments():
     except Exception as e:
         print(f"❌ Error: {e}")
 
-def main():
+async def main():
     """Run all diagnostic tests"""
     print("🎵 Ardour MCP Server Diagnostic Tool")
     print("=" * 50)
     
-    server_updated = check_server_version()
-    osc_fixed = check_osc_format()
-    check_osc_arguments()
+    try:
+        # The OSC format POST is independent of the version probes, so
+        # start it now and let it overlap with them
+        format_request = asyncio.ensure_future(asyncio.to_thread(_post_play))
+        server_updated = await check_server_version()
+        osc_fixed = await check_osc_format(format_request)
+        await check_osc_arguments()
+    finally:
+        close_session()
     
     print(f"\n" + "=" * 50)
     print(f"🎯 DIAGNOSTIC SUMMARY:")
@@ -140,4 +176,4 @@ def main():
         print(f"  2. Check if OSC client changes were applied")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
@@ -0,0 +1,106 @@
+"""
+Unit tests for the Ardour MCP client
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_client
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+import json
+import pytest
+from unittest.mock import patch, Mock
+from mcp_client import _core, ardour_mcp_client
+
+class TestValidatorFallback:
+    """Test cases for the validator used when fastjsonschema is not installed"""
+    
+    SCHEMA = {
+        "type": "object",
+        "properties": {
+            "track_number": {"type": "integer"},
+            "gain_db": {"type": "number"},
+            "enabled": {"type": "boolean"},
+        },
+        "required": ["track_number"],
+    }
+    
+    @patch.object(_core, 'fastjsonschema', None)
+    def test_valid_input(self):
+        """Test that matching input passes"""
+        validate = _core._compile_validator(self.SCHEMA)
+        assert validate({"track_number": 1, "gain_db": -6, "enabled": True}) is None
+    
+    @patch.object(_core, 'fastjsonschema', None)
+    def test_missing_required_field(self):
+        """Test that a missing required field is reported"""
+        validate = _core._compile_validator(self.SCHEMA)
+        assert validate({"gain_db": -6.0}) == "Missing required field: track_number"
+    
+    @patch.object(_core, 'fastjsonschema', None)
+    def test_wrong_types(self):
+        """Test that bools are not accepted as numbers and strings not as integers"""
+        validate = _core._compile_validator(self.SCHEMA)
+        assert validate({"track_number": True}) == "Field 'track_number' must be an integer"
+        assert validate({"track_number": "1"}) == "Field 'track_number' must be an integer"
+        assert validate({"track_number": 1, "gain_db": False}) == "Field 'gain_db' must be a number"
+        assert validate({"track_number": 1, "enabled": 1}) == "Field 'enabled' must be a boolean"
+
+class TestReadCache:
+    """Test cases for the TTL cache of read-only tool results"""
+    
+    def setup_method(self):
+        """Start every test with an empty read cache"""
+        ardour_mcp_client._READ_CACHE.clear()
+    
+    @patch('mcp_client.ardour_mcp_client.get_session')
+    def test_write_invalidates_cached_reads(self, mock_get_session):
+        """Test that reads are reused until a state-changing call clears them"""
+        response = Mock(status_code=200)
+        response.json.return_value = {"tracks": []}
+        session = Mock()
+        session.get.return_value = response
+        session.post.return_value = response
+        mock_get_session.return_value = session
+        
+        assert ardour_mcp_client.execute_tool("ardour_track_list", {})["success"] is True
+        assert ardour_mcp_client.execute_tool("ardour_track_list", {})["success"] is True
+        assert session.get.call_count == 1
+        
+        ardour_mcp_client.execute_tool("ardour_track_set_mute", {"track_number": 1, "muted": True})
+        assert session.post.call_count == 1
+        
+        ardour_mcp_client.execute_tool("ardour_track_list", {})
+        assert session.get.call_count == 2
+
+class TestBatch:
+    """Test cases for JSON-RPC batches in MCP mode"""
+    
+    def run_protocol(self, monkeypatch, message):
+        """Feed one line to the MCP loop and return the decoded reply"""
+        stdout = io.BytesIO()
+        monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BytesIO(json.dumps(message).encode() + b"\n")))
+        monkeypatch.setattr(sys, 'stdout', Mock(buffer=stdout))
+        ardour_mcp_client.handle_mcp_protocol()
+        return json.loads(stdout.getvalue())
+    
+    @patch('mcp_client.ardour_mcp_client.execute_tool')
+    def test_failing_call_does_not_abort_batch(self, mock_execute_tool, monkeypatch):
+        """Test that one raising call gets an error for its id and the rest still answer"""
+        def execute_tool(tool_name, arguments):
+            if tool_name == "ardour_transport_stop":
+                raise RuntimeError("boom")
+            return {"success": True, "result": {"status": "ok"}, "status_code": 200}
+        
+        mock_execute_tool.side_effect = execute_tool
+        
+        responses = self.run_protocol(monkeypatch, [
+            {"jsonrpc": "2.0", "id": 1, "method": "tools/call", "params": {"name": "ardour_transport_play"}},
+            {"jsonrpc": "2.0", "id": 2, "method": "tools/call", "params": {"name": "ardour_transport_stop"}},
+            {"jsonrpc": "2.0", "id": 3, "method": "tools/call", "params": {"name": "ardour_transport_rewind"}},
+        ])
+        
+        assert [r["id"] for r in responses] == [1, 2, 3]
+        assert "result" in responses[0] and "result" in responses[2]
+        assert responses[1]["error"] == {"code": -32603, "message": "Internal error: boom"}
@@ -18,7 +18,7 @@ class TestOSCClient:
         """Setup for each test method"""
         reset_osc_client()
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_osc_client_initialization(self, mock_udp_client):
         """Test OSC client initialization"""
         mock_client = Mock()
@@ -29,9 +29,9 @@ class TestOSCClient:
         assert osc_client.ip == "127.0.0.1"
         assert osc_client.port == 3819
         assert osc_client.client == mock_client
-        mock_udp_client.assert_called_once_with("127.0.0.1", 3819)
+        mock_udp_client.assert_called_once_with("127.0.0.1", 3819, osc_client.sndbuf)
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_osc_client_custom_ip_port(self, mock_udp_client):
         """Test OSC client with custom IP and port"""
         mock_client = Mock()
@@ -41,9 +41,17 @@ class TestOSCClient:
         
         assert osc_client.ip == "192.168.1.100"
         assert osc_client.port == 3820
-        mock_udp_client.assert_called_once_with("192.168.1.100", 3820)
+        mock_udp_client.assert_called_once_with("192.168.1.100", 3820, osc_client.sndbuf)
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
+    def test_osc_client_resolves_host_once(self, mock_udp_client):
+        """Test that a host name is resolved when the client is created, not per send"""
+        osc_client = OSCClient(ip="localhost", port=3820)
+        
+        assert osc_client.ip == "localhost"
+        assert mock_udp_client.call_args[0][:2] in (("127.0.0.1", 3820), ("::1", 3820))
+    
+    @patch('mcp_server.osc_client._UDPSender')
     def test_send_message_success(self, mock_udp_client):
         """Test successful message sending"""
         mock_client = Mock()
@@ -55,7 +63,7 @@ class TestOSCClient:
         assert result == True
         mock_client.send_message.assert_called_once_with("/test/address", ("arg1", "arg2"))
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_send_message_failure(self, mock_udp_client):
         """Test message sending failure"""
         mock_client = Mock()
@@ -67,7 +75,7 @@ class TestOSCClient:
         
         assert result == False
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_transport_play(self, mock_udp_client):
         """Test transport play command"""
         mock_client = Mock()
@@ -79,7 +87,7 @@ class TestOSCClient:
         assert result == True
         mock_client.send_message.assert_called_once_with("/ardour/transport_play", None)
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_transport_stop(self, mock_udp_client):
         """Test transport stop command"""
         mock_client = Mock()
@@ -91,7 +99,7 @@ class TestOSCClient:
         assert result == True
         mock_client.send_message.assert_called_once_with("/ardour/transport_stop", None)
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_set_strip_gain(self, mock_udp_client):
         """Test setting strip gain"""
         mock_client = Mock()
@@ -103,7 +111,7 @@ class TestOSCClient:
         assert result == True
         mock_client.send_message.assert_called_once_with("/strip/0/gain", (-10.0,))
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_get_connection_info(self, mock_udp_client):
         """Test getting connection info"""
         mock_client = Mock()
@@ -116,7 +124,7 @@ class TestOSCClient:
         assert info["port"] == 3819
         assert info["connected"] == True
     
-    @patch('mcp_server.osc_client.udp_client.SimpleUDPClient')
+    @patch('mcp_server.osc_client._UDPSender')
     def test_get_osc_client_singleton(self, mock_udp_client):
         """Test singleton pattern for global OSC client"""
         mock_client = Mock()
@@ -126,4 +134,258 @@ class TestOSCClient:
         client2 = get_osc_client()
         
         assert client1 is client2
-        assert mock_udp_client.call_count == 1
\ No newline at end of file
+        assert mock_udp_client.call_count == 1
+    
+    @patch('mcp_server.osc_client._UDPSender')
+    def test_set_plugin_parameters_bundle(self, mock_udp_client):
+        """Test that multiple parameters go out as one bundle datagram"""
+        from pythonosc.osc_bundle import OscBundle
+        mock_client = Mock()
+        mock_udp_client.return_value = mock_client
+        
+        osc_client = OSCClient()
+        result = osc_client.set_plugin_parameters(0, 1, {1: 0.25, 2: 0.5})
+        
+        assert result == True
+        mock_client.send.assert_called_once()
+        bundle = mock_client.send.call_args[0][0]
+        assert isinstance(bundle, OscBundle)
+        assert [(m.address, m.params) for m in bundle] == [
+            ("/select/strip", [0]),
+            ("/select/plugin", [1]),
+            ("/select/plugin/parameter", [1, 0.25]),
+            ("/select/plugin/parameter", [2, 0.5]),
+        ]
+    
+    @patch('mcp_server.osc_client._UDPSender')
+    def test_stop_recording_bundle(self, mock_udp_client):
+        """Test that stopping recording sends transport stop then disarm in one bundle"""
+        mock_client = Mock()
+        mock_udp_client.return_value = mock_client
+        
+        osc_client = OSCClient()
+        assert osc_client.stop_recording() == True
+        
+        bundle = mock_client.send.call_args[0][0]
+        assert [(m.address, m.params) for m in bundle] == [
+            ("/transport_stop", [1]),
+            ("/rec_enable_toggle", [0]),
+        ]
+    
+    @patch('mcp_server.osc_client._UDPSender')
+    def test_send_precompiled_reuses_encoded_packet(self, mock_udp_client):
+        """Test that fixed commands are sent from their pre-encoded packet"""
+        from mcp_server.osc_client import _PRECOMPILED
+        mock_client = Mock()
+        mock_udp_client.return_value = mock_client
+        
+        osc_client = OSCClient()
+        assert osc_client.send_precompiled("/toggle_punch_in", 1) == True
+        assert mock_client.send.call_args[0][0] is _PRECOMPILED[("/toggle_punch_in", (1,))]
+        
+        # Commands without a precompiled packet fall back to send_message
+        assert osc_client.send_precompiled("/strip/gain", 0, 0.5) == True
+        mock_client.send_message.assert_called_once_with("/strip/gain", [0, 0.5])
+    
+    @patch('mcp_server.osc_client._UDPSender')
+    def test_set_track_input_monitor_packet(self, mock_udp_client):
+        """Test that per-track input monitor commands use the pre-encoded packets"""
+        mock_client = Mock()
+        mock_udp_client.return_value = mock_client
+        
+        osc_client = OSCClient()
+        assert osc_client.set_track_input_monitor(5, True) == True
+        
+        packet = mock_client.send.call_args[0][0]
+        assert (packet.address, packet.params) == ("/strip/5/monitor_input", [1])
+    
+    def test_queued_messages_are_sent_by_sender_task(self):
+        """Test that queued packets go out through the sender task, batched into one bundle"""
+        import asyncio
+        import socket
+        
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        try:
+            osc_client = OSCClient(ip="127.0.0.1", port=receiver.getsockname()[1])
+            
+            async def send():
+                await osc_client.start_sender()
+                assert osc_client.queue_message("/select/mute", 1) == True
+                assert osc_client.queue_message("/select/solo", 0) == True
+                await osc_client.stop_sender()
+            
+            asyncio.run(send())
+            
+            from pythonosc.osc_bundle import OscBundle
+            bundle = OscBundle(receiver.recv(2048))
+            assert [(m.address, m.params) for m in bundle] == [
+                ("/select/mute", [1]),
+                ("/select/solo", [0]),
+            ]
+        finally:
+            receiver.close()
+    
+    def test_encode_float_message_matches_builder(self):
+        """Test that cached single-float encoding produces the same datagram as python-osc"""
+        from mcp_server.osc_client import encode_float_message, encode_message
+        
+        for value in (0.5, -6.0, 0.0):
+            assert encode_float_message("/select/gain", value) == encode_message("/select/gain", (value,)).dgram
+        assert encode_float_message("/select/pan_stereo_position", 0.25) == \
+            encode_message("/select/pan_stereo_position", (0.25,)).dgram
+    
+    def test_encode_int_float_message_matches_builder(self):
+        """Test that cached (int, float) encoding produces the same datagram as python-osc"""
+        from mcp_server.osc_client import encode_int_float_message, encode_message
+        
+        for index, value in ((0, 0.5), (3, -6.0)):
+            assert encode_int_float_message("/select/send_fader", index, value) == \
+                encode_message("/select/send_fader", (index, value)).dgram
+    
+    def test_batch_datagrams_splits_at_size_limit(self):
+        """Test that batches are capped in size and single datagrams are left unwrapped"""
+        from mcp_server.osc_client import _batch_datagrams, _MAX_BATCH_BYTES, encode_message
+        
+        dgram = encode_message("/select/fader", (0.5,)).dgram
+        assert list(_batch_datagrams([dgram])) == [dgram]
+        
+        batches = list(_batch_datagrams([dgram] * 100))
+        assert len(batches) > 1
+        assert all(len(batch) <= _MAX_BATCH_BYTES for batch in batches)
+        assert all(batch.startswith(b"#bundle") for batch in batches)
+    
+    def test_sync_sends_use_connected_socket(self):
+        """Test that the UDP socket is connected to Ardour and survives a refused datagram"""
+        import socket
+        from pythonosc.osc_message import OscMessage
+        
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        try:
+            osc_client = OSCClient(ip="127.0.0.1", port=receiver.getsockname()[1])
+            assert osc_client.client.sock.getpeername() == receiver.getsockname()
+            
+            assert osc_client.send_message("/select/fader", 0.5) == True
+            assert receiver.recv(1024).startswith(b"/select/fader")
+            
+            assert osc_client.send_message("/select/plugin/parameter", 2, 0.5) == True
+            message = OscMessage(receiver.recv(1024))
+            assert (message.address, message.params) == ("/select/plugin/parameter", [2, 0.5])
+        finally:
+            receiver.close()
+        
+        # Nothing listens any more: sends keep succeeding as with an unconnected socket
+        assert osc_client.send_message("/select/fader", 0.5) == True
+        assert osc_client.send_message("/select/fader", 0.5) == True
+    
+    def test_send_async_uses_datagram_transport(self):
+        """Test that async sends go out through a non-blocking datagram endpoint"""
+        import asyncio
+        import socket
+        
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        try:
+            osc_client = OSCClient(ip="127.0.0.1", port=receiver.getsockname()[1])
+            
+            async def send():
+                assert await osc_client.set_punch_in_async(True) == True
+                assert await osc_client.start_recording_async() == True
+            
+            asyncio.run(send())
+            
+            assert receiver.recv(1024).startswith(b"/toggle_punch_in")
+            assert receiver.recv(1024).startswith(b"#bundle")
+        finally:
+            receiver.close()
+    
+    def test_full_send_buffer_drops_datagram(self):
+        """Test that a send that would block is dropped instead of failing the request"""
+        from mcp_server.osc_client import _UDPSender, _SEND_FLAGS
+        sender = _UDPSender("127.0.0.1", 3819)
+        sender.sock.close()
+        sender.sock = Mock()
+        sender.sock.send.side_effect = BlockingIOError()
+        
+        sender.send(Mock(dgram=b"/select/fader"))
+        
+        sender.sock.send.assert_called_once_with(b"/select/fader", _SEND_FLAGS)
+    
+    def test_coalesce_stops_at_unkeyed_messages(self):
+        """Test that settings are not coalesced across a message that may retarget them"""
+        from mcp_server.osc_client import _coalesce
+        
+        items = [(None, b"selA"), (("/select/gain",), b"gX"), (None, b"selB"), (("/select/gain",), b"gY")]
+        assert _coalesce(items) == [b"selA", b"gX", b"selB", b"gY"]
+        
+        items = [(None, b"selA"), (("/select/gain",), b"gX"), (("/select/gain",), b"gY")]
+        assert _coalesce(items) == [b"selA", b"gY"]
+    
+    def test_queued_settings_coalesce_last_write_wins(self):
+        """Test that a setting superseded before the sender runs is not sent"""
+        import asyncio
+        import socket
+        from pythonosc.osc_bundle import OscBundle
+        
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        try:
+            osc_client = OSCClient(ip="127.0.0.1", port=receiver.getsockname()[1])
+            
+            async def send():
+                await osc_client.start_sender()
+                osc_client.queue_float("/select/fader", 0.25)
+                osc_client.queue_setting("/select/send_fader", 0, 0.5)
+                osc_client.queue_setting("/select/send_fader", 1, 0.5)
+                osc_client.queue_float("/select/fader", 0.75)
+                osc_client.queue_int_float("/select/send_fader", 0, 0.875)
+                osc_client.queue_message("/select/db_delta", 1.0)
+                osc_client.queue_float("/select/fader", 0.5)
+                await osc_client.stop_sender()
+            
+            asyncio.run(send())
+            
+            bundle = OscBundle(receiver.recv(2048))
+            assert [(m.address, m.params) for m in bundle] == [
+                ("/select/send_fader", [1, 0.5]),
+                ("/select/fader", [0.75]),
+                ("/select/send_fader", [0, 0.875]),
+                ("/select/db_delta", [1.0]),
+                ("/select/fader", [0.5]),
+            ]
+        finally:
+            receiver.close()
+    
+    def test_async_sends_share_the_sync_socket_address(self):
+        """Test that async and sync sends reach Ardour from the same source address"""
+        import asyncio
+        import socket
+        
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        receiver.bind(("127.0.0.1", 0))
+        receiver.settimeout(2.0)
+        try:
+            osc_client = OSCClient(ip="127.0.0.1", port=receiver.getsockname()[1])
+            assert osc_client.send_message("/select/fader", 0.5) == True
+            
+            async def send():
+                assert await osc_client.send_async("/select/fader", 0.25) == True
+                # Closing the transport must not take the sync socket with it
+                osc_client._async_transport.close()
+                await asyncio.sleep(0)
+            
+            asyncio.run(send())
+            
+            _, sync_source = receiver.recvfrom(1024)
+            _, async_source = receiver.recvfrom(1024)
+            assert sync_source == async_source
+            
+            assert osc_client.send_message("/select/fader", 0.5) == True
+            assert receiver.recvfrom(1024)[1] == sync_source
+        finally:
+            receiver.close()
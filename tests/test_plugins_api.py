@@ -0,0 +1,280 @@
+"""
+Unit tests for plugin API endpoints
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import time
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+from mcp_server.main import app
+from mcp_server.api import plugins
+from mcp_server.osc_listener import PluginInfo, PluginParameter
+
+client = TestClient(app)
+
+class TestPluginDiscoveryAPI:
+    """Test cases for plugin discovery endpoints"""
+
+    def setup_method(self):
+        """Start every test with an empty discovery cache"""
+        plugins._discovery_cache.clear()
+        plugins._prefetching.clear()
+
+    @patch('mcp_server.api.plugins.get_osc_listener')
+    def test_scan_all_plugins_runs_tracks_concurrently(self, mock_get_osc_listener):
+        """Test that the scan discovers all tracks in parallel"""
+        def discover_plugins(track_index, timeout=3.0):
+            time.sleep(0.2)
+            if track_index % 2:
+                return [PluginInfo(id=0, name="ACE Compressor", enabled=True, parameters=[], track_id=track_index)]
+            return []
+
+        mock_listener = Mock()
+        mock_listener.discover_plugins.side_effect = discover_plugins
+        mock_get_osc_listener.return_value = mock_listener
+
+        start = time.time()
+        response = client.get("/plugins/discovery/scan")
+        elapsed = time.time() - start
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_tracks"] == 4
+        assert data["total_plugins"] == 4
+        assert data["plugin_types"] == {"compressor": 4}
+        assert sorted(data["tracks"]) == ["2", "4", "6", "8"]
+        assert mock_listener.discover_plugins.call_count == 8
+        # Eight sequential discoveries would take at least 1.6s
+        assert elapsed < 1.0
+
+    @patch('mcp_server.api.plugins.get_osc_client')
+    @patch('mcp_server.api.plugins.get_osc_listener')
+    def test_list_track_plugins_uses_cache_until_invalidated(self, mock_get_osc_listener, mock_get_osc_client):
+        """Test that repeated listings reuse discovery until the plugin changes"""
+        mock_listener = Mock()
+        mock_listener.discover_plugins.return_value = [
+            PluginInfo(id=0, name="ACE EQ", enabled=True, parameters=[], track_id=0)
+        ]
+        mock_get_osc_listener.return_value = mock_listener
+        mock_osc_client = Mock()
+        mock_osc_client.set_plugin_activate.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        assert client.get("/plugins/track/1/plugins").json()["count"] == 1
+        assert client.get("/plugins/track/1/plugins").json()["count"] == 1
+        assert mock_listener.discover_plugins.call_count == 1
+
+        response = client.post("/plugins/track/1/plugin/0/bypass")
+        assert response.status_code == 200
+
+        client.get("/plugins/track/1/plugins")
+        assert mock_listener.discover_plugins.call_count == 2
+
+    @patch('mcp_server.api.plugins.get_osc_listener')
+    def test_scan_all_plugins_includes_parameters(self, mock_get_osc_listener):
+        """Test that the scan can attach each plugin's parameters"""
+        mock_listener = Mock()
+        mock_listener.discover_plugins.side_effect = lambda track_index, timeout=3.0: (
+            [PluginInfo(id=0, name="ACE EQ", enabled=True, parameters=[], track_id=0)] if track_index == 0 else []
+        )
+        mock_listener.discover_plugin_parameters.return_value = [
+            PluginParameter(id=1, name="Gain", value=0.5, min_value=0.0, max_value=1.0,
+                            unit="dB", type="gain", controllable=True)
+        ]
+        mock_get_osc_listener.return_value = mock_listener
+
+        response = client.get("/plugins/discovery/scan")
+        assert "parameters" not in response.json()["tracks"]["1"][0]
+        mock_listener.discover_plugin_parameters.assert_not_called()
+
+        response = client.get("/plugins/discovery/scan?include_parameters=true")
+        assert response.status_code == 200
+        parameters = response.json()["tracks"]["1"][0]["parameters"]
+        assert [p["name"] for p in parameters] == ["Gain"]
+        mock_listener.discover_plugin_parameters.assert_called_once_with(0, 0, timeout=3.0)
+
+    @patch('mcp_server.api.plugins.get_osc_client')
+    def test_bypass_plugin_errors(self, mock_get_osc_client):
+        """Test that failures keep their detail and unexpected errors become 500s"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_plugin_activate.return_value = False
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/plugins/track/1/plugin/0/bypass")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to bypass plugin for track 1 plugin 0"
+
+        mock_get_osc_client.side_effect = OSError("OSC connection error")
+        response = client.post("/plugins/track/1/plugin/0/bypass")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Internal server error: OSC connection error"
+
+        # Unexpected errors fall through to the app-wide handler
+        mock_get_osc_client.side_effect = RuntimeError("bug")
+        response = TestClient(app, raise_server_exceptions=False).post("/plugins/track/1/plugin/0/bypass")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Internal server error"
+
+    @patch('mcp_server.api.plugins.get_osc_listener')
+    def test_scan_all_plugins_not_modified(self, mock_get_osc_listener):
+        """Test that an unchanged scan answers If-None-Match with 304"""
+        mock_listener = Mock()
+        mock_listener.discover_plugins.side_effect = lambda track_index, timeout=3.0: (
+            [PluginInfo(id=0, name="ACE EQ", enabled=True, parameters=[], track_id=0)] if track_index == 0 else []
+        )
+        mock_get_osc_listener.return_value = mock_listener
+
+        response = client.get("/plugins/discovery/scan")
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = client.get("/plugins/discovery/scan", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+
+    @patch('mcp_server.api.plugins.get_osc_client')
+    def test_set_plugin_parameters_sends_one_bundle(self, mock_get_osc_client):
+        """Test that a batch of parameters is sent in a single call"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_plugin_parameters.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post(
+            "/plugins/track/1/plugin/0/parameters",
+            json={"threshold": {"db": -20.0}, "ratio": {"ratio": 4.0}}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 2
+        assert set(data["parameters"]) == {"threshold", "ratio"}
+        mock_osc_client.set_plugin_parameters.assert_called_once()
+        track_index, plugin_id, values = mock_osc_client.set_plugin_parameters.call_args[0]
+        assert (track_index, plugin_id) == (0, 0)
+        assert set(values) == {1, 2}
+
+    @patch('mcp_server.api.plugins.get_osc_listener')
+    def test_list_track_plugins_prefetches_parameters(self, mock_get_osc_listener):
+        """Test that listing a track warms the parameter cache for its plugins"""
+        mock_listener = Mock()
+        mock_listener.discover_plugins.return_value = [
+            PluginInfo(id=0, name="ACE EQ", enabled=True, parameters=[], track_id=0)
+        ]
+        mock_listener.discover_plugin_parameters.return_value = [
+            PluginParameter(id=1, name="Gain", value=0.5, min_value=0.0, max_value=1.0,
+                            unit="dB", type="gain", controllable=True)
+        ]
+        mock_listener.get_all_tracks.return_value = {}
+        mock_get_osc_listener.return_value = mock_listener
+
+        assert client.get("/plugins/track/1/plugins").status_code == 200
+        deadline = time.time() + 2.0
+        while (0, 0) not in plugins._discovery_cache and time.time() < deadline:
+            time.sleep(0.01)
+
+        response = client.get("/plugins/track/1/plugin/0/parameters")
+        assert response.status_code == 200
+        assert response.json()["count"] == 1
+        mock_listener.discover_plugin_parameters.assert_called_once_with(0, 0, timeout=3.0)
+
+    @patch('mcp_server.api.plugins.get_osc_client')
+    def test_get_plugin_info_uses_discovered_plugin(self, mock_get_osc_client):
+        """Test that plugin info reports what discovery found for the track"""
+        mock_osc_client = Mock()
+        mock_osc_client.get_plugin_info.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        plugins._store_discovery((0, -1), [
+            PluginInfo(id=2, name="ACE Reverb", enabled=False, parameters=[], track_id=0)
+        ])
+
+        data = client.get("/plugins/track/1/plugin/2/info").json()
+        assert data["name"] == "ACE Reverb"
+        assert data["type"] == "reverb"
+        assert data["active"] is False
+        assert data["capabilities"] == ["parameter_control", "bypass", "automation"]
+
+    def test_discovery_invalidated_mid_flight_is_not_cached(self):
+        """Test that a write during discovery keeps the stale result out of the cache"""
+        parameters = [
+            PluginParameter(id=1, name="Gain", value=0.5, min_value=0.0, max_value=1.0,
+                            unit="dB", type="gain", controllable=True)
+        ]
+
+        def discover_plugin_parameters(track_index, plugin_id, timeout=3.0):
+            plugins.invalidate_discovery_cache(track_index, plugin_id)
+            return parameters
+
+        mock_listener = Mock()
+        mock_listener.discover_plugin_parameters.side_effect = discover_plugin_parameters
+
+        assert plugins._discover_parameters_cached(mock_listener, 0, 3, 3.0) == parameters
+        assert (0, 3) not in plugins._discovery_cache
+
+        mock_listener.discover_plugin_parameters.side_effect = None
+        mock_listener.discover_plugin_parameters.return_value = parameters
+        plugins._discover_parameters_cached(mock_listener, 0, 3, 3.0)
+        assert (0, 3) in plugins._discovery_cache
+
+    @patch('mcp_server.api.plugins.get_osc_listener')
+    def test_discovery_runs_off_the_event_loop(self, mock_get_osc_listener):
+        """Test that the blocking discovery wait never runs on the event loop thread"""
+        import asyncio
+
+        def off_loop(result):
+            def discover(*args, **kwargs):
+                with pytest.raises(RuntimeError):
+                    asyncio.get_running_loop()
+                return result
+            return discover
+
+        mock_listener = Mock()
+        mock_listener.discover_plugins.side_effect = off_loop([
+            PluginInfo(id=0, name="ACE EQ", enabled=True, parameters=[], track_id=1)
+        ])
+        mock_listener.discover_plugin_parameters.side_effect = off_loop([
+            PluginParameter(id=1, name="Gain", value=0.5, min_value=0.0, max_value=1.0,
+                            unit="dB", type="gain", controllable=True)
+        ])
+        mock_listener.get_all_tracks.return_value = {}
+        mock_get_osc_listener.return_value = mock_listener
+
+        assert client.get("/plugins/track/2/plugin/0/parameters").status_code == 200
+        assert client.get("/plugins/track/2/plugins").status_code == 200
+        mock_listener.discover_plugin_parameters.assert_called_once()
+
+    def test_parameters_wait_for_in_flight_prefetch(self):
+        """Test that asking for parameters mid-prefetch reuses the prefetch instead of rediscovering"""
+        import asyncio
+        import threading
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def discover_plugin_parameters(track_index, plugin_id, timeout=3.0):
+            started.set()
+            release.wait(2.0)
+            return [
+                PluginParameter(id=1, name="Gain", value=0.5, min_value=0.0, max_value=1.0,
+                                unit="dB", type="gain", controllable=True)
+            ]
+
+        mock_listener = Mock()
+        mock_listener.discover_plugin_parameters.side_effect = discover_plugin_parameters
+
+        async def prefetch_then_request():
+            plugins._prefetch_parameters(mock_listener, 0, [0])
+            assert await asyncio.to_thread(started.wait, 2.0)
+            request = asyncio.create_task(asyncio.to_thread(
+                plugins._discover_parameters_after_prefetch, mock_listener, 0, 0, 5.0
+            ))
+            await asyncio.sleep(0.1)
+            release.set()
+            return await request
+
+        assert len(asyncio.run(prefetch_then_request())) == 1
+        mock_listener.discover_plugin_parameters.assert_called_once_with(0, 0, timeout=3.0)
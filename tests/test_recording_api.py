@@ -0,0 +1,74 @@
+"""
+Unit tests for recording API endpoints
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock, AsyncMock
+from mcp_server.main import app
+
+client = TestClient(app)
+
+class TestRecordingAPI:
+    """Test cases for recording API endpoints"""
+    
+    @patch('mcp_server.api.recording.get_osc_client')
+    def test_set_recording_enable_success(self, mock_get_osc_client):
+        """Test successful global recording enable"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_recording_enable_async = AsyncMock(return_value=True)
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/recording/enable", json={"enabled": True})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "success"
+        assert data["action"] == "set_recording_enable"
+        assert data["enabled"] == True
+        assert data["message"] == "Global recording enabled"
+        assert data["osc_address"] == "/rec_enable_toggle"
+        mock_osc_client.set_recording_enable_async.assert_awaited_once_with(True)
+    
+    @patch('mcp_server.api.recording.get_osc_client')
+    def test_set_punch_in_failure(self, mock_get_osc_client):
+        """Test punch-in failure"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_punch_in_async = AsyncMock(return_value=False)
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/recording/punch-in", json={"enabled": False})
+        
+        assert response.status_code == 500
+        assert "Failed to set punch-in recording" in response.json()["detail"]
+    
+    @patch('mcp_server.api.recording.get_osc_client')
+    def test_start_recording_success(self, mock_get_osc_client):
+        """Test successful recording start"""
+        mock_osc_client = Mock()
+        mock_osc_client.start_recording_async = AsyncMock(return_value=True)
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/recording/start")
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["action"] == "start_recording"
+        assert data["osc_commands"] == ["/rec_enable_toggle", "/transport_play"]
+        mock_osc_client.start_recording_async.assert_awaited_once()
+        mock_osc_client.transport_play.assert_not_called()
+    
+    @patch('mcp_server.api.recording.get_osc_client')
+    def test_get_recording_status_exception(self, mock_get_osc_client):
+        """Test recording status with exception"""
+        mock_get_osc_client.side_effect = Exception("OSC connection error")
+        
+        response = client.get("/recording/status")
+        
+        assert response.status_code == 500
+        assert "Internal server error" in response.json()["detail"]
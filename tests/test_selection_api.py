@@ -0,0 +1,297 @@
+"""
+Unit tests for selection API endpoints
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+from mcp_server.main import app
+from mcp_server.selection_manager import SelectionManager
+
+client = TestClient(app)
+
+class TestSelectionAPI:
+    """Test cases for selection API endpoints"""
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_set_group_state(self, mock_get_osc_client):
+        """Test that group state endpoints forward the state to their OSC address"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_packet.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/group/mute", json={"state": 1})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "action": "set_group_mute",
+            "state": 1,
+            "message": "Group mute sharing set to 1",
+            "osc_address": "/select/group/mute"
+        }
+        packet = mock_osc_client.queue_packet.call_args[0][0]
+        assert (packet.address, packet.params) == ("/select/group/mute", [1])
+
+        # The state is a flag: true/false are accepted, other integers are not
+        response = client.post("/selection/group/mute", json={"state": False})
+        assert response.json()["state"] == 0
+        assert client.post("/selection/group/mute", json={"state": 2}).status_code == 422
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_set_boolean_control(self, mock_get_osc_client):
+        """Test that on/off strip controls send 1/0 and report the new state"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_packet.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/monitor_input", json={"enabled": False})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["action"] == "set_monitor_input"
+        assert data["enabled"] == False
+        assert data["message"] == "Monitor mode set to auto for selected strip"
+        packet = mock_osc_client.queue_packet.call_args[0][0]
+        assert (packet.address, packet.params) == ("/select/monitor_input", [0])
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_set_boolean_control_failure(self, mock_get_osc_client):
+        """Test that a failed OSC send is reported as a 500"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_packet.return_value = False
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/solo", json={"enabled": True})
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Failed to send OSC message", "status_code": 500}
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_set_gain_osc_error(self, mock_get_osc_client):
+        """Test that OSC errors surface as a 500 with their message"""
+        mock_get_osc_client.side_effect = OSError("OSC connection error")
+
+        response = client.post("/selection/gain", json={"gain_db": -6.0})
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Internal server error: OSC connection error"
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_prefer_return_minimal(self, mock_get_osc_client):
+        """Test that clients sending Prefer: return=minimal get an empty 204"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_float.return_value = True
+        mock_osc_client.queue_packet.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        headers = {"Prefer": "return=minimal"}
+        response = client.post("/selection/fader", json={"position": 0.5}, headers=headers)
+        assert response.status_code == 204
+        assert response.content == b""
+        mock_osc_client.queue_float.assert_called_once_with("/select/fader", 0.5)
+
+        response = client.post("/selection/mute", json={"enabled": True}, headers=headers)
+        assert response.status_code == 204
+        assert response.content == b""
+
+        assert client.post("/selection/fader", json={"position": 0.5}).json()["position"] == 0.5
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_pan_operations_share_one_route(self, mock_get_osc_client):
+        """Test that each pan path sends its own OSC address through the shared pan route"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_float.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/pan_stereo_width", json={"position": 0.25})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "action": "set_pan_stereo_width",
+            "width": 0.25,
+            "message": "Pan width set to 0.25 for selected strip",
+            "osc_address": "/select/pan_stereo_width"
+        }
+        mock_osc_client.queue_float.assert_called_once_with("/select/pan_stereo_width", 0.25)
+        assert app.openapi()["paths"]["/selection/pan_lfe_control"]["post"]["operationId"] == "set_pan_lfe_control"
+
+        response = client.post("/selection/pan_lfe_control", json={"position": 0.5})
+        assert response.json()["value"] == 0.5
+        assert "position" not in response.json()
+        response = client.post("/selection/pan_stereo_position", json={"position": 0.5})
+        assert response.json()["position"] == 0.5
+
+    def test_set_gain_out_of_range(self):
+        """Test that dB ranges are validated by the request models with a 422"""
+        response = client.post("/selection/gain", json={"gain_db": 12.0})
+
+        assert response.status_code == 422
+        assert client.post("/selection/trim", json={"trim_db": -30.0}).status_code == 422
+        assert client.post("/selection/send_gain", json={"send_id": 0, "gain_db": 7.0}).status_code == 422
+        request_body = app.openapi()["paths"]["/selection/gain"]["post"]["requestBody"]
+        schema = request_body["content"]["application/json"]["schema"]["properties"]["gain_db"]
+        assert (schema["minimum"], schema["maximum"]) == (-193, 6)
+
+    def test_set_boolean_control_invalid_body(self):
+        """Test that bodies parsed straight from JSON still fail validation with a 422"""
+        response = client.post("/selection/mute", json={"enabled": "maybe"})
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"] == ["body", "enabled"]
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_dispatch_route_only_matches_known_operations(self, mock_get_osc_client):
+        """Test that the dispatch route leaves other selection paths to their own routes"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_message.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/group", json={"group_name": "Drums"})
+        assert response.status_code == 200
+        assert response.json()["action"] == "set_strip_group"
+        mock_osc_client.queue_packet.assert_not_called()
+
+        assert client.post("/selection/unknown", json={"enabled": True}).status_code == 404
+
+    @patch('mcp_server.api.selection.get_selection_manager')
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_select_strip_with_expand_sends_one_bundle(self, mock_get_osc_client, mock_get_selection_manager):
+        """Test that selecting and expanding a strip goes out as a single bundle"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_packet.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        mock_selection_manager = Mock()
+        mock_get_selection_manager.return_value = mock_selection_manager
+
+        response = client.post("/selection/strip/select", json={"strip_id": 3, "expand": True})
+
+        assert response.status_code == 200
+        assert response.json()["expanded"] == True
+        bundle = mock_osc_client.queue_packet.call_args[0][0]
+        assert [(m.address, m.params) for m in bundle] == [
+            ("/strip/select", [3, 1]),
+            ("/strip/expand", [3, 1])
+        ]
+        mock_osc_client.queue_message.assert_not_called()
+        mock_selection_manager.expand_strip.assert_called_once_with(3, True)
+
+    @patch('mcp_server.api.selection.get_selection_manager')
+    def test_get_current_selection_tracks_changes(self, mock_get_selection_manager):
+        """Test that the cached selection snapshot is refreshed after each change"""
+        manager = SelectionManager()
+        mock_get_selection_manager.return_value = manager
+
+        data = client.get("/selection/current").json()
+        assert data["status"] == "success"
+        assert data["selection"]["strip_id"] is None
+
+        manager.select_strip(4, force_gui_selection=True)
+        assert client.get("/selection/current").json()["selection"]["strip_id"] == 4
+
+        # Moving the plugin selection re-enters the manager's lock
+        assert manager.select_plugin_delta(2) == True
+        assert client.get("/selection/current").json()["selection"]["plugin_id"] == 2
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_parameterless_endpoint_called_directly(self, mock_get_osc_client):
+        """Test that endpoints without parameters still send OSC and report failures"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_message.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/spill")
+        assert response.status_code == 200
+        assert response.json()["action"] == "spill_strips"
+        mock_osc_client.queue_message.assert_called_once_with("/select/spill")
+
+        mock_osc_client.queue_message.return_value = False
+        response = client.post("/selection/spill")
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to send OSC message"
+
+    def test_generated_routes_keep_operation_ids(self):
+        """Test that table-driven routes keep their MCP operation ids"""
+        operation_ids = {
+            operation["operationId"]
+            for path in app.openapi()["paths"].values()
+            for operation in path.values()
+        }
+        assert {"set_group_enable", "set_group_monitoring", "set_recenable", "set_polarity"} <= operation_ids
+
+        request_body = app.openapi()["paths"]["/selection/mute"]["post"]["requestBody"]
+        assert request_body["content"]["application/json"]["schema"]["required"] == ["enabled"]
+
+    @patch('mcp_server.api.selection.get_selection_manager')
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_select_plugin_reports_new_plugin(self, mock_get_osc_client, mock_get_selection_manager):
+        """Test that plugin navigation returns the plugin selected by this request"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_message.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        manager = SelectionManager()
+        manager.select_strip(1)
+        mock_get_selection_manager.return_value = manager
+
+        assert client.post("/selection/plugin", json={"delta": 2}).json()["current_plugin"] == 2
+        assert client.post("/selection/plugin", json={"delta": -5}).json()["current_plugin"] == 0
+        mock_osc_client.queue_message.assert_called_with("/select/plugin", -5)
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_static_responses(self, mock_get_osc_client):
+        """Test that pre-encoded responses are served as JSON without touching OSC when ignored"""
+        mock_osc_client = Mock()
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/plugin_page", json={"direction": 0})
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"status": "ignored", "message": "Direction=0 is ignored"}
+        mock_osc_client.queue_message.assert_not_called()
+
+        response = client.delete("/selection/clear")
+        assert response.json() == {"status": "success", "action": "clear_selection", "message": "Selection cleared"}
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_set_send_gain_still_served(self, mock_get_osc_client):
+        """Test that the selected-strip send gain endpoint used by the MCP client still answers"""
+        mock_osc_client = Mock()
+        mock_osc_client.queue_int_float.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+
+        response = client.post("/selection/send_gain", json={"send_id": 1, "gain_db": -6.0})
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "action": "set_send_gain",
+            "osc_address": "/select/send_gain",
+            "send_id": 1,
+            "gain_db": -6.0,
+            "message": "Send 1 gain set to -6.0dB for selected strip"
+        }
+        mock_osc_client.queue_int_float.assert_called_once_with("/select/send_gain", 1, -6.0)
+        assert app.openapi()["paths"]["/selection/send_gain"]["post"]["operationId"] == "set_send_gain"
+
+    @patch('mcp_server.api.selection.get_osc_client')
+    def test_schema_routes_serve_requests(self, mock_get_osc_client):
+        """Test that the documented operation routes behave like the dispatch route if mounted"""
+        from fastapi import FastAPI
+        from mcp_server.api import selection
+        mock_osc_client = Mock()
+        mock_osc_client.queue_packet.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        schema_app = FastAPI()
+        schema_app.include_router(selection.schema_router)
+
+        response = TestClient(schema_app).post("/selection/mute", json={"enabled": True})
+
+        assert response.status_code == 200
+        assert response.json()["action"] == "set_mute"
+        packet = mock_osc_client.queue_packet.call_args[0][0]
+        assert (packet.address, packet.params) == ("/select/mute", [1])
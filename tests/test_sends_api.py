@@ -0,0 +1,107 @@
+"""
+Unit tests for send API endpoints
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+from mcp_server.main import app
+from mcp_server.api import sends
+
+client = TestClient(app)
+
+class TestSendsAPI:
+    """Test cases for send API endpoints"""
+    
+    def setup_method(self):
+        """Forget send list requests made by other tests"""
+        sends._send_list_requested.clear()
+    
+    @patch('mcp_server.api.sends.get_osc_client')
+    def test_set_send_level_success(self, mock_get_osc_client):
+        """Test that the send level control reaches the send's fader"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_send_level.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/sends/track/2/send/1/level", json={"level": 0.5})
+        
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "action": "set_send_level",
+            "track": 2,
+            "send": 1,
+            "level": 0.5,
+            "message": "Send 1 level set to 0.50 for track 2",
+            "osc_address": "/strip/2/send/0/fader"
+        }
+        mock_osc_client.set_send_level.assert_called_once_with(2, 0, 0.5)
+    
+    @patch('mcp_server.api.sends.get_osc_client')
+    def test_set_send_enable_failure(self, mock_get_osc_client):
+        """Test that a failed send is reported as a 500 naming the control"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_send_enable.return_value = False
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/sends/track/1/send/3/enable", json={"enabled": False})
+        
+        assert response.status_code == 500
+        assert response.json() == {"detail": "Failed to set send enable for track 1 send 3", "status_code": 500}
+        mock_osc_client.set_send_enable.assert_called_once_with(1, 2, False)
+    
+    def test_send_controls_validate_body_and_path(self):
+        """Test that body and path validation still answer with a 422"""
+        assert client.post("/sends/track/1/send/1/gain", json={"gain_db": 12.0}).status_code == 422
+        assert client.post("/sends/track/0/send/1/gain", json={"gain_db": 0.0}).status_code == 422
+        assert client.post("/sends/track/1/send/1/mute", json={"enabled": True}).status_code == 404
+    
+    def test_send_controls_keep_operation_ids(self):
+        """Test that the shared send route keeps each control's MCP operation and schema"""
+        paths = app.openapi()["paths"]
+        operation = paths["/sends/track/{track_number}/send/{send_number}/gain"]["post"]
+        assert operation["operationId"] == "set_send_gain"
+        assert [p["name"] for p in operation["parameters"]][:2] == ["track_number", "send_number"]
+        assert "requestBody" in operation
+    
+    @patch('mcp_server.api.sends.get_osc_client')
+    def test_list_track_sends_skips_repeat_within_ttl(self, mock_get_osc_client):
+        """Test that polling a track's send list asks Ardour once per TTL"""
+        mock_osc_client = Mock()
+        mock_osc_client.list_track_sends.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        first = client.get("/sends/track/4/sends")
+        second = client.get("/sends/track/4/sends")
+        client.get("/sends/track/5/sends")
+        
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert [c.args for c in mock_osc_client.list_track_sends.call_args_list] == [(3,), (4,)]
+        
+        # Failed requests are not remembered, so the next poll retries
+        mock_osc_client.list_track_sends.return_value = False
+        assert client.get("/sends/track/6/sends").status_code == 500
+        assert client.get("/sends/track/6/sends").status_code == 500
+    
+    @patch('mcp_server.api.sends.get_osc_client')
+    def test_schema_routes_serve_requests(self, mock_get_osc_client):
+        """Test that the documented send routes behave like the send control route if mounted"""
+        from fastapi import FastAPI
+        mock_osc_client = Mock()
+        mock_osc_client.set_send_gain.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        schema_app = FastAPI()
+        schema_app.include_router(sends.schema_router)
+        
+        response = TestClient(schema_app).post("/sends/track/1/send/2/gain", json={"gain_db": -3.0})
+        
+        assert response.status_code == 200
+        assert response.json()["action"] == "set_send_gain"
+        mock_osc_client.set_send_gain.assert_called_once_with(1, 1, -3.0)
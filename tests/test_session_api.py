@@ -0,0 +1,45 @@
+"""
+Unit tests for session API endpoints
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+from mcp_server.main import app
+
+client = TestClient(app)
+
+class TestSessionAPI:
+    """Test cases for session API endpoints"""
+    
+    @patch('mcp_server.api.session.get_osc_client')
+    def test_create_snapshot_variants(self, mock_get_osc_client):
+        """Test that each snapshot mode reports its own Ardour action"""
+        mock_osc_client = Mock()
+        mock_osc_client.create_snapshot.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        stay = client.post("/session/snapshot", json={"switch_to_new": False}).json()
+        switch = client.post("/session/snapshot", json={"switch_to_new": True}).json()
+        
+        assert (stay["switch_to_new"], stay["osc_args"]) == (False, "Main/QuickSnapshotStay")
+        assert stay["message"] == "Session snapshot created (staying on current)"
+        assert (switch["switch_to_new"], switch["osc_args"]) == (True, "Main/QuickSnapshotSwitch")
+        assert switch["message"] == "Session snapshot created (switching to new)"
+    
+    @patch('mcp_server.api.session.get_osc_client')
+    def test_save_session_failure(self, mock_get_osc_client):
+        """Test that a failed save is reported as a 500 with its own message"""
+        mock_osc_client = Mock()
+        mock_osc_client.save_session.return_value = False
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/session/save")
+        
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to save session"
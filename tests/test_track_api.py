@@ -0,0 +1,104 @@
+"""
+Unit tests for track API endpoints
+"""
+
+import sys
+import os
+# Add the parent directory to Python path so we can import mcp_server
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch, Mock
+from mcp_server.main import app
+
+client = TestClient(app)
+
+class TestTrackAPI:
+    """Test cases for track API endpoints"""
+    
+    @patch('mcp_server.api.track.get_osc_client')
+    def test_batch_sends_one_bundle(self, mock_get_osc_client):
+        """Test that a batch of track changes goes out as a single OSC bundle"""
+        mock_osc_client = Mock()
+        mock_osc_client.send_bundle.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/track/batch", json={"operations": [
+            {"track": 1, "op": "fader", "value": -6},
+            {"track": 2, "op": "mute", "value": True},
+            {"track": 2, "op": "pan", "value": -0.5},
+            {"track": 3, "op": "name", "value": "Kick"}
+        ]})
+        
+        assert response.status_code == 200
+        data = response.json()
+        assert data["count"] == 4
+        assert data["operations"][1] == {"track": 2, "op": "mute", "value": True, "osc_address": "/strip/1/mute"}
+        mock_osc_client.send_bundle.assert_called_once_with([
+            ("/strip/0/gain", (-6.0,)),
+            ("/strip/1/mute", (1,)),
+            ("/strip/1/pan_stereo_position", (-0.5,)),
+            ("/strip/2/name", ("Kick",))
+        ])
+    
+    @patch('mcp_server.api.track.get_osc_client')
+    def test_batch_validates_every_operation(self, mock_get_osc_client):
+        """Test that one invalid change rejects the whole batch with the single-track limits"""
+        mock_osc_client = Mock()
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/track/batch", json={"operations": [
+            {"track": 1, "op": "fader", "value": -6.0},
+            {"track": 2, "op": "pan", "value": 3.0}
+        ]})
+        
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][:3] == ["body", "operations", 1]
+        assert client.post("/track/batch", json={"operations": []}).status_code == 422
+        assert client.post("/track/batch", json={"operations": [{"track": 1, "op": "gain", "value": 0}]}).status_code == 422
+        mock_osc_client.send_bundle.assert_not_called()
+    
+    @patch('mcp_server.api.track.get_osc_client')
+    def test_batch_send_failure(self, mock_get_osc_client):
+        """Test that a failed bundle send is reported as a 500"""
+        mock_osc_client = Mock()
+        mock_osc_client.send_bundle.return_value = False
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/track/batch", json={"operations": [{"track": 1, "op": "solo", "value": False}]})
+        
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to apply 1 track changes"
+    
+    @patch('mcp_server.api.track.get_osc_client')
+    def test_set_mute_success(self, mock_get_osc_client):
+        """Test that muting a track reports the strip's OSC address"""
+        mock_osc_client = Mock()
+        mock_osc_client.strip_mute.return_value = True
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/track/256/mute", json={"mute": True})
+        
+        assert response.status_code == 200
+        assert response.json() == {
+            "status": "success",
+            "action": "set_mute",
+            "track": 256,
+            "mute": True,
+            "message": "Track 256 muted",
+            "osc_address": "/strip/255/mute"
+        }
+        mock_osc_client.strip_mute.assert_called_once_with(256, True)
+    
+    @patch('mcp_server.api.track.get_osc_client')
+    def test_set_fader_failure(self, mock_get_osc_client):
+        """Test that a failed fader send is reported as a 500 naming the track"""
+        mock_osc_client = Mock()
+        mock_osc_client.set_strip_gain.return_value = False
+        mock_get_osc_client.return_value = mock_osc_client
+        
+        response = client.post("/track/2/fader", json={"gain_db": -3.0})
+        
+        assert response.status_code == 500
+        assert response.json()["detail"] == "Failed to set fader for track 2"